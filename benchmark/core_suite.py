@@ -0,0 +1,138 @@
+"""
+Benchmark suite of the core algorithms on a synthetic catalog (see synthetic_catalog.py). It runs fully offline, no database is needed.
+Every case report the best time of several runs and the peak memory of one run measured with tracemalloc:
+- level_measure = toolbox.level_measure on all_table and relation, for every chosen engine
+- metadata_partition = splitting every metadata per table, as done by ddl_transfer
+- ddl_mapper (dataframe) = ddl_mapper.mysql.mysql for every table, with the dataframe of every table
+- ddl_mapper (record) = ddl_mapper.mysql.mysql for every table, with the records of every table (see metadata_record)
+The result can be saved as a json file, so the result of two commits can be compared.
+
+Usage:
+    python benchmark/core_suite.py [--tables 10000] [--columns 10] [--fan-out 1] [--fan-in N] [--chain-depth N] [--cycles 0] [--engine graph pandas] [--repeat 3] [--seed 0] [--output result.json]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from module.ddl_mapper.mysql import mysql
+from module.metadata_record import record_class_dict
+from module.toolbox import level_measure, metadata_partition
+from synthetic_catalog import synthetic_catalog
+
+metadata_name_list: list[str] = ["column_rule", "primary_key", "relation", "unique_constraint", "check_constraint", "all_index"]
+
+
+def case_measure(function: object, repeat: int = 3) -> tuple[float, int]:
+    """
+    Measure a benchmark case. The time is measured without tracemalloc (it slows every allocation), then the peak memory is measured on one more run.
+
+    Args:
+        - function (function): the case, a function without argument
+        - repeat (integer): total of timed run
+
+    Returns:
+        best_time (float): the fastest run in second
+        peak_memory (integer): the peak of memory allocated by the case in byte
+    """
+    time_list: list[float] = []
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        start_time: float = perf_counter()
+        function()
+        time_list.append(perf_counter() - start_time)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(time_list), peak_memory
+
+def record_catalog(metadata_dict: dict) -> dict:
+    """
+    Change the metadata of the synthetic catalog into records, the same way as metadata_get.mysql.<function>(output = "record").
+
+    Args:
+        - metadata_dict (dictionary): result of synthetic_catalog()
+
+    Returns:
+        record_dict (dictionary): records of every metadata at metadata_name_list, with the metadata name as key
+    """
+    record_dict: dict = {}
+    for metadata_name in metadata_name_list:
+        record_class = record_class_dict[metadata_name]
+        data = metadata_dict[metadata_name]
+        record_dict[metadata_name] = [record_class(*row) for row in data[list(record_class.__slots__)].itertuples(index = False, name = None)]
+    return record_dict
+
+def mapper_run(partition_dict: dict, empty_dict: dict, table_list: list[str]) -> None:
+    for table in table_list:
+        mysql(**{metadata_name: partition_dict[metadata_name].get(table, empty_dict[metadata_name]) for metadata_name in metadata_name_list})
+
+def suite_run(argument: argparse.Namespace) -> list[dict]:
+    """
+    Run every case of the suite.
+
+    Args:
+        - argument (Namespace): parsed command line argument
+
+    Returns:
+        result_list (list): name, time and peak memory of every case
+    """
+    metadata_dict: dict = synthetic_catalog(table_count = argument.tables, column_count = argument.columns, seed = argument.seed, fan_out = argument.fan_out, fan_in = argument.fan_in, chain_depth = argument.chain_depth, cycle_count = argument.cycles)
+    record_dict: dict = record_catalog(metadata_dict)
+    # NOTE: the mapper only create the ddl of a table that have at least one column
+    table_list: list[str] = list(metadata_partition(metadata_dict["column_rule"]).keys())
+    frame_partition: dict = {metadata_name: metadata_partition(metadata_dict[metadata_name]) for metadata_name in metadata_name_list}
+    frame_empty: dict = {metadata_name: metadata_dict[metadata_name].iloc[0:0] for metadata_name in metadata_name_list}
+    record_partition: dict = {metadata_name: metadata_partition(record_dict[metadata_name]) for metadata_name in metadata_name_list}
+    record_empty: dict = {metadata_name: [] for metadata_name in metadata_name_list}
+    print(f"synthetic catalog: {argument.tables} tables, {len(metadata_dict['column_rule'])} columns, {len(metadata_dict['relation'])} relation columns")
+    case_list: list[tuple[str, object]] = []
+    for engine in argument.engine:
+        if engine == "pandas" and argument.cycles != 0:
+            # NOTE: the pandas engine stop with an error on any relation cycle
+            print("- level_measure (pandas): skipped, the pandas engine does not support relation cycle")
+            continue
+        case_list.append((f"level_measure ({engine})", lambda engine = engine: level_measure(metadata_dict["all_table"], metadata_dict["relation"], engine = engine)))
+    case_list.append(("metadata_partition (dataframe)", lambda: [metadata_partition(metadata_dict[metadata_name]) for metadata_name in metadata_name_list]))
+    case_list.append(("metadata_partition (record)", lambda: [metadata_partition(record_dict[metadata_name]) for metadata_name in metadata_name_list]))
+    case_list.append(("ddl_mapper.mysql.mysql (dataframe)", lambda: mapper_run(frame_partition, frame_empty, table_list)))
+    case_list.append(("ddl_mapper.mysql.mysql (record)", lambda: mapper_run(record_partition, record_empty, table_list)))
+    result_list: list[dict] = []
+    for name, function in case_list:
+        best_time, peak_memory = case_measure(function, argument.repeat)
+        result_list.append({"case": name, "time": best_time, "peak_memory": peak_memory})
+        print(f"- {name}: {best_time:.3f} s, peak {peak_memory / 1048576:.1f} MiB")
+    return result_list
+
+def main():
+    parser = argparse.ArgumentParser(description = "Benchmark suite of level_measure, metadata_partition and ddl_mapper on a synthetic catalog.")
+    parser.add_argument("--tables", type = int, default = 10000, help = "total of table")
+    parser.add_argument("--columns", type = int, default = 10, help = "total of column for every table")
+    parser.add_argument("--fan-out", dest = "fan_out", type = int, default = 1, help = "total of parent table of every table")
+    parser.add_argument("--fan-in", dest = "fan_in", type = int, default = None, help = "maximum total of child table of a table")
+    parser.add_argument("--chain-depth", dest = "chain_depth", type = int, default = None, help = "total of table layer (longest parent to child chain)")
+    parser.add_argument("--cycles", type = int, default = 0, help = "total of relation cycle")
+    parser.add_argument("--engine", nargs = "+", choices = ["graph", "pandas"], default = ["graph"], help = "level_measure engine to measure")
+    parser.add_argument("--repeat", type = int, default = 3, help = "total of timed run of every case")
+    parser.add_argument("--seed", type = int, default = 0, help = "seed of the synthetic catalog")
+    parser.add_argument("--output", default = None, help = "json file to save the setting and the result")
+    argument = parser.parse_args()
+    result_list: list[dict] = suite_run(argument)
+    if argument.output is not None:
+        with open(argument.output, "w", encoding = "utf-8") as output_file:
+            json.dump({"setting": vars(argument), "result": result_list}, output_file, indent = 4)
+        print(f"result saved at {argument.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of splitting the metadata per table inside ddl_transfer. It compares filtering every metadata dataframe for every table with toolbox.metadata_partition.
+
+Usage:
+    python benchmark/ddl_transfer_partition.py [table_count] [column_count]
+"""
+
+import sys
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from module.toolbox import metadata_partition
+from synthetic_catalog import synthetic_catalog
+
+metadata_name_list: list[str] = ["column_rule", "primary_key", "relation", "unique_constraint", "check_constraint", "all_index"]
+
+def filter_scan(metadata_dict: dict, table_list: list[str]) -> int:
+    row_count: int = 0
+    for table in table_list:
+        for metadata_name in metadata_name_list:
+            data = metadata_dict[metadata_name]
+            row_count = row_count + len(data.loc[data['table_name'] == table])
+    return row_count
+
+def partition_lookup(metadata_dict: dict, table_list: list[str]) -> int:
+    row_count: int = 0
+    partition_dict: dict = {metadata_name: metadata_partition(metadata_dict[metadata_name]) for metadata_name in metadata_name_list}
+    empty_dict: dict = {metadata_name: metadata_dict[metadata_name].iloc[0:0] for metadata_name in metadata_name_list}
+    for table in table_list:
+        for metadata_name in metadata_name_list:
+            data = partition_dict[metadata_name].get(table, empty_dict[metadata_name])
+            row_count = row_count + len(data)
+    return row_count
+
+def main():
+    table_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    column_count: int = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    metadata_dict = synthetic_catalog(table_count = table_count, column_count = column_count)
+    table_list: list[str] = metadata_dict["all_table"]["table_name"].values.tolist()
+    print(f"synthetic catalog: {table_count} tables, {len(metadata_dict['column_rule'])} columns")
+    for name, function in [("filter per table", filter_scan), ("metadata_partition", partition_lookup)]:
+        start_time: float = perf_counter()
+        row_count: int = function(metadata_dict, table_list)
+        print(f"- {name}: {perf_counter() - start_time:.3f} s ({row_count} rows)")
+
+if __name__ == '__main__':
+    main()
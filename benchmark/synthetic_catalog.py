@@ -0,0 +1,116 @@
+"""
+Module to create synthetic metadata of a schema without any database. The dataframes follow the column of metadata_get.mysql so they can be used by level_measure, ddl_transfer and ddl_mapper.
+"""
+
+from random import Random
+import pandas
+
+
+def synthetic_relation(random: Random, table_list: list[str], column_count: int, fan_out: int = 1, fan_in: int = None, chain_depth: int = None, cycle_count: int = 0) -> list[dict]:
+    """
+    Create the relation rows of the synthetic catalog. The parameters are described at synthetic_catalog().
+
+    Returns:
+        relation (list): one dictionary for every relation column
+    """
+    table_count: int = len(table_list)
+    child_count: list[int] = [0] * table_count
+    relation: list[dict] = []
+    for number, table in enumerate(table_list):
+        if chain_depth is None:
+            start, end = 0, number
+        else:
+            # NOTE: the first table of a layer is the smallest number with number * chain_depth // table_count equal to the layer
+            layer: int = number * chain_depth // table_count
+            if layer == 0:
+                continue
+            start, end = -(-(layer - 1) * table_count // chain_depth), -(-layer * table_count // chain_depth)
+        if end <= start:
+            continue
+        if fan_out == 1 and fan_in is None:
+            # NOTE: the same random call as before, so the default setting still give the same metadata for the same seed
+            parent_list: list[int] = [random.randrange(start, end)]
+        else:
+            parent_list = []
+            candidate_list: list[int] = random.sample(range(start, end), min(end - start, fan_out * 4))
+            for parent in candidate_list:
+                if len(parent_list) == fan_out:
+                    break
+                if fan_in is None or child_count[parent] < fan_in:
+                    parent_list.append(parent)
+        for position, parent in enumerate(parent_list):
+            child_count[parent] = child_count[parent] + 1
+            column_child: str = f"column_{3 + position}" if 3 + position <= column_count else "column_3"
+            constraint_name: str = f"{table}_fk" if position == 0 else f"{table}_fk_{position + 1}"
+            relation.append({"table_name": table, "parent_table_name": table_list[parent], "column_child": column_child, "column_parent": "id", "constraint_name": constraint_name, "on_update": "NO ACTION", "on_delete": "NO ACTION"})
+    for number, row in enumerate(random.sample(relation, min(cycle_count, len(relation)))):
+        relation.append({"table_name": row["parent_table_name"], "parent_table_name": row["table_name"], "column_child": "column_3", "column_parent": "id", "constraint_name": f"{row['parent_table_name']}_cycle_{number + 1}_fk", "on_update": "NO ACTION", "on_delete": "NO ACTION"})
+    return relation
+
+def synthetic_catalog(table_count: int = 10000, column_count: int = 10, seed: int = 0, fan_out: int = 1, fan_in: int = None, chain_depth: int = None, cycle_count: int = 0) -> dict[str, pandas.DataFrame]:
+    """
+    Create synthetic metadata of a schema. Every table have an id primary key, a unique and an index on its second column, and relations to random tables created before it.
+    The default setting give one relation per table to any table created before it, the same metadata as before fan_out, fan_in, chain_depth and cycle_count were added.
+
+    Args:
+        - table_count (integer): total of table in the schema
+        - column_count (integer): total of column for every table
+        - seed (integer): seed of the random generator, the same seed always give the same metadata
+        - fan_out (integer): total of parent table of every table (fan-out of the relation graph)
+        - fan_in (integer): maximum total of child table of a table, None for no limit
+        - chain_depth (integer): total of table layer. A table only refer to the tables of the layer before it, so the longest parent to child chain have chain_depth tables. None to refer to any table created before it
+        - cycle_count (integer): total of relation cycle. Every cycle is made by adding the opposite relation of a random relation
+
+    Returns:
+        metadata_dict (dictionary): metadata with the metadata_get function name as key
+    """
+    random = Random(seed)
+    table_list: list[str] = [f"table_{number:06d}" for number in range(table_count)]
+    all_table: list[dict] = []
+    column_rule: list[dict] = []
+    primary_key: list[dict] = []
+    relation: list[dict] = []
+    unique_constraint: list[dict] = []
+    check_constraint: list[dict] = []
+    all_index: list[dict] = []
+    for number, table in enumerate(table_list):
+        all_table.append({"table_name": table, "table_comment": ""})
+        for position in range(1, column_count + 1):
+            if position == 1 or position == 3:
+                column = {"data_type": "bigint", "char_max_length": None, "char_max_size": None, "char_set": None, "char_collation": None}
+            else:
+                column = {"data_type": "varchar", "char_max_length": 255, "char_max_size": 1020, "char_set": "utf8mb4", "char_collation": "utf8mb4_0900_ai_ci"}
+            column_rule.append({
+                "table_name": table,
+                "column_name": "id" if position == 1 else f"column_{position}",
+                "ordinal_position": position,
+                "is_nullable": "NOT NULL" if position == 1 else "NULL",
+                "column_comment": "",
+                "default_value": "",
+                "data_type": column["data_type"],
+                "char_max_length": column["char_max_length"],
+                "char_max_size": column["char_max_size"],
+                "char_set": column["char_set"],
+                "char_collation": column["char_collation"],
+                "integer_type_attribute": "signed",
+                "numeric_precision": 19 if column["data_type"] == "bigint" else None,
+                "numeric_scale": 0 if column["data_type"] == "bigint" else None,
+                "datetime_precision": None,
+                "generated_column_type": "",
+                "extra": "auto_increment" if position == 1 else ""})
+        primary_key.append({"table_name": table, "column_name": "id", "constraint_name": "PRIMARY"})
+        if column_count >= 2:
+            unique_constraint.append({"table_name": table, "column_name": "column_2", "constraint_name": f"{table}_uk"})
+            check_constraint.append({"table_name": table, "constraint_name": f"{table}_ck", "constraint_expression": "(`column_2` <> '')"})
+            all_index.append({"table_name": table, "index_name": f"{table}_idx", "index_type": "BTREE", "collation": "A", "nullable": "YES", "is_unique": 1, "index_comment": "", "column_expression_cardinality": 1, "column_expression": "column_2"})
+    if column_count >= 3:
+        relation = synthetic_relation(random, table_list, column_count, fan_out, fan_in, chain_depth, cycle_count)
+    metadata_dict: dict[str, pandas.DataFrame] = {
+        "all_table": pandas.DataFrame(all_table, columns = ["table_name", "table_comment"]),
+        "column_rule": pandas.DataFrame(column_rule),
+        "primary_key": pandas.DataFrame(primary_key, columns = ["table_name", "column_name", "constraint_name"]),
+        "relation": pandas.DataFrame(relation, columns = ["table_name", "parent_table_name", "column_child", "column_parent", "constraint_name", "on_update", "on_delete"]),
+        "unique_constraint": pandas.DataFrame(unique_constraint, columns = ["table_name", "column_name", "constraint_name"]),
+        "check_constraint": pandas.DataFrame(check_constraint, columns = ["table_name", "constraint_name", "constraint_expression"]),
+        "all_index": pandas.DataFrame(all_index, columns = ["table_name", "index_name", "index_type", "collation", "nullable", "is_unique", "index_comment", "column_expression_cardinality", "column_expression"])}
+    return metadata_dict
@@ -1,7 +1,15 @@
+import sys
 import module
 
-credential_data, credential_dict = module.credential_get() 
-module.credential_check(credential_data)
-# module.credential_object_maker(credential_dict)
+if __name__ == '__main__':
+    credential_data, credential_dict = module.credential_get() 
+    module.credential_check(credential_data)
+    # module.credential_object_maker(credential_dict)
 
-module.main_runner(credential_dict)
\ No newline at end of file
+    try:
+        if len(sys.argv) > 1:
+            module.batch_runner(credential_dict, **module.batch_argument(sys.argv[1:]))
+        else:
+            module.main_runner(credential_dict)
+    finally:
+        module.engine_dispose()
\ No newline at end of file
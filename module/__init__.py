@@ -1,7 +1,19 @@
-# Importing top-level modules
-from .connection import *
-from .toolbox import *
+# Every sub module is only imported when one of its attribute is used, so importing this package does not load pandas, SQLAlchemy or the product modules
+from importlib import import_module
+from pkgutil import iter_modules
 
-# Importing the product_module
-from .metadata_get import *
-from .data_type_mapper import *
+connection_attribute: list[str] = ["connection", "credential_get", "credential_check", "credential_object_maker", "engine_get", "engine_derive", "engine_dispose"]
+
+def __getattr__(name: str) -> object:
+    if name in connection_attribute:
+        # NOTE: the connection class take the place of the connection sub module, like the previous "from .connection import *"
+        globals()[name] = getattr(import_module(".connection", __name__), name)
+        return globals()[name]
+    if name in [sub_module.name for sub_module in iter_modules(__path__)]:
+        return import_module(f".{name}", __name__)
+    # NOTE: the other attribute is taken from toolbox, the main module of this project
+    toolbox = import_module(".toolbox", __name__)
+    if hasattr(toolbox, name):
+        globals()[name] = getattr(toolbox, name)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
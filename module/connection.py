@@ -1,9 +1,19 @@
 '''
 Module to create a class from database connection credential. This module get credential from credential.csv at root folder.
+It also keep one pooled sqlalchemy engine for every credential (engine registry), so every tool and every worker check out a warm connection instead of connecting again.
 '''
+from __future__ import annotations
 from pathlib import Path
-from pandas import DataFrame
-from pandas import read_csv
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+# NOTE: default pool setting of every engine. a credential can override it with pool_size, max_overflow, pool_pre_ping or pool_recycle column at credential.csv
+pool_option: dict[str, object] = {"pool_size": 5, "max_overflow": 20, "pool_pre_ping": True, "pool_recycle": 1800}
+engine_registry: dict[tuple[str, ...], object] = {}
+engine_registry_lock = Lock()
 
 
 class connection:
@@ -41,6 +51,18 @@ class connection:
     def __eq__(self, other: object) -> bool:
         return self.__dict__ == other.__dict__
 
+    def engine(self, **option) -> object:
+        '''
+        Get the pooled sqlalchemy engine of this credential from the engine registry.
+
+        Args:
+            - option: pool setting that override pool_option (example: pool_size = 10)
+
+        Returns:
+            engine (object): sqlalchemy engine
+        '''
+        return engine_get(self.__dict__, **option)
+
 def credential_get(credential_file_path: str =  f"{str(Path(__file__).parent.parent)}\\credential.csv") -> DataFrame:
     """
     Function to get the credential data from credential.csv
@@ -52,6 +74,7 @@ def credential_get(credential_file_path: str =  f"{str(Path(__file__).parent.par
         credential_data (pandas dataframe): table containing credential to connect to database
         credential_dict (list): result of transforming credential_data into a list of data per row (each row stored as dictionary)
     """
+    from pandas import read_csv
     credential_data: DataFrame = read_csv(filepath_or_buffer = credential_file_path, sep = "|", dtype = {"port": "object"})
     credential_data: DataFrame = credential_data.fillna('')
     credential_dict: list[dict[str, str]] = credential_data.to_dict('records')
@@ -94,6 +117,67 @@ def credential_check(credential_data: DataFrame) -> None:
     else:
         print(check_string)
 
+def option_key(engine_option: dict[str, object]) -> tuple[str, ...]:
+    # NOTE: repr so an option with a dictionary value (example: connect_args) can be a part of the registry key
+    return tuple(f"{name}={value!r}" for name, value in sorted(engine_option.items()))
+
+def engine_get(credential: dict[str, str], **option) -> object:
+    """
+    Get the pooled sqlalchemy engine of a credential. The engine is created on the first call and taken from the registry on the next call, so all tools and workers share the same connection pool.
+    The pool setting is taken from pool_option, then from the pool columns of the credential (when filled), then from option. The engine is kept for every credential and pool setting, so a call with another option get its own engine instead of the engine of the first call.
+
+    Args:
+        - credential (dictionary): one credential, from credential_dict of credential_get()
+        - option: pool setting that override the others (example: pool_size = 10)
+
+    Returns:
+        engine (object): sqlalchemy engine
+    """
+    engine_option: dict[str, object] = dict(pool_option)
+    for column, default in pool_option.items():
+        value: str = str(credential.get(column, ''))
+        if value != '':
+            engine_option[column] = value.lower() in ['true', '1', 'y', 'yes'] if isinstance(default, bool) else int(float(value))
+    engine_option.update(option)
+    key: tuple[str, ...] = tuple(str(credential.get(column, '')) for column in ["product", "host", "port", "user", "password", "database", "local_environment"]) + option_key(engine_option)
+    with engine_registry_lock:
+        if key not in engine_registry:
+            import sqlalchemy
+            from .plugin import plugin_get
+            url: str = plugin_get("metadata_get", credential["product"]).url(user = credential['user'], password = credential['password'], host = credential['host'], port = credential['port'], database = credential['database'])
+            engine_registry[key] = sqlalchemy.create_engine(url, **engine_option)
+    return engine_registry[key]
+
+def engine_derive(engine: object, name: str, **option) -> object:
+    """
+    Get a pooled sqlalchemy engine with the url of another engine and its own create_engine option (example: connect_args that only a bulk loader need). The engine is created on the first call and kept at the registry, so engine_dispose() also close it.
+
+    Args:
+        - engine (object): sqlalchemy engine to take the url from
+        - name (string): name of the derived engine, every name have its own engine for every url
+        - option: create_engine option of the derived engine, it override pool_option
+
+    Returns:
+        engine (object): sqlalchemy engine
+    """
+    engine_option: dict[str, object] = dict(pool_option)
+    engine_option.update(option)
+    key: tuple[str, ...] = ("derive", name, engine.url.render_as_string(hide_password = False)) + option_key(engine_option)
+    with engine_registry_lock:
+        if key not in engine_registry:
+            import sqlalchemy
+            engine_registry[key] = sqlalchemy.create_engine(engine.url, **engine_option)
+    return engine_registry[key]
+
+def engine_dispose() -> None:
+    """
+    Close all pooled connection of every engine at the registry and empty the registry.
+    """
+    with engine_registry_lock:
+        for engine in engine_registry.values():
+            engine.dispose()
+        engine_registry.clear()
+
 def credential_object_maker(credential_dict: dict[str: str]):
     for credential in credential_dict:
         globals()[credential['name']] = connection(credential['product'], credential['host'], credential['port'], credential['user'], credential['password'], credential['database'], credential['local_environment'])
@@ -0,0 +1,8 @@
+# Bulk loader for every target product. Every product module have a load(connection, schema, table, column_list, batch_iterable, column_rule) function and it is only imported when it is selected, see module.plugin
+from importlib import import_module
+from pkgutil import iter_modules
+
+def __getattr__(name: str) -> object:
+    if name in [product.name for product in iter_modules(__path__)]:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
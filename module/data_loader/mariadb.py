@@ -0,0 +1,5 @@
+"""
+Module to load rows into MariaDB with LOAD DATA LOCAL INFILE. MariaDB use the same file format as MySQL, see data_loader.mysql
+"""
+
+from .mysql import load
@@ -0,0 +1,134 @@
+"""
+Module to load rows into MySQL with LOAD DATA LOCAL INFILE, which is much faster than insert for big tables.
+Every batch is written into one temporary file that is cleared and reused for every batch, then read by the server from the client side.
+Local infile is only allowed on the connections of the loader: they are checked out from a separate engine with the url of the target connection (see connection.engine_derive), so every other connection of the tool can not be asked for a client file by the server. The server must have local_infile enabled.
+The file is always written in utf8mb4 and the server convert the text into the character set of every column, the same way as insert.
+"""
+
+from __future__ import annotations
+import json
+import os
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from tempfile import NamedTemporaryFile, gettempdir
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pandas
+
+# NOTE: character set of the LOAD DATA file. utf8mb4 can hold any text, so no column of a table with several character sets lose its text
+file_charset: str = "utf8mb4"
+# NOTE: connect option of every driver to allow LOAD DATA LOCAL. mysql-connector only allow the files at the temporary directory, where the loader write its file
+local_infile_option: dict[str, dict[str, object]] = {
+    "mysqlconnector": {"allow_local_infile": False, "allow_local_infile_in_path": gettempdir()},
+    "mariadbconnector": {"local_infile": True},
+    "pymysql": {"local_infile": True},
+    "mysqldb": {"local_infile": 1}}
+# NOTE: special character of LOAD DATA with the default FIELDS ESCAPED BY '\\', see https://dev.mysql.com/doc/refman/8.0/en/load-data.html
+escape_table: dict[int, str] = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+byte_escape_list: list[tuple[bytes, bytes]] = [(b"\\", b"\\\\"), (b"\t", b"\\t"), (b"\n", b"\\n"), (b"\r", b"\\r"), (b"\0", b"\\0")]
+
+
+def byte_escape(value: bytes) -> bytes:
+    for character, escaped in byte_escape_list:
+        value = value.replace(character, escaped)
+    return value
+
+def time_text(value: timedelta) -> str:
+    """
+    Get the hh:mm:ss.ffffff text of a timedelta (mysql time column is read as timedelta).
+
+    Args:
+        - value (timedelta): the time value
+
+    Returns:
+        text (string): the time text
+    """
+    microsecond: int = (value.days * 86400 + value.seconds) * 1000000 + value.microseconds
+    sign: str = "-" if microsecond < 0 else ""
+    second, microsecond = divmod(abs(microsecond), 1000000)
+    minute, second = divmod(second, 60)
+    hour, minute = divmod(minute, 60)
+    text: str = f"{sign}{hour:02d}:{minute:02d}:{second:02d}.{microsecond:06d}"
+    return text
+
+def file_value(value: object) -> bytes:
+    """
+    Convert a value into a field of the LOAD DATA file based on its python type. The text is encoded in utf-8 strictly, so a text that can not be encoded raise an error instead of being changed.
+
+    Args:
+        - value (object): the value from the source database
+
+    Returns:
+        field (bytes): the escaped field, \\N for null
+    """
+    if value is None:
+        return b"\\N"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return byte_escape(bytes(value))
+    if isinstance(value, str):
+        text: str = value
+    elif isinstance(value, bool):
+        text = "1" if value else "0"
+    elif isinstance(value, (int, float, Decimal)):
+        text = str(value)
+    elif isinstance(value, datetime):
+        text = value.isoformat(sep = " ")
+    elif isinstance(value, (date, time)):
+        text = value.isoformat()
+    elif isinstance(value, timedelta):
+        text = time_text(value)
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value)
+    elif isinstance(value, (set, frozenset)):
+        text = ",".join(sorted(str(member) for member in value))
+    else:
+        text = str(value)
+    return text.translate(escape_table).encode("utf-8", errors = "strict")
+
+def load(connection: object, schema: str, table: str, column_list: list[str], batch_iterable: Iterable[list[tuple]], column_rule: pandas.DataFrame = None) -> int:
+    """
+    Load batches of rows into a table with LOAD DATA LOCAL INFILE. Every batch is written into the temporary file, loaded and committed.
+    The batches are loaded on a connection of the loader engine, not on the given connection. With LOCAL the server skip a duplicate or wrong row with a warning instead of an error, so a batch that does not load every row without warning is rolled back and raise an error.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - batch_iterable (iterable): list of rows (tuple) for every batch (example: result of data_transfer.batch_read())
+        - column_rule (DataFrame): metadata_get.mysql.column_rule of the table. It is not used, the argument is kept so every data_loader have the same arguments
+
+    Returns:
+        row_count (integer): total of row loaded
+    """
+    from ..connection import engine_derive
+    from ..data_transfer import table_identifier
+    preparer = connection.dialect.identifier_preparer
+    column_string: str = ", ".join(preparer.quote(column) for column in column_list)
+    temporary_file = NamedTemporaryFile(mode = "w+b", suffix = ".tsv", delete = False)
+    file_path: str = temporary_file.name.replace("\\", "/").replace("'", "\\'")
+    script: str = f"LOAD DATA LOCAL INFILE '{file_path}' INTO TABLE {table_identifier(connection, schema, table)} CHARACTER SET {file_charset} FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({column_string})"
+    loader_engine = engine_derive(connection.engine, "local_infile", connect_args = local_infile_option.get(connection.dialect.driver, {}))
+    row_count: int = 0
+    try:
+        with loader_engine.connect() as loader_connection:
+            for batch in batch_iterable:
+                if len(batch) == 0:
+                    continue
+                temporary_file.seek(0)
+                temporary_file.truncate()
+                temporary_file.write(b"".join([b"\t".join([file_value(value) for value in row]) + b"\n" for row in batch]))
+                temporary_file.flush()
+                loaded_row_count: int = loader_connection.exec_driver_sql(script).rowcount
+                warning_list: list[tuple] = [warning for warning in loader_connection.exec_driver_sql("SHOW WARNINGS LIMIT 5").all() if str(warning[0]).lower() != "note"]
+                if loaded_row_count != len(batch) or len(warning_list) != 0:
+                    loader_connection.rollback()
+                    warning_string: str = "; ".join(f"{warning[0]} {warning[1]}: {warning[2]}" for warning in warning_list)
+                    raise Exception(f"LOAD DATA into {schema}.{table} loaded {loaded_row_count} of {len(batch)} rows, the batch is rolled back. {warning_string}")
+                loader_connection.commit()
+                row_count = row_count + len(batch)
+    finally:
+        temporary_file.close()
+        os.remove(temporary_file.name)
+    return row_count
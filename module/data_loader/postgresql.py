@@ -0,0 +1,270 @@
+"""
+Module to load rows into PostgreSQL with COPY ... FROM STDIN, which is much faster than insert for big tables.
+The rows are written into one buffer that is cleared and reused for every batch, then sent to the server with copy_expert of psycopg2.
+"""
+
+from __future__ import annotations
+import io
+import json
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import pandas
+
+binary_data_type: set[str] = {"binary", "varbinary", "tinyblob", "blob", "mediumblob", "longblob", "bytea", "raw", "long raw"}
+# NOTE: special character of COPY text format, see https://www.postgresql.org/docs/current/sql-copy.html
+escape_table: dict[int, str] = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+binary_header: bytes = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+binary_trailer: bytes = struct.pack("!h", -1)
+binary_null: bytes = struct.pack("!i", -1)
+postgres_epoch_date: date = date(2000, 1, 1)
+postgres_epoch_datetime: datetime = datetime(2000, 1, 1)
+
+
+def interval_text(value: timedelta) -> str:
+    """
+    Get the hh:mm:ss.ffffff text of a timedelta (mysql time column is read as timedelta).
+
+    Args:
+        - value (timedelta): the time value
+
+    Returns:
+        text (string): the time text
+    """
+    microsecond: int = (value.days * 86400 + value.seconds) * 1000000 + value.microseconds
+    sign: str = "-" if microsecond < 0 else ""
+    second, microsecond = divmod(abs(microsecond), 1000000)
+    minute, second = divmod(second, 60)
+    hour, minute = divmod(minute, 60)
+    text: str = f"{sign}{hour:02d}:{minute:02d}:{second:02d}.{microsecond:06d}"
+    return text
+
+def text_value(value: object) -> str:
+    """
+    Convert a value into COPY text format based on its python type.
+
+    Args:
+        - value (object): the value from the source database
+
+    Returns:
+        text (string): the escaped text of the value, \\N for null
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(escape_table)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, Decimal)):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "Infinity" if value > 0 else "-Infinity"
+        return repr(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, datetime):
+        return value.isoformat(sep = " ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return interval_text(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value).translate(escape_table)
+    if isinstance(value, (set, frozenset)):
+        return ",".join(sorted(str(member) for member in value)).translate(escape_table)
+    return str(value).translate(escape_table)
+
+def binary_data_text(value: object) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return "\\\\x" + bytes(value).hex()
+
+def json_text(value: object) -> str:
+    if value is None:
+        return "\\N"
+    if not isinstance(value, str):
+        value = json.dumps(value)
+    return value.translate(escape_table)
+
+def text_converter(attribute: dict) -> object:
+    """
+    Get the function to convert the value of a column into COPY text format, based on the column metadata.
+
+    Args:
+        - attribute (dictionary): one row of metadata_get.<source product>.column_rule, or None when the column metadata is not available
+
+    Returns:
+        converter (function): function that convert one value into text
+    """
+    if attribute is None:
+        return text_value
+    data_type: str = str(attribute["data_type"]).lower()
+    if data_type in binary_data_type:
+        return binary_data_text
+    if data_type == "json":
+        return json_text
+    return text_value
+
+def binary_text(value: object) -> bytes:
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return str(value).encode("utf-8")
+
+def binary_bytea(value: object) -> bytes:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return bytes(value)
+
+def binary_date(value: date) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    return struct.pack("!i", (value - postgres_epoch_date).days)
+
+def binary_timestamp(value: datetime) -> bytes:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo = None)
+    delta: timedelta = value - postgres_epoch_datetime
+    return struct.pack("!q", (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+def binary_time(value: object) -> bytes:
+    if isinstance(value, timedelta):
+        return struct.pack("!q", (value.days * 86400 + value.seconds) * 1000000 + value.microseconds)
+    return struct.pack("!q", ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond)
+
+# NOTE: binary encoder of every supported postgresql type (pg_type.typname), the other type will make the load fall back to text format
+binary_encoder_dict: dict[str, object] = {
+    "bool": lambda value: b"\x01" if value else b"\x00",
+    "int2": lambda value: struct.pack("!h", int(value)),
+    "int4": lambda value: struct.pack("!i", int(value)),
+    "int8": lambda value: struct.pack("!q", int(value)),
+    "float4": lambda value: struct.pack("!f", float(value)),
+    "float8": lambda value: struct.pack("!d", float(value)),
+    "bytea": binary_bytea,
+    "text": binary_text,
+    "varchar": binary_text,
+    "bpchar": binary_text,
+    "name": binary_text,
+    "json": binary_text,
+    "jsonb": lambda value: b"\x01" + binary_text(value),
+    "date": binary_date,
+    "timestamp": binary_timestamp,
+    "timestamptz": binary_timestamp,
+    "time": binary_time}
+
+def column_type(connection: object, schema: str, table: str) -> dict[str, str]:
+    """
+    Get the postgresql type name of every column of a table at the target database.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+
+    Returns:
+        data (dictionary): pg_type.typname of every column, with the column name as key
+    """
+    from sqlalchemy.sql import text
+    script = """
+        SELECT 
+            a.attname as column_name
+            ,t.typname as type_name
+        FROM 
+            pg_catalog.pg_attribute a
+            join
+            pg_catalog.pg_class c
+            on
+                a.attrelid = c.oid
+            join
+            pg_catalog.pg_namespace n
+            on
+                c.relnamespace = n.oid
+            join
+            pg_catalog.pg_type t
+            on
+                a.atttypid = t.oid
+        WHERE 
+            n.nspname = :schema
+            and
+            c.relname = :table
+            and
+            a.attnum > 0
+            and
+            not a.attisdropped"""
+    data: dict[str, str] = {row[0]: row[1] for row in connection.execute(text(script), {"schema": schema, "table": table})}
+    return data
+
+def load(connection: object, schema: str, table: str, column_list: list[str], batch_iterable: Iterable[list[tuple]], column_rule: pandas.DataFrame = None, copy_format: str = "text") -> int:
+    """
+    Load batches of rows into a table with COPY ... FROM STDIN. Every batch is sent with one copy_expert and committed.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database (psycopg2 driver)
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - batch_iterable (iterable): list of rows (tuple) for every batch (example: result of data_transfer.batch_read())
+        - column_rule (DataFrame): metadata_get.<source product>.column_rule of the table, used to convert the value of every column
+        - copy_format (string): 'text' or 'binary'. binary fall back to text when a column type does not have a binary encoder
+
+    Returns:
+        row_count (integer): total of row loaded
+    """
+    from ..data_transfer import table_identifier
+    preparer = connection.dialect.identifier_preparer
+    if copy_format == "binary":
+        type_dict: dict[str, str] = column_type(connection, schema, table)
+        encoder_list: list[object] = [binary_encoder_dict.get(type_dict.get(column)) for column in column_list]
+        if None in encoder_list:
+            unsupported_list: list[str] = [f"{column} ({type_dict.get(column)})" for column, encoder in zip(column_list, encoder_list) if encoder is None]
+            print(f"- {table}: no binary encoder for {', '.join(unsupported_list)}, loading with text format")
+            copy_format = "text"
+    if copy_format == "text":
+        attribute_dict: dict[str, dict] = {}
+        if column_rule is not None and len(column_rule) != 0:
+            attribute_dict = {attribute["column_name"]: attribute for attribute in column_rule.to_dict("records")}
+        converter_list: list[object] = [text_converter(attribute_dict.get(column)) for column in column_list]
+        buffer = io.StringIO()
+    else:
+        buffer = io.BytesIO()
+    column_string: str = ", ".join(preparer.quote(column) for column in column_list)
+    script: str = f"COPY {table_identifier(connection, schema, table)} ({column_string}) FROM STDIN WITH (FORMAT {copy_format})"
+    field_count: bytes = struct.pack("!h", len(column_list))
+    cursor = connection.connection.cursor()
+    row_count: int = 0
+    try:
+        for batch in batch_iterable:
+            if len(batch) == 0:
+                continue
+            buffer.seek(0)
+            buffer.truncate()
+            if copy_format == "text":
+                buffer.write("".join(["\t".join([converter(value) for converter, value in zip(converter_list, row)]) + "\n" for row in batch]))
+            else:
+                buffer.write(binary_header)
+                for row in batch:
+                    buffer.write(field_count)
+                    for encoder, value in zip(encoder_list, row):
+                        if value is None:
+                            buffer.write(binary_null)
+                        else:
+                            data: bytes = encoder(value)
+                            buffer.write(struct.pack("!i", len(data)))
+                            buffer.write(data)
+                buffer.write(binary_trailer)
+            buffer.seek(0)
+            if not connection.in_transaction():
+                connection.begin()
+            cursor.copy_expert(script, buffer)
+            connection.commit()
+            row_count = row_count + len(batch)
+    finally:
+        cursor.close()
+    return row_count
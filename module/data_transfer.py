@@ -0,0 +1,490 @@
+"""
+Module to move table rows from a source connection to a target connection in batches.
+- table_identifier = to get the quoted and schema qualified table name for a connection
+- stream_read = to run a select and read its rows in batches through a server side (or unbuffered) cursor
+- batch_read = to read the rows of a table in batches through a server side cursor
+- batch_insert = to write batches of rows into a table with executemany
+- chunk_count = to get the total of chunk of a table from its row estimate
+- key_range = to split a table into primary key ranges
+- range_middle = to get the key value that split a key range into two halves
+- keyset_read = to read the rows of a key range in batches with keyset pagination
+- range_delete = to delete the rows of a key range, before the range is copied again
+- watermark_column = to choose the column that tell which rows are new or changed
+- watermark_read = to read the rows past a watermark in batches
+- batch_upsert = to write batches of rows into a table, updating the rows that already exist
+"""
+
+from __future__ import annotations
+from math import ceil
+from typing import TYPE_CHECKING, Iterator, Iterable
+
+if TYPE_CHECKING:
+    import pandas
+
+# NOTE: placeholder of a positional parameter for every DBAPI paramstyle, see PEP 249
+placeholder_dict: dict[str, str] = {"qmark": "?", "format": "%s", "pyformat": "%s", "numeric": ":{position}", "named": ":{position}"}
+# NOTE: cursor option of the DBAPI driver whose sqlalchemy dialect does not have server side cursor (stream_results is ignored for it). The cursor get the rows from the server while they are fetched, like the SSCursor of pymysql
+unbuffered_cursor_dict: dict[str, dict[str, object]] = {"mysqlconnector": {"buffered": False}}
+
+
+def table_identifier(connection: object, schema: str, table: str) -> str:
+    """
+    Get the quoted and schema qualified name of a table, quoted with the rule of the connection dialect.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - table (string): name of the table
+
+    Returns:
+        identifier (string): the schema qualified table name (example: `schema`.`table` for mysql)
+    """
+    preparer = connection.dialect.identifier_preparer
+    identifier: str = f"{preparer.quote_schema(schema)}.{preparer.quote(table)}"
+    return identifier
+
+def stream_read(connection: object, statement: object, batch_size: int = 10000) -> tuple[list[str], Iterator[list[tuple]]]:
+    """
+    Run a select and read its rows in batches, so only one batch is kept in memory however many rows the select give.
+    The rows are read with stream_results when the dialect have server side cursor, otherwise with the unbuffered cursor of the driver (see unbuffered_cursor_dict).
+    When the batches are not read until the end, the rest of the rows are read and thrown away before the cursor is closed, so the connection can be used again.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the source database
+        - statement (object): sqlalchemy select or text statement
+        - batch_size (integer): total of row in a batch
+
+    Returns:
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - batch (generator): list of rows (tuple) for every batch
+    """
+    dialect = connection.dialect
+    if dialect.supports_server_side_cursors or dialect.driver not in unbuffered_cursor_dict:
+        result = connection.execution_options(stream_results = True, yield_per = batch_size).execute(statement)
+        column_list: list[str] = list(result.keys())
+        def batch_iterate() -> Iterator[list[tuple]]:
+            with result:
+                for partition in result.partitions(batch_size):
+                    yield [tuple(row) for row in partition]
+        return column_list, batch_iterate()
+    compiled = statement.compile(dialect = dialect)
+    parameter: object = [compiled.params[name] for name in compiled.positiontup] if compiled.positional else compiled.params
+    script: str = str(compiled)
+    cursor = connection.connection.cursor(**unbuffered_cursor_dict[dialect.driver])
+    try:
+        if len(parameter) == 0:
+            # NOTE: sqlalchemy double every % (also inside a quoted name) for the format and pyformat paramstyle, but the driver only turn %% back into % when it get parameters
+            if dialect.paramstyle in ["format", "pyformat"]:
+                script = script.replace("%%", "%")
+            cursor.execute(script)
+        else:
+            cursor.execute(script, parameter)
+    except Exception:
+        cursor.close()
+        raise
+    column_list = [description[0] for description in cursor.description]
+    def cursor_iterate() -> Iterator[list[tuple]]:
+        finished: bool = False
+        try:
+            while True:
+                row_list: list[tuple] = cursor.fetchmany(batch_size)
+                if len(row_list) == 0:
+                    finished = True
+                    break
+                yield [tuple(row) for row in row_list]
+        finally:
+            if not finished:
+                try:
+                    while len(cursor.fetchmany(batch_size)) != 0:
+                        pass
+                except Exception:
+                    pass
+            cursor.close()
+    return column_list, cursor_iterate()
+
+def batch_read(connection: object, schema: str, table: str, batch_size: int = 10000, column_list: list[str] = None) -> tuple[list[str], Iterator[list[tuple]]]:
+    """
+    Read all rows of a table in batches. The rows are fetched with a server side cursor (see stream_read), so only one batch is kept in memory however big the table is.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the source database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - batch_size (integer): total of row in a batch
+        - column_list (list): name of the columns to read. The default is all columns
+
+    Returns:
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - batch (generator): list of rows (tuple) for every batch
+    """
+    from sqlalchemy.sql import text
+    preparer = connection.dialect.identifier_preparer
+    column_string: str = "*" if column_list is None else ", ".join(preparer.quote(column) for column in column_list)
+    script = f"""
+        SELECT 
+            {column_string}
+        FROM 
+            {table_identifier(connection, schema, table)}"""
+    return stream_read(connection, text(script), batch_size)
+
+def insert_script(connection: object, schema: str, table: str, column_list: list[str]) -> str:
+    """
+    Get the insert statement of a table with positional parameter that follow the DBAPI paramstyle of the connection.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns to insert
+
+    Returns:
+        script (string): the insert statement
+    """
+    preparer = connection.dialect.identifier_preparer
+    placeholder: str = placeholder_dict[connection.dialect.paramstyle]
+    column_string: str = ", ".join(preparer.quote(column) for column in column_list)
+    value_string: str = ", ".join(placeholder.format(position = position) for position in range(1, len(column_list) + 1))
+    script: str = f"insert into {table_identifier(connection, schema, table)} ({column_string}) values ({value_string})"
+    return script
+
+def batch_insert(connection: object, schema: str, table: str, column_list: list[str], batch_iterable: Iterable[list[tuple]], commit: bool = True) -> int:
+    """
+    Write batches of rows into a table. Every batch is sent with one executemany and committed.
+    Without commit, nothing is committed so the caller can commit (or roll back) the rows together with its other statements.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - batch_iterable (iterable): list of rows (tuple) for every batch (example: result of batch_read())
+        - commit (boolean): True to commit every batch, False to leave the transaction open
+
+    Returns:
+        row_count (integer): total of row written
+    """
+    script: str = insert_script(connection, schema, table, column_list)
+    row_count: int = 0
+    for batch in batch_iterable:
+        if len(batch) == 0:
+            continue
+        connection.exec_driver_sql(script, batch)
+        if commit:
+            connection.commit()
+        row_count = row_count + len(batch)
+    return row_count
+
+def table_column(connection: object, schema: str, table: str) -> list[str]:
+    """
+    Get the name of all columns of a table without reading any row.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - table (string): name of the table
+
+    Returns:
+        column_list (list): name of the columns, in the table order
+    """
+    from sqlalchemy.sql import text
+    script = f"""
+        SELECT 
+            *
+        FROM 
+            {table_identifier(connection, schema, table)}
+        WHERE 
+            1 = 0"""
+    result = connection.execute(text(script))
+    column_list: list[str] = list(result.keys())
+    result.close()
+    return column_list
+
+def chunk_count(row_estimate: int, chunk_row_count: int = 1000000, max_chunk: int = 1024) -> int:
+    """
+    Get the total of chunk of a table, so every chunk have about chunk_row_count rows.
+
+    Args:
+        - row_estimate (integer): the estimated total of row of the table (example: result of metadata_get.<product>.row_estimate)
+        - chunk_row_count (integer): the wanted total of row in a chunk
+        - max_chunk (integer): maximum total of chunk
+
+    Returns:
+        count (integer): total of chunk, at least 1
+    """
+    count: int = max(1, min(max_chunk, ceil(max(0, row_estimate) / max(1, chunk_row_count))))
+    return count
+
+def key_range(connection: object, schema: str, table: str, key_column: str, count: int) -> list[tuple[object, object]]:
+    """
+    Split a table into key ranges on one column (the leading column of the primary key).
+    Integer key is split evenly between its min and max value. The other key is split on its percentile with NTILE, which scan the key once.
+    Every range is (lower, upper) with lower excluded and upper included, None mean the range is open on that side.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the source database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - key_column (string): name of the column to split
+        - count (integer): the wanted total of range
+
+    Returns:
+        range_list (list): the key ranges, in order of the key. The ranges cover the whole table
+    """
+    from sqlalchemy import column, func, select, table as table_clause
+    if count <= 1:
+        return [(None, None)]
+    key = column(key_column)
+    source = table_clause(table, key, schema = schema)
+    minimum, maximum = connection.execute(select(func.min(key), func.max(key)).select_from(source)).one()
+    if minimum is None or minimum == maximum:
+        return [(None, None)]
+    if isinstance(minimum, int) and isinstance(maximum, int) and not isinstance(minimum, bool):
+        boundary_list: list[object] = sorted(set(minimum + (maximum - minimum) * number // count for number in range(1, count)))
+    else:
+        tile = select(key.label("key_value"), func.ntile(count).over(order_by = key).label("tile")).select_from(source).subquery()
+        boundary = func.max(tile.c.key_value)
+        boundary_list = [row[0] for row in connection.execute(select(boundary).group_by(tile.c.tile).order_by(boundary))][:-1]
+    range_list: list[tuple[object, object]] = list(zip([None] + boundary_list, boundary_list + [None]))
+    return range_list
+
+def range_middle(connection: object, schema: str, table: str, key_column: str, lower: object = None, upper: object = None) -> object:
+    """
+    Get the leading key value that split a key range into two halves with about the same total of row: (lower, middle] and (middle, upper].
+    Integer key is split at the middle of its min and max value in the range. The other key is split at its median with NTILE.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - key_column (string): name of the leading primary key column
+        - lower (object): the leading key value where the range start (excluded), None to start from the first row
+        - upper (object): the leading key value where the range end (included), None to end at the last row
+
+    Returns:
+        middle (object): the split value, None when the range can not be split (the range have only one leading key value or no row)
+    """
+    from sqlalchemy import column, func, select, table as table_clause
+    key = column(key_column)
+    source = table_clause(table, key, schema = schema)
+    condition_list: list[object] = []
+    if lower is not None:
+        condition_list.append(key > lower)
+    if upper is not None:
+        condition_list.append(key <= upper)
+    minimum, maximum = connection.execute(select(func.min(key), func.max(key)).select_from(source).where(*condition_list)).one()
+    if minimum is None or minimum == maximum:
+        return None
+    if isinstance(minimum, int) and isinstance(maximum, int) and not isinstance(minimum, bool):
+        return (minimum + maximum) // 2
+    tile = select(key.label("key_value"), func.ntile(2).over(order_by = key).label("tile")).select_from(source).where(*condition_list).subquery()
+    middle: object = connection.execute(select(func.max(tile.c.key_value)).where(tile.c.tile == 1)).scalar()
+    if middle is None or middle == maximum:
+        return None
+    return middle
+
+def keyset_read(connection: object, schema: str, table: str, key_list: list[str], lower: object = None, upper: object = None, batch_size: int = 10000, column_list: list[str] = None) -> tuple[list[str], Iterator[list[tuple]]]:
+    """
+    Read the rows of a key range in batches with keyset pagination: every batch continue after the primary key of the last row (WHERE key > last ORDER BY key LIMIT batch_size), so no batch need OFFSET.
+    The range is on the leading column of the primary key, while the pagination use the whole primary key so the rows with the same leading value are never skipped.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the source database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - key_list (list): name of the primary key columns, in the key order
+        - lower (object): the leading key value where the range start (excluded), None to start from the first row
+        - upper (object): the leading key value where the range end (included), None to end at the last row
+        - batch_size (integer): total of row in a batch
+        - column_list (list): name of the columns to read. The default is all columns
+
+    Returns:
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - batch (generator): list of rows (tuple) for every batch
+    """
+    from sqlalchemy import and_, column, or_, select, table as table_clause
+    if column_list is None:
+        column_list = table_column(connection, schema, table)
+    read_list: list[str] = column_list + [key for key in key_list if key not in column_list]
+    source = table_clause(table, *[column(name) for name in read_list], schema = schema)
+    key_object_list: list[object] = [source.c[key] for key in key_list]
+    key_position: list[int] = [read_list.index(key) for key in key_list]
+    statement = select(*[source.c[name] for name in read_list]).order_by(*key_object_list).limit(batch_size)
+    if lower is not None:
+        statement = statement.where(key_object_list[0] > lower)
+    if upper is not None:
+        statement = statement.where(key_object_list[0] <= upper)
+    def batch_iterate() -> Iterator[list[tuple]]:
+        last_key: tuple = None
+        while True:
+            page = statement
+            if last_key is not None:
+                page = page.where(or_(*[and_(*[key_object_list[previous] == last_key[previous] for previous in range(number)], key_object_list[number] > last_key[number]) for number in range(len(key_list))]))
+            row_list: list[tuple] = [tuple(row) for row in connection.execute(page)]
+            if len(row_list) == 0:
+                break
+            last_key = tuple(row_list[-1][position] for position in key_position)
+            yield [row[:len(column_list)] for row in row_list]
+            if len(row_list) < batch_size:
+                break
+    return column_list, batch_iterate()
+
+def range_delete(connection: object, schema: str, table: str, key_column: str = None, lower: object = None, upper: object = None, commit: bool = True) -> int:
+    """
+    Delete the rows of a key range at the target, so a range that was partly copied can be copied again without duplicate rows.
+    Without commit, the delete is left in the open transaction so it can be committed together with the rows copied again.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - key_column (string): name of the leading primary key column. None to delete all rows of the table
+        - lower (object): the leading key value where the range start (excluded), None to start from the first row
+        - upper (object): the leading key value where the range end (included), None to end at the last row
+        - commit (boolean): True to commit the delete, False to leave the transaction open
+
+    Returns:
+        row_count (integer): total of row deleted
+    """
+    from sqlalchemy import column, delete, table as table_clause
+    target = table_clause(table, *([column(key_column)] if key_column is not None else []), schema = schema)
+    statement = delete(target)
+    if key_column is not None and lower is not None:
+        statement = statement.where(target.c[key_column] > lower)
+    if key_column is not None and upper is not None:
+        statement = statement.where(target.c[key_column] <= upper)
+    row_count: int = connection.execute(statement).rowcount
+    if commit:
+        connection.commit()
+    return row_count
+
+# NOTE: integer data type of every product, a key watermark must be an integer that is generated in increasing order
+integer_data_type: set[str] = {"tinyint", "smallint", "mediumint", "int", "integer", "bigint", "number", "serial", "smallserial", "bigserial"}
+
+
+def watermark_column(key_list: list[str], column_rule: pandas.DataFrame = None) -> tuple[str, str]:
+    """
+    Choose the watermark column of a table for the incremental sync.
+    - timestamp = a column that is set on every update (mysql column with 'on update CURRENT_TIMESTAMP' at column_rule extra), so the sync get the new and the updated rows
+    - key = the primary key when it is a single integer column that is generated in increasing order (auto_increment at column_rule extra, or a default value from a sequence / identity like nextval), so the sync only get the new rows
+    Other primary key (uuid, text or natural key) is not used, a new row can have a lower value than the last watermark. Without column_rule the column can not be checked, so there is no watermark.
+
+    Args:
+        - key_list (list): name of the primary key columns, in the key order
+        - column_rule (DataFrame): metadata_get.<source product>.column_rule of the table, or None when it is not available
+
+    Returns:
+        watermark (tuple): name of the column and the watermark kind ('timestamp' or 'key'), None when the table does not have any watermark
+    """
+    if column_rule is None or len(column_rule) == 0:
+        return None
+    column_list: list[str] = [str(column).lower() for column in column_rule.columns]
+    row_list: list[dict[str, str]] = [{name: "" if value is None else str(value).lower() for name, value in zip(column_list, row)} for row in column_rule.itertuples(index = False, name = None)]
+    for row in row_list:
+        if "on update current_timestamp" in row.get("extra", ""):
+            return row["column_name"], "timestamp"
+    if len(key_list) != 1:
+        return None
+    key_row: dict[str, str] = next((row for row in row_list if row["column_name"] == key_list[0].lower()), None)
+    if key_row is None or key_row.get("data_type", "") not in integer_data_type:
+        return None
+    default: str = key_row.get("default_value", key_row.get("default_data", ""))
+    if "auto_increment" in key_row.get("extra", "") or "nextval" in default or key_row.get("is_identity", "") in ["yes", "y"]:
+        return key_list[0], "key"
+    return None
+
+def watermark_read(connection: object, schema: str, table: str, column_name: str, last: object = None, inclusive: bool = False, batch_size: int = 10000, column_list: list[str] = None) -> tuple[list[str], Iterator[list[tuple]]]:
+    """
+    Read the rows past a watermark in batches, ordered by the watermark column so the last row of the last batch have the new watermark.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the source database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_name (string): name of the watermark column
+        - last (object): the last synced watermark value, None to read all rows
+        - inclusive (boolean): True to also read the rows at the last watermark value (for timestamp, where a row can be written later with the same value)
+        - batch_size (integer): total of row in a batch
+        - column_list (list): name of the columns to read. The default is all columns
+
+    Returns:
+        - column_list (list): name of the columns, in the same order as the value in every row. The watermark column is always included
+        - batch (generator): list of rows (tuple) for every batch
+    """
+    from sqlalchemy import column, select, table as table_clause
+    if column_list is None:
+        column_list = table_column(connection, schema, table)
+    if column_name not in column_list:
+        column_list = column_list + [column_name]
+    source = table_clause(table, *[column(name) for name in column_list], schema = schema)
+    statement = select(*[source.c[name] for name in column_list]).order_by(source.c[column_name])
+    if last is not None:
+        statement = statement.where(source.c[column_name] >= last if inclusive else source.c[column_name] > last)
+    _, batch_iterator = stream_read(connection, statement, batch_size)
+    return column_list, batch_iterator
+
+def upsert_script(connection: object, schema: str, table: str, column_list: list[str], key_list: list[str]) -> str:
+    """
+    Get the upsert statement of a table with positional parameter that follow the DBAPI paramstyle of the connection. The statement follow the dialect of the connection:
+    - mysql, mariadb = insert ... on duplicate key update
+    - postgresql, sqlite = insert ... on conflict (key) do update
+    - oracle = merge into ... using dual
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns to write
+        - key_list (list): name of the primary key columns
+
+    Returns:
+        script (string): the upsert statement
+    """
+    preparer = connection.dialect.identifier_preparer
+    dialect: str = connection.dialect.name
+    placeholder: str = placeholder_dict[connection.dialect.paramstyle]
+    quoted_list: list[str] = [preparer.quote(column) for column in column_list]
+    key_set: set[str] = set(key_list)
+    update_list: list[str] = [preparer.quote(column) for column in column_list if column not in key_set]
+    value_list: list[str] = [placeholder.format(position = position) for position in range(1, len(column_list) + 1)]
+    identifier: str = table_identifier(connection, schema, table)
+    if dialect in ["mysql", "mariadb"]:
+        update_string: str = ", ".join(f"{column} = values({column})" for column in (update_list or quoted_list[:1]))
+        script: str = f"insert into {identifier} ({', '.join(quoted_list)}) values ({', '.join(value_list)}) on duplicate key update {update_string}"
+    elif dialect in ["postgresql", "sqlite"]:
+        action: str = "do nothing" if len(update_list) == 0 else "do update set " + ", ".join(f"{column} = excluded.{column}" for column in update_list)
+        script = f"insert into {identifier} ({', '.join(quoted_list)}) values ({', '.join(value_list)}) on conflict ({', '.join(preparer.quote(key) for key in key_list)}) {action}"
+    elif dialect == "oracle":
+        source_string: str = ", ".join(f"{value} as {column}" for value, column in zip(value_list, quoted_list))
+        on_string: str = " and ".join(f"t.{preparer.quote(key)} = s.{preparer.quote(key)}" for key in key_list)
+        script = f"merge into {identifier} t using (select {source_string} from dual) s on ({on_string})"
+        if len(update_list) != 0:
+            script = script + " when matched then update set " + ", ".join(f"t.{column} = s.{column}" for column in update_list)
+        script = script + f" when not matched then insert ({', '.join(quoted_list)}) values ({', '.join(f's.{column}' for column in quoted_list)})"
+    else:
+        raise NotImplementedError(f"upsert is not available for {dialect}")
+    return script
+
+def batch_upsert(connection: object, schema: str, table: str, column_list: list[str], key_list: list[str], batch_iterable: Iterable[list[tuple]]) -> int:
+    """
+    Write batches of rows into a table, the row that already exist (by primary key) is updated. Every batch is sent with one executemany and committed.
+
+    Args:
+        - connection (object): sqlalchemy connection object of the target database
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns, in the same order as the value in every row
+        - key_list (list): name of the primary key columns
+        - batch_iterable (iterable): list of rows (tuple) for every batch (example: result of watermark_read())
+
+    Returns:
+        row_count (integer): total of row written
+    """
+    script: str = upsert_script(connection, schema, table, column_list, key_list)
+    row_count: int = 0
+    for batch in batch_iterable:
+        if len(batch) == 0:
+            continue
+        connection.exec_driver_sql(script, batch)
+        connection.commit()
+        row_count = row_count + len(batch)
+    return row_count
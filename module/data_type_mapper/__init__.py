@@ -1 +1,76 @@
-from .mysql import *
\ No newline at end of file
+"""
+Registry of data type mapper. The mapper is stored at module.data_type_mapper.<source product>.<target product>.<data type> as a default function.
+All mapper are loaded once into a dictionary keyed by (source product, target product, data type), so getting the mapper of a column is a single dictionary lookup.
+- mapper_table = to get all data type mapper from a source product to a target product
+- mapper_get = to get the data type mapper of a single data type
+"""
+
+from importlib import import_module
+from pkgutil import iter_modules
+from threading import Lock
+
+registry: dict[tuple[str, str, str], object] = {}
+registry_table: dict[tuple[str, str], dict[str, object]] = {}
+registry_lock = Lock()
+
+
+def registry_build() -> dict[tuple[str, str], dict[str, object]]:
+    """
+    Load every data type mapper module once. The next call only return the loaded registry.
+
+    Returns:
+        registry_table (dictionary): data type mapper of every (source product, target product), with the data type as key
+    """
+    if len(registry_table) != 0:
+        return registry_table
+    with registry_lock:
+        if len(registry_table) != 0:
+            return registry_table
+        for source in iter_modules(__path__):
+            if not source.ispkg:
+                continue
+            source_package = import_module(f"{__name__}.{source.name}")
+            for target in iter_modules(source_package.__path__):
+                if not target.ispkg:
+                    continue
+                target_package = import_module(f"{source_package.__name__}.{target.name}")
+                mapper_dict: dict[str, object] = {}
+                for data_type in iter_modules(target_package.__path__):
+                    data_type_module = import_module(f"{target_package.__name__}.{data_type.name}")
+                    mapper_dict[data_type.name] = data_type_module.default
+                    registry[(source.name, target.name, data_type.name)] = data_type_module.default
+                registry_table[(source.name, target.name)] = mapper_dict
+    return registry_table
+
+def mapper_table(source_product: str, target_product: str) -> dict[str, object]:
+    """
+    Get all data type mapper from a source product to a target product.
+
+    Args:
+        - source_product (string): the source database product name (example: mysql) in lowercase
+        - target_product (string): the target database product name (example: postgresql) in lowercase
+
+    Returns:
+        mapper_dict (dictionary): default function of every data type, with the data type as key
+    """
+    table = registry_build()
+    if (source_product, target_product) not in table:
+        raise NotImplementedError(f"there is no data type mapper from {source_product} to {target_product}.")
+    return table[(source_product, target_product)]
+
+def mapper_get(source_product: str, target_product: str, data_type: str) -> object:
+    """
+    Get the data type mapper of a single data type.
+
+    Args:
+        - source_product (string): the source database product name (example: mysql) in lowercase
+        - target_product (string): the target database product name (example: postgresql) in lowercase
+        - data_type (string): the data type on the source database (example: varchar)
+
+    Returns:
+        mapper (function): default function of the data type that return the target data type string
+    """
+    mapper_dict: dict[str, object] = mapper_table(source_product, target_product)
+    if data_type not in mapper_dict:
+        raise NotImplementedError(f"there is no data type mapper for {data_type} from {source_product} to {target_product}. available data type: {', '.join(sorted(mapper_dict))}")
+    return mapper_dict[data_type]
@@ -1,3 +1,3 @@
-from .mariadb import *
-from .mysql import *
-from .postgresql import *
\ No newline at end of file
+"""
+Data type mapper with mysql as the source product. Every sub package is one target product.
+"""
@@ -1,29 +1,4 @@
-from bigint import *
-from binary import *
-from blob import *
-from char import *
-from date import *
-from datetime import *
-from double import *
-from year import *
-from varchar import *
-from float import *
-from enum import *
-from int import *
-from json import *
-from longblob import *
-from longtext import *
-from varchar import *
-from varbinary import *
-from tinytext import *
-from tinyint import *
-from tinyblob import *
-from timestamp import *
-from time import *
-from text import *
-from smallint import *
-from set import *
-from numeric import *
-from mediumtext import *
-from mediumint import *
-from mediumblob import *
\ No newline at end of file
+"""
+Data type mapper from mysql to postgresql. Every module is one mysql data type and have a default function that return the postgresql data type string.
+The modules are loaded by the registry at module.data_type_mapper, not imported here.
+"""
@@ -0,0 +1,140 @@
+"""
+Module to compare the rows of a table at the source and the target without moving the rows: every key range is hashed at the database server and only the digest is compared.
+- checksum_family = to get the hash family of a connection, digest can only be compared within the same family
+- lob_column = to get the LOB columns of a table, which are hashed in another way at oracle
+- checksum_script = to get the aggregate hash query of a key range
+- range_checksum = to get the total of row and the digest of a key range
+"""
+
+from __future__ import annotations
+
+# NOTE: database dialect that have the same hash function and the same text of a value, so their digest can be compared
+family_dict: dict[str, str] = {"mysql": "mysql", "mariadb": "mysql", "postgresql": "postgresql", "oracle": "oracle"}
+
+
+def checksum_family(connection: object) -> str:
+    """
+    Get the hash family of a connection.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+
+    Returns:
+        family (string): name of the hash family, None when the dialect does not have server side hash (only the total of row can be compared)
+    """
+    family: str = family_dict.get(connection.dialect.name)
+    return family
+
+def lob_column(connection: object, schema: str, table: str) -> list[str]:
+    """
+    Get the LOB columns (CLOB, NCLOB, BLOB) of a table. Only the oracle family need them, ORA_HASH does not accept LOB.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - table (string): name of the table
+
+    Returns:
+        lob_list (list): name of the LOB columns, empty for the other family
+    """
+    from sqlalchemy.sql import text
+    if checksum_family(connection) != "oracle":
+        return []
+    script = f"""
+        SELECT 
+            column_name
+        FROM 
+            all_tab_columns
+        WHERE 
+            owner = :schema
+            and
+            table_name = :table
+            and
+            data_type in ('CLOB', 'NCLOB', 'BLOB')"""
+    lob_list: list[str] = connection.execute(text(script), {"schema": schema, "table": table}).scalars().all()
+    connection.commit()
+    return lob_list
+
+def checksum_script(connection: object, schema: str, table: str, column_list: list[str], key_list: list[str], lower: object = None, upper: object = None, lob_list: list[str] = None) -> str:
+    """
+    Get the query of the total of row and the aggregate hash of a key range, by the hash family of the connection:
+    - mysql = sum of the first 64 bit of MD5(...) of every row
+    - postgresql = md5(string_agg(md5(ROW(...)::text))) of every row ordered by the primary key
+    - oracle = sum of ORA_HASH(...) of every row, where the row is the sum of ORA_HASH of every column with the column position as seed. Every column is hashed alone, so a wide row never pass the VARCHAR2 limit. LOB column is hashed with DBMS_CRYPTO.HASH (the user need execute on dbms_crypto)
+    For mysql every column is written as its length, ':' and its text, and null is written as 'N', so no two different rows have the same text. For oracle null have its own hash value, outside of the ORA_HASH range.
+    - other = only the total of row, the digest is null
+    The range is filtered with :lower and :upper bind parameter on the leading primary key column.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns to hash
+        - key_list (list): name of the primary key columns, in the key order. Empty list when the table does not have primary key (the whole table is one range)
+        - lower (object): the leading key value where the range start (excluded), None to start from the first row
+        - upper (object): the leading key value where the range end (included), None to end at the last row
+        - lob_list (list): name of the LOB columns, result of lob_column(). Only used by oracle
+
+    Returns:
+        script (string): the checksum query, with row_count and digest column
+    """
+    from .data_transfer import table_identifier
+    preparer = connection.dialect.identifier_preparer
+    family: str = checksum_family(connection)
+    quoted_list: list[str] = [preparer.quote(column) for column in column_list]
+    if family == "mysql":
+        # NOTE: sum instead of bit_xor, two same rows cancel each other with bit_xor. The sum of unsigned integer is a decimal, so it does not overflow
+        row_string: str = ", ".join(f"coalesce(concat(char_length({column}), ':', {column}), 'N')" for column in quoted_list)
+        digest: str = f"coalesce(sum(cast(conv(substr(md5(concat({row_string})), 1, 16), 16, 10) as unsigned)), 0)"
+    elif family == "postgresql":
+        order_string: str = ", ".join(preparer.quote(key) for key in key_list) if len(key_list) != 0 else f"row({', '.join(quoted_list)})::text"
+        digest = f"coalesce(md5(string_agg(md5(row({', '.join(quoted_list)})::text), '' order by {order_string})), '')"
+    elif family == "oracle":
+        lob_set: set[str] = set(lob_list or [])
+        hash_list: list[str] = []
+        for position, (name, column) in enumerate(zip(column_list, quoted_list), start = 1):
+            value: str = f"rawtohex(dbms_crypto.hash({column}, 2))" if name in lob_set else column
+            # NOTE: 4294967296 is the hash of null, ORA_HASH with 4294967295 as max bucket is never higher than 4294967295
+            hash_list.append(f"case when {column} is null then 4294967296 else ora_hash({value}, 4294967295, {position}) end")
+        digest = f"nvl(sum(ora_hash({' + '.join(hash_list)}, 4294967295)), 0)"
+    else:
+        digest = "null"
+    where_list: list[str] = []
+    if len(key_list) != 0 and lower is not None:
+        where_list.append(f"{preparer.quote(key_list[0])} > :lower")
+    if len(key_list) != 0 and upper is not None:
+        where_list.append(f"{preparer.quote(key_list[0])} <= :upper")
+    script: str = f"select count(*) as row_count, {digest} as digest from {table_identifier(connection, schema, table)}"
+    if len(where_list) != 0:
+        script = script + " where " + " and ".join(where_list)
+    return script
+
+def range_checksum(connection: object, schema: str, table: str, column_list: list[str], key_list: list[str], lower: object = None, upper: object = None, lob_list: list[str] = None) -> tuple[int, str]:
+    """
+    Get the total of row and the digest of a key range, computed at the database server.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - table (string): name of the table
+        - column_list (list): name of the columns to hash
+        - key_list (list): name of the primary key columns, in the key order
+        - lower (object): the leading key value where the range start (excluded), None to start from the first row
+        - upper (object): the leading key value where the range end (included), None to end at the last row
+        - lob_list (list): name of the LOB columns, result of lob_column(). Only used by oracle
+
+    Returns:
+        - row_count (integer): total of row in the range
+        - digest (string): the aggregate hash of the range, None when the dialect does not have server side hash
+    """
+    from sqlalchemy.sql import text
+    parameter: dict[str, object] = {}
+    if len(key_list) != 0 and lower is not None:
+        parameter["lower"] = lower
+    if len(key_list) != 0 and upper is not None:
+        parameter["upper"] = upper
+    row = connection.execute(text(checksum_script(connection, schema, table, column_list, key_list, lower, upper, lob_list)), parameter).one()
+    connection.commit()
+    row_count: int = int(row[0])
+    digest: str = None if row[1] is None else str(row[1])
+    return row_count, digest
@@ -1,4 +1,8 @@
-from .mysql import *
-from .mariadb import *
-from .oracle import *
-from .postgresql import *
\ No newline at end of file
+# Every product module is only imported when it is selected, see module.plugin
+from importlib import import_module
+from pkgutil import iter_modules
+
+def __getattr__(name: str) -> object:
+    if name in [product.name for product in iter_modules(__path__)]:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,56 +1,102 @@
-from importlib import import_module
-from pandas import DataFrame
+from __future__ import annotations
 from re import match
+from typing import TYPE_CHECKING
+from ..data_type_mapper import mapper_table
+from ..metadata_record import record, record_group
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
-def mysql(column_rule: DataFrame, primary_key: DataFrame, relation: DataFrame, unique_constraint: DataFrame, check_constraint: DataFrame, all_index: DataFrame):
+
+def row_list(data: list[record] | DataFrame) -> list[record]:
+    """
+    Get the rows of a metadata. The records are used as they are, a dataframe is changed into a list of dictionary.
+
+    Args:
+        - data (list or DataFrame): records of metadata_get.mysql.<function>(output = "record"), or the dataframe of metadata_get.mysql.<function>
+
+    Returns:
+        data (list): rows that can be read like a dictionary
+    """
+    if hasattr(data, "to_dict"):
+        return data.to_dict("records")
+    return data
+
+
+def column_definition(attribute: dict, data_type_mapper_dict: dict[str, object], product_target: str = "mysql") -> str:
+    """
+    Create the column definition (the line of the column inside create table) from the metadata of a mysql column.
+
+    Args:
+        - attribute (record or dictionary): one row of metadata_get.mysql.column_rule
+        - data_type_mapper_dict (dictionary): result of data_type_mapper.mapper_table("mysql", product_target)
+        - product_target (string): the target database product name, used in the error message
+
+    Returns:
+        definition (string): the column definition
+    """
+    data_type_func = data_type_mapper_dict.get(attribute['data_type'])
+    if data_type_func is None:
+        raise NotImplementedError(f"there is no data type mapper for {attribute['data_type']} (column {attribute['table_name']}.{attribute['column_name']}) from mysql to {product_target}.")
+    data_type_string = data_type_func(attribute)
+    if attribute['data_type'] in ["char", "varchar", "tinytext", "text", "mediumtext", "longtext"]:
+        data_type_string = f"{data_type_string} set {attribute['char_set']} collation {attribute['char_collation']}"
+    elif attribute['data_type'] in ["tinyint", "smallint", "mediumint", "int", "bigint"]:
+        data_type_string = f"{data_type_string} {attribute['integer_type_attribute']}"
+    if attribute['generated_column_type'] != "" and attribute['default_value'] != "":
+        return f"`{attribute['column_name']}` {data_type_string} {attribute['is_nullable']} generated always as {attribute['default_value']} {attribute['generated_column_type']} {attribute['extra']} {attribute['column_comment']}"
+    return f"`{attribute['column_name']}` {data_type_string} {attribute['is_nullable']} default {attribute['default_value']} {attribute['extra']} {attribute['column_comment']}"
+
+def relation_definition(relation_name: str, relation_column: list[record] | DataFrame) -> str:
+    """
+    Create the foreign key definition from the metadata of one mysql foreign key.
+
+    Args:
+        - relation_name (string): name of the foreign key constraint
+        - relation_column (list or DataFrame): rows of metadata_get.mysql.relation for the constraint
+
+    Returns:
+        definition (string): the foreign key definition
+    """
+    relation_column = row_list(relation_column)
+    child_column_string: str = ", ".join(f"`{row['column_child']}`" for row in relation_column)
+    parent_column_string: str = ", ".join(f"`{row['column_parent']}`" for row in relation_column)
+    parent_table_name = relation_column[0]['parent_table_name']
+    on_update_action = relation_column[0]['on_update']
+    on_delete_action = relation_column[0]['on_delete']
+    return f"constraint `{relation_name}` foreign key ({child_column_string}) references `{parent_table_name}` ({parent_column_string}) on update {on_update_action} on delete {on_delete_action}"
+
+def mysql(column_rule: list[record] | DataFrame, primary_key: list[record] | DataFrame, relation: list[record] | DataFrame, unique_constraint: list[record] | DataFrame, check_constraint: list[record] | DataFrame, all_index: list[record] | DataFrame, table_name: str = None) -> str:
+    """
+    Create the table ddl for mysql from the metadata of a mysql table. The metadata can be records (metadata_get.mysql.<function>(output = "record")) or dataframes.
+
+    Args:
+        - column_rule (list or DataFrame): result of metadata_get.mysql.column_rule for one table
+        - primary_key (list or DataFrame): result of metadata_get.mysql.primary_key for one table
+        - relation (list or DataFrame): result of metadata_get.mysql.relation for one table
+        - unique_constraint (list or DataFrame): result of metadata_get.mysql.unique_constraint for one table
+        - check_constraint (list or DataFrame): result of metadata_get.mysql.check_constraint for one table
+        - all_index (list or DataFrame): result of metadata_get.mysql.all_index for one table
+        - table_name (string): name of the table, only used in the error message when column_rule is empty. The default is the table name at the other metadata
+
+    Returns:
+        table_script (string): create table statement of the table
+    """
     product_target: str = "mysql"
-    column_rule_dict = column_rule.to_dict("records")
-    source_data_type_mapper_path = f"module.data_type_mapper"
-    source_data_type_mapper = import_module(source_data_type_mapper_path)
-    source_data_type_mapper_method = getattr(source_data_type_mapper, "mysql")
-    column_rule_script: str = ""
-    for number, attribute in enumerate(column_rule_dict):
-        data_type_func = getattr(source_data_type_mapper_method, attribute["data_type"])
-        data_type_string = data_type_func(product_target, attribute)
-        if attribute["data_type"] in ["char", "varchar", "tinytext", "text", "mediumtext", "longtext"]:
-            data_type_string = f"{data_type_string} set {attribute["char_set"]} collation {attribute["char_collation"]}"
-        elif attribute["data_type"] in ["tinyint", "smallint", "mediumint", "int", "bigint"]:
-            data_type_string = f"{data_type_string} {attribute["integer_type_attribute"]}"
-        if attribute["generated_column_type"] != "" and attribute["default_value"] != "":
-            string = f"`{attribute["column_name"]}` {data_type_string} {attribute["is_nullable"]} generated always as {attribute["default_value"]} {attribute["generated_column_type"]} {attribute["extra"]} {attribute["column_comment"]}"
-        else:
-            string = f"`{attribute["column_name"]}` {data_type_string} {attribute["is_nullable"]} default {attribute["default_value"]} {attribute["extra"]} {attribute["column_comment"]}"
-        if number != 1:
-            string = f"\n    ,{string}"
-        column_rule_script = column_rule_script + string
-    primary_key_name_list: list[str] = primary_key["constraint_name"].drop_duplicates().values.tolist()
-    for primary_key_name in primary_key_name_list:
-        key_column_list: list[str] = primary_key.loc[primary_key['constraint_name'] == primary_key_name]['column_name'].values.tolist()
-        column_string = ""
-        for position, key_column in enumerate(key_column_list):
-            if position != 0:
-                column_string = column_string + ", "
-            column_string = column_string + key_column
-        primary_key_script = f"\n    ,constraint `{primary_key_name}` primary key ({column_string})"
-    relation_list: list[str] = relation['constraint_name'].drop_duplicates().values.tolist()
-    relation_script = ""
-    for relation_name in relation_list:
-        child_column_list = relation.loc[relation['constraint_name'] == relation_name]['column_child'].values.tolist()
-        child_column_string = ""
-        for position, child_column in enumerate(child_column_list):
-            if position != 0:
-                child_column_string = child_column_string + ", "
-            child_column_string = child_column_string + f"`{child_column}`"
-        parent_column_list = relation.loc[relation['constraint_name'] == relation_name]['column_parent'].values.tolist()
-        parent_column_string = ""
-        for position, parent_column in enumerate(parent_column_list):
-            if position != 0:
-                parent_column_string = parent_column_string + ", "
-            parent_column_string = parent_column_string + f"`{parent_column}`"
-        parent_table_name =  relation.loc[relation['constraint_name'] == relation_name]['parent_table_name'].drop_duplicates().values.tolist()[0]
-        on_update_action = relation.loc[relation['constraint_name'] == relation_name]['on_update'].drop_duplicates().values.tolist()[0]
-        on_delete_action = relation.loc[relation['constraint_name'] == relation_name]['on_delete'].drop_duplicates().values.tolist()[0]
-        string = f"\n    ,constraint `{relation_name}` foreign key ({child_column_string}) references `{parent_table_name}` ({parent_column_string}) on update {on_update_action} on delete {on_delete_action}"
-        relation_script = relation_script + string
-    print(column_rule_script)
\ No newline at end of file
+    column_rule = row_list(column_rule)
+    if len(column_rule) == 0:
+        if table_name is None:
+            table_name = next((row['table_name'] for metadata in [primary_key, relation, unique_constraint, check_constraint, all_index] for row in row_list(metadata)), "")
+        raise Exception(f"there is no column metadata for table {table_name}. the table may have been dropped while its metadata was read, or the column metadata was not read for it.")
+    table_name: str = column_rule[0]['table_name']
+    data_type_mapper_dict: dict[str, object] = mapper_table("mysql", product_target)
+    # NOTE: every line of the ddl is collected into a list and joined once, instead of concatenating the string again for every line
+    line_list: list[str] = []
+    for attribute in column_rule:
+        line_list.append(column_definition(attribute, data_type_mapper_dict, product_target))
+    for primary_key_name, key_column in record_group(row_list(primary_key), 'constraint_name').items():
+        line_list.append(f"constraint `{primary_key_name}` primary key ({', '.join(row['column_name'] for row in key_column)})")
+    for relation_name, relation_column in record_group(row_list(relation), 'constraint_name').items():
+        line_list.append(relation_definition(relation_name, relation_column))
+    table_script: str = f"create table `{table_name}` (\n    " + "\n    ,".join(line_list) + "\n);"
+    return table_script
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Module to store the metadata of a schema on disk, so the next run against an unchanged schema does not need to query the whole catalog again.
+The snapshot is saved at root\\result\\metadata_cache, one file for every (host, port, database, schema, server version) and it is only used while the schema fingerprint is still the same.
+"""
+
+import os
+import pickle
+import threading
+from hashlib import sha1
+from pathlib import Path
+from pandas import DataFrame
+
+
+def snapshot_file(connection: object, schema: str, version: str, cache_path: str = os.path.join(str(Path(__file__).parent.parent), "result", "metadata_cache")) -> str:
+    """
+    Get the snapshot file path of a schema.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - version (string): the database engine version, result of metadata_get.<product>.version
+        - cache_path (string): directory path of the snapshot files. The default path will be "root\\result\\metadata_cache"
+
+    Returns:
+        file_path (string): path of the snapshot file
+    """
+    url = connection.engine.url
+    database: str = url.database or url.query.get("service_name", "")
+    key: str = "|".join([str(url.host), str(url.port), str(database), schema, str(version)])
+    file_path: str = os.path.join(cache_path, f"{sha1(key.encode('utf-8')).hexdigest()}.pickle")
+    return file_path
+
+def snapshot_load(file_path: str, fingerprint: str) -> dict[str, DataFrame]:
+    """
+    Get the metadata stored at a snapshot file. Snapshot that was saved with other fingerprint is considered out of date and will not be used.
+
+    Args:
+        - file_path (string): path of the snapshot file, result of snapshot_file()
+        - fingerprint (string): the current schema fingerprint, result of metadata_get.<product>.fingerprint
+
+    Returns:
+        metadata_dict (dictionary): metadata from the snapshot with the metadata_get function name as key. empty if the snapshot does not exist or out of date
+    """
+    if not os.path.isfile(file_path):
+        return {}
+    try:
+        with open(file_path, "rb") as snapshot:
+            data: dict = pickle.load(snapshot)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return {}
+    if data.get("fingerprint") != fingerprint:
+        return {}
+    return data["metadata"]
+
+def snapshot_save(file_path: str, fingerprint: str, metadata_dict: dict[str, DataFrame]) -> None:
+    """
+    Save metadata into a snapshot file. The file is written to a temporary file first and then renamed, so a failed run will not leave a broken snapshot.
+
+    Args:
+        - file_path (string): path of the snapshot file, result of snapshot_file()
+        - fingerprint (string): the schema fingerprint when the metadata was fetched
+        - metadata_dict (dictionary): metadata with the metadata_get function name as key
+    """
+    os.makedirs(os.path.dirname(file_path), exist_ok = True)
+    temporary_file_path: str = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporary_file_path, "wb") as snapshot:
+        pickle.dump({"fingerprint": fingerprint, "metadata": metadata_dict}, snapshot, protocol = pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_file_path, file_path)
@@ -60,7 +60,107 @@ def all_schema(connection: object) -> list[str]:
     data: list[str] = data['schema_name'].values.tolist()
     return data
 
-def all_table(connection:object, schema:str) -> DataFrame:
+def fingerprint(connection: object, schema: str) -> str:
+    """
+    Get a cheap fingerprint of the schema catalog: the total of row and a sum of md5 of every row of the catalog views of the tables, columns, indexes, constraints and foreign key rules. The value will change when a table, column, index or constraint in the schema is created, altered or dropped, also by an ALTER TABLE ... ALGORITHM=INSTANT.
+    Only the data dictionary columns are read. The statistics columns of information_schema.tables (create_time, update_time) are not used, they are statistics that the server can cache (and that are not changed by every ALTER TABLE).
+
+    Args:
+        - connection(object): sqlalchemy connection object
+        - schema(string): name of the schema that the fingerprint want to get extracted
+
+    Returns:
+        data(string): the schema fingerprint
+    """
+    from sqlalchemy.sql import text
+    script = """
+        SELECT 
+            concat(
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,table_type
+                    ,engine
+                    ,table_collation
+                    ,create_options
+                    ,table_comment)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.tables
+            where
+                table_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,column_name
+                    ,ordinal_position
+                    ,column_default
+                    ,is_nullable
+                    ,column_type
+                    ,character_set_name
+                    ,collation_name
+                    ,extra
+                    ,column_comment
+                    ,generation_expression)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.columns
+            where
+                table_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,index_name
+                    ,seq_in_index
+                    ,column_name
+                    ,collation
+                    ,sub_part
+                    ,non_unique
+                    ,index_type
+                    ,index_comment)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.statistics
+            where
+                table_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,constraint_name
+                    ,constraint_type)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.table_constraints
+            where
+                constraint_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,constraint_name
+                    ,column_name
+                    ,ordinal_position
+                    ,referenced_table_name
+                    ,referenced_column_name)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.key_column_usage
+            where
+                constraint_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,constraint_name
+                    ,update_rule
+                    ,delete_rule)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.referential_constraints
+            where
+                constraint_schema = :schema)) as fingerprint"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    data: str = str(data.iloc[0, 0])
+    return data
+
+def all_table(connection:object, schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all name of tables in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -69,11 +169,15 @@ def all_table(connection:object, schema:str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("table_name", include, exclude, "mariadb")
     script = f"""
         select 
             table_name
@@ -83,13 +187,40 @@ def all_table(connection:object, schema:str) -> DataFrame:
         where
             table_type = 'BASE TABLE'
             and
-            table_schema = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            table_schema = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def primary_key(connection: object, schema: str) -> DataFrame:
+def row_estimate(connection: object, schema: str) -> DataFrame:
     """
-    Get all primary key in a schema. The dataframe columns description are:
+    Get the estimated total of row of every table in a schema, taken from the table statistic so no table is scanned. The value can be outdated when the statistic is not refreshed. The dataframe columns description are:
+    - table_name(string): name of all tables inside the schema 
+    - row_estimate(integer): the estimated total of row
+
+    Args:
+        - connection(object): sqlalchemy connection object
+        - schema(string): name of the schema that the metadata want to get extracted
+
+    Returns:
+        data(pandas DataFrame): dataframe containing desired metadata
+    """
+    from sqlalchemy.sql import text
+    script = """
+        select 
+            table_name
+            ,coalesce(table_rows, 0) as row_estimate
+        from
+            INFORMATION_SCHEMA.tables
+        where
+            table_type = 'BASE TABLE'
+            and
+            table_schema = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    return data
+
+def primary_key(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
+    """
+    Get all primary key in a schema, the columns of every key are ordered by their position in the key. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
     - column_name(string): name of all columns that selected as primary key
     - constraint_name(string): name of the constraint that define the primary key
@@ -97,11 +228,15 @@ def primary_key(connection: object, schema: str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("c.table_name", include, exclude, "mariadb")
     script = f"""
     SELECT 
         c.table_name
@@ -120,13 +255,16 @@ def primary_key(connection: object, schema: str) -> DataFrame:
     WHERE 
         c.constraint_type = 'PRIMARY KEY'
         and
-        c.table_schema = '{schema}'
+        c.table_schema = :schema
         and
-        cn.TABLE_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+        cn.TABLE_SCHEMA = :schema{filter_script}
+    ORDER BY
+        c.table_name
+        ,cn.ORDINAL_POSITION"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def relation(connection: object, schema: str) -> DataFrame:
+def relation(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all unique constraint in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -140,11 +278,15 @@ def relation(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("tc.TABLE_NAME", include, exclude, "mariadb")
     script = f"""
         SELECT 
             tc.TABLE_NAME as table_name
@@ -174,13 +316,13 @@ def relation(connection: object, schema: str) -> DataFrame:
         WHERE 
             tc.CONSTRAINT_TYPE = 'FOREIGN KEY'
             and
-            tc.TABLE_SCHEMA = '{schema}'
+            tc.TABLE_SCHEMA = :schema
             and
-            kcu.TABLE_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            kcu.TABLE_SCHEMA = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def unique_constraint(connection: object, schema: str) -> DataFrame:
+def unique_constraint(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all primary key in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -190,11 +332,15 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("c.table_name", include, exclude, "mariadb")
     script = f"""
     SELECT 
         c.table_name
@@ -213,8 +359,8 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
     WHERE 
         c.constraint_type = 'UNIQUE'
         and
-        c.table_schema = '{schema}'
+        c.table_schema = :schema
         and
-        cn.TABLE_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+        cn.TABLE_SCHEMA = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
\ No newline at end of file
@@ -60,7 +60,116 @@ def all_schema(connection: object) -> list[str]:
     data: list[str] = data['schema_name'].values.tolist()
     return data
 
-def all_table(connection:object, schema:str) -> DataFrame:
+def fingerprint(connection: object, schema: str) -> str:
+    """
+    Get a cheap fingerprint of the schema catalog: the total of row and a sum of md5 of every row of the catalog views of the tables, columns, indexes, constraints, foreign key rules and check constraints. The value will change when a table, column, index or constraint in the schema is created, altered or dropped, also by an ALTER TABLE ... ALGORITHM=INSTANT.
+    Only the data dictionary columns are read. The statistics columns of information_schema.tables (create_time, update_time) are not used, mysql 8 cache them for information_schema_stats_expiry seconds.
+
+    Args:
+        - connection(object): sqlalchemy connection object
+        - schema(string): name of the schema that the fingerprint want to get extracted
+
+    Returns:
+        data(string): the schema fingerprint
+    """
+    from sqlalchemy.sql import text
+    script = """
+        SELECT 
+            concat(
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,table_type
+                    ,engine
+                    ,table_collation
+                    ,create_options
+                    ,table_comment)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.tables
+            where
+                table_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,column_name
+                    ,ordinal_position
+                    ,column_default
+                    ,is_nullable
+                    ,column_type
+                    ,character_set_name
+                    ,collation_name
+                    ,extra
+                    ,column_comment
+                    ,generation_expression)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.columns
+            where
+                table_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,index_name
+                    ,seq_in_index
+                    ,column_name
+                    ,collation
+                    ,sub_part
+                    ,non_unique
+                    ,index_type
+                    ,index_comment)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.statistics
+            where
+                table_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,constraint_name
+                    ,constraint_type)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.table_constraints
+            where
+                constraint_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,constraint_name
+                    ,column_name
+                    ,ordinal_position
+                    ,referenced_table_name
+                    ,referenced_column_name)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.key_column_usage
+            where
+                constraint_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,table_name
+                    ,constraint_name
+                    ,update_rule
+                    ,delete_rule)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.referential_constraints
+            where
+                constraint_schema = :schema)
+            ,'|',
+            (select 
+                concat(count(*), ':', coalesce(sum(cast(conv(substr(md5(concat_ws('|'
+                    ,constraint_name
+                    ,check_clause)), 1, 16), 16, 10) as unsigned)), 0))
+            from
+                information_schema.check_constraints
+            where
+                constraint_schema = :schema)) as fingerprint"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    data: str = str(data.iloc[0, 0])
+    return data
+
+def all_table(connection:object, schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all name of tables in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -69,11 +178,15 @@ def all_table(connection:object, schema:str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("table_name", include, exclude, "mysql")
     script = f"""
         select 
             table_name
@@ -83,11 +196,38 @@ def all_table(connection:object, schema:str) -> DataFrame:
         where
             table_type = 'BASE TABLE'
             and
-            table_schema = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            table_schema = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def column_rule(connection:object, schema:str) -> DataFrame:
+def row_estimate(connection: object, schema: str) -> DataFrame:
+    """
+    Get the estimated total of row of every table in a schema, taken from the table statistic so no table is scanned. The value can be outdated when the statistic is not refreshed. The dataframe columns description are:
+    - table_name(string): name of all tables inside the schema 
+    - row_estimate(integer): the estimated total of row
+
+    Args:
+        - connection(object): sqlalchemy connection object
+        - schema(string): name of the schema that the metadata want to get extracted
+
+    Returns:
+        data(pandas DataFrame): dataframe containing desired metadata
+    """
+    from sqlalchemy.sql import text
+    script = """
+        select 
+            table_name
+            ,coalesce(table_rows, 0) as row_estimate
+        from
+            INFORMATION_SCHEMA.tables
+        where
+            table_type = 'BASE TABLE'
+            and
+            table_schema = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    return data
+
+def column_rule(connection:object, schema:str, include: list[str] = None, exclude: list[str] = None, output: str = "dataframe") -> DataFrame:
     """
     Get all primary key in a schema. The dataframe columns description are:
     - table_name(string): name of the table
@@ -111,11 +251,16 @@ def column_rule(connection:object, schema:str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
+        - output(string): 'dataframe' to get a dataframe, 'record' to get a list of metadata_record.column_record (without creating any dataframe)
 
     Returns:
-        data(pandas DataFrame): dataframe containing desired metadata
+        data(pandas DataFrame or list): dataframe (or records) containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("table_name", include, exclude, "mysql")
     script = f"""
         SELECT 
             table_name
@@ -171,16 +316,20 @@ def column_rule(connection:object, schema:str) -> DataFrame:
         from
             information_schema.columns
         where
-            TABLE_SCHEMA = '{schema}'
+            TABLE_SCHEMA = :schema{filter_script}
         order by
             table_name asc
             ,ordinal_position asc"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+    result = connection.execute(text(script).bindparams(*filter_bind), {"schema": schema})
+    if output == "record":
+        from ..metadata_record import record_list, column_record
+        return record_list(result, column_record)
+    data: DataFrame = DataFrame(result)
     return data
 
-def primary_key(connection: object, schema: str) -> DataFrame:
+def primary_key(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None, output: str = "dataframe") -> DataFrame:
     """
-    Get all primary key in a schema. The dataframe columns description are:
+    Get all primary key in a schema, the columns of every key are ordered by their position in the key. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
     - column_name(string): name of all columns that selected as primary key
     - constraint_name(string): name of the constraint that define the primary key
@@ -188,11 +337,16 @@ def primary_key(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
+        - output(string): 'dataframe' to get a dataframe, 'record' to get a list of metadata_record.key_record (without creating any dataframe)
 
     Returns:
-        data(pandas DataFrame): dataframe containing desired metadata
+        data(pandas DataFrame or list): dataframe (or records) containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("c.table_name", include, exclude, "mysql")
     script = f"""
         SELECT 
             c.table_name
@@ -211,13 +365,20 @@ def primary_key(connection: object, schema: str) -> DataFrame:
         WHERE 
             c.constraint_type = 'PRIMARY KEY'
             and
-            c.table_schema = '{schema}'
+            c.table_schema = :schema
             and
-            cn.TABLE_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            cn.TABLE_SCHEMA = :schema{filter_script}
+        ORDER BY
+            c.table_name
+            ,cn.ORDINAL_POSITION"""
+    result = connection.execute(text(script).bindparams(*filter_bind), {"schema": schema})
+    if output == "record":
+        from ..metadata_record import record_list, key_record
+        return record_list(result, key_record)
+    data: DataFrame = DataFrame(result)
     return data
 
-def relation(connection: object, schema: str) -> DataFrame:
+def relation(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None, output: str = "dataframe") -> DataFrame:
     """
     Get all unique constraint in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -231,11 +392,16 @@ def relation(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
+        - output(string): 'dataframe' to get a dataframe, 'record' to get a list of metadata_record.relation_record (without creating any dataframe)
 
     Returns:
-        data(pandas DataFrame): dataframe containing desired metadata
+        data(pandas DataFrame or list): dataframe (or records) containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("tc.TABLE_NAME", include, exclude, "mysql")
     script = f"""
         SELECT 
             tc.TABLE_NAME as table_name
@@ -265,13 +431,21 @@ def relation(connection: object, schema: str) -> DataFrame:
         WHERE 
             tc.CONSTRAINT_TYPE = 'FOREIGN KEY'
             and
-            tc.TABLE_SCHEMA = '{schema}'
+            tc.TABLE_SCHEMA = :schema
             and
-            kcu.TABLE_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            kcu.TABLE_SCHEMA = :schema{filter_script}
+        ORDER BY
+            tc.TABLE_NAME
+            ,tc.CONSTRAINT_NAME
+            ,kcu.ORDINAL_POSITION"""
+    result = connection.execute(text(script).bindparams(*filter_bind), {"schema": schema})
+    if output == "record":
+        from ..metadata_record import record_list, relation_record
+        return record_list(result, relation_record)
+    data: DataFrame = DataFrame(result)
     return data
 
-def unique_constraint(connection: object, schema: str) -> DataFrame:
+def unique_constraint(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None, output: str = "dataframe") -> DataFrame:
     """
     Get all primary key in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -281,11 +455,16 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
+        - output(string): 'dataframe' to get a dataframe, 'record' to get a list of metadata_record.key_record (without creating any dataframe)
 
     Returns:
-        data(pandas DataFrame): dataframe containing desired metadata
+        data(pandas DataFrame or list): dataframe (or records) containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("c.table_name", include, exclude, "mysql")
     script = f"""
         SELECT 
             c.table_name
@@ -304,13 +483,21 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
         WHERE 
             c.constraint_type = 'UNIQUE'
             and
-            c.table_schema = '{schema}'
+            c.table_schema = :schema
             and
-            cn.TABLE_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            cn.TABLE_SCHEMA = :schema{filter_script}
+        ORDER BY
+            c.table_name
+            ,c.constraint_name
+            ,cn.ORDINAL_POSITION"""
+    result = connection.execute(text(script).bindparams(*filter_bind), {"schema": schema})
+    if output == "record":
+        from ..metadata_record import record_list, key_record
+        return record_list(result, key_record)
+    data: DataFrame = DataFrame(result)
     return data
 
-def check_constraint(connection: object, schema: str) -> DataFrame:
+def check_constraint(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None, output: str = "dataframe") -> DataFrame:
     """
     Get all primary key in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -320,11 +507,16 @@ def check_constraint(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
+        - output(string): 'dataframe' to get a dataframe, 'record' to get a list of metadata_record.check_record (without creating any dataframe)
 
     Returns:
-        data(pandas DataFrame): dataframe containing desired metadata
+        data(pandas DataFrame or list): dataframe (or records) containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.TABLE_NAME", include, exclude, "mysql")
     script = f"""
         select 
             a.TABLE_NAME as table_name
@@ -341,13 +533,17 @@ def check_constraint(connection: object, schema: str) -> DataFrame:
         where 
             a.CONSTRAINT_TYPE = 'CHECK'
             and
-            a.CONSTRAINT_SCHEMA = '{schema}'
+            a.CONSTRAINT_SCHEMA = :schema
             and 
-            b.CONSTRAINT_NAME = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            b.CONSTRAINT_SCHEMA = :schema{filter_script}"""
+    result = connection.execute(text(script).bindparams(*filter_bind), {"schema": schema})
+    if output == "record":
+        from ..metadata_record import record_list, check_record
+        return record_list(result, check_record)
+    data: DataFrame = DataFrame(result)
     return data
 
-def all_index(connection: object, schema: str) -> DataFrame:
+def all_index(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None, output: str = "dataframe") -> DataFrame:
     """
     Get all primary key in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -362,11 +558,16 @@ def all_index(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
+        - output(string): 'dataframe' to get a dataframe, 'record' to get a list of metadata_record.index_record (without creating any dataframe)
 
     Returns:
-        data(pandas DataFrame): dataframe containing desired metadata
+        data(pandas DataFrame or list): dataframe (or records) containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("TABLE_NAME", include, exclude, "mysql")
     script = f"""
         SELECT 
             TABLE_NAME as table_name
@@ -396,6 +597,10 @@ def all_index(connection: object, schema: str) -> DataFrame:
         FROM 
             information_schema.statistics
         where
-            INDEX_SCHEMA = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            INDEX_SCHEMA = :schema{filter_script}"""
+    result = connection.execute(text(script).bindparams(*filter_bind), {"schema": schema})
+    if output == "record":
+        from ..metadata_record import record_list, index_record
+        return record_list(result, index_record)
+    data: DataFrame = DataFrame(result)
     return data
\ No newline at end of file
@@ -29,7 +29,50 @@ def url(*, user: str, password: str, host: str, port: str, database: str) -> str
     url_string: str = f"oracle+cx_oracle://{user}:{quote_plus(password)}@{host}:{port}/?service_name={database}"
     return url_string
 
-def all_table(connection:object, schema:str) -> DataFrame:
+def version(connection: object) -> str:
+    """
+    Get the version of database. This will affect metadata table composition.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+
+    Returns:
+        data (string): the database engine version
+    """
+    script = f"""
+        SELECT 
+            version
+        FROM 
+            product_component_version
+        WHERE 
+            product like 'Oracle%'"""
+    data: DataFrame = DataFrame(connection.execute(text(script)))
+    data: str = data.iloc[0, 0]
+    return data
+
+def fingerprint(connection: object, schema: str) -> str:
+    """
+    Get a cheap fingerprint of the schema catalog from LAST_DDL_TIME of all_objects. The value will change when an object in the schema is created, altered or dropped.
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema that the fingerprint want to get extracted
+
+    Returns:
+        data (string): the schema fingerprint
+    """
+    script = """
+        SELECT 
+            count(*) || '|' || to_char(max(last_ddl_time), 'YYYYMMDDHH24MISS') as fingerprint
+        FROM 
+            all_objects
+        WHERE 
+            owner = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    data: str = str(data.iloc[0, 0])
+    return data
+
+def all_table(connection:object, schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all name of tables in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -38,11 +81,14 @@ def all_table(connection:object, schema:str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         data (pandas DataFrame): dataframe containing desired metadata
     """
-    schema: str = schema
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.table_name", include, exclude, "oracle")
     script = f"""
         SELECT 
             a.table_name
@@ -56,13 +102,37 @@ def all_table(connection:object, schema:str) -> DataFrame:
                 and
                 a.table_name = b.table_name
         WHERE 
-            a.owner = '{schema}'
+            a.owner = :schema
             and
-            b.owner = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            b.owner = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
+    return data
+
+def row_estimate(connection:object, schema:str) -> DataFrame:
+    """
+    Get the estimated total of row of every table in a schema, taken from the table statistic so no table is scanned. The value can be outdated when the statistic is not refreshed. The dataframe columns description are:
+    - table_name(string): name of all tables inside the schema 
+    - row_estimate(integer): the estimated total of row
+
+    Args:
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema that the metadata want to get extracted
+
+    Returns:
+        data (pandas DataFrame): dataframe containing desired metadata
+    """
+    script = """
+        SELECT 
+            table_name
+            ,nvl(num_rows, 0) as row_estimate
+        FROM 
+            all_tables
+        WHERE 
+            owner = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
     return data
 
-def column_rule(connection:object,schema:str) -> DataFrame:
+def column_rule(connection:object,schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all columns name, data type and nullability in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -78,11 +148,14 @@ def column_rule(connection:object,schema:str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         DataFrame: dataframe containing desired metadata
     """
-    schema: str = schema
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.table_name", include, exclude, "oracle")
     script = f"""
         SELECT 	
             a.table_name
@@ -106,15 +179,15 @@ def column_rule(connection:object,schema:str) -> DataFrame:
                 and
                 a.column_name = b.column_name
         WHERE
-            a.owner = '{schema}'
+            a.owner = :schema
             and
-            b.owner = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            b.owner = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def primary_key(connection:object,schema:str) -> DataFrame:
+def primary_key(connection:object,schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
-    Get all primary key in a schema. The dataframe columns description are:
+    Get all primary key in a schema, the columns of every key are ordered by their position in the key. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
     - column_name(string): name of all columns that selected as primary key
     - constraint_name(string): name of the constraint that define the primary key
@@ -122,11 +195,14 @@ def primary_key(connection:object,schema:str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         DataFrame: dataframe containing desired metadata
     """
-    schema: str = schema
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.table_name", include, exclude, "oracle")
     script = f"""
         SELECT 
             a.table_name
@@ -145,11 +221,14 @@ def primary_key(connection:object,schema:str) -> DataFrame:
         WHERE 
             a.constraint_type = 'P'
             and
-            a.owner = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            a.owner = :schema{filter_script}
+        ORDER BY
+            a.table_name
+            ,b.position"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def unique_constraint(connection:object,schema:str) -> DataFrame:
+def unique_constraint(connection:object,schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all unique constraint in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -159,11 +238,14 @@ def unique_constraint(connection:object,schema:str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         DataFrame: dataframe containing desired metadata
     """
-    schema: str = schema
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.table_name", include, exclude, "oracle")
     script = f"""
         SELECT 
             a.table_name
@@ -182,13 +264,13 @@ def unique_constraint(connection:object,schema:str) -> DataFrame:
         WHERE 
             a.constraint_type = 'U'
             and
-            a.owner = '{schema}'
+            a.owner = :schema
             and
-            b.owner = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            b.owner = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def check_constraint(connection:object,schema:str) -> DataFrame:
+def check_constraint(connection:object,schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all unique constraint in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -199,11 +281,14 @@ def check_constraint(connection:object,schema:str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         DataFrame: dataframe containing desired metadata
     """
-    schema: str = schema
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.table_name", include, exclude, "oracle")
     script = f"""
         select
             a.table_name
@@ -233,13 +318,13 @@ def check_constraint(connection:object,schema:str) -> DataFrame:
             and
             c.nullable = 'Y'
             and
-            a.owner = '{schema}'
+            a.owner = :schema
             and
-            b.owner = '{schema}'
+            b.owner = :schema
             and
-            c.owner = '{schema}'
+            c.owner = :schema{filter_script}
         """
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     data['search_condition'] = data['search_condition'].replace("\s+", " ", regex=True).str.strip()
     data['search_condition'] = data['search_condition'].replace("\(\s", "(", regex=True)
     data['search_condition'] = data['search_condition'].replace("\s\)", ")", regex=True)
@@ -247,7 +332,7 @@ def check_constraint(connection:object,schema:str) -> DataFrame:
     data['search_condition'] = data['search_condition'].replace("\s,", ",", regex=True)
     return data
 
-def relation(connection:object,schema:str) -> DataFrame:
+def relation(connection:object,schema:str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all unique constraint in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -261,11 +346,14 @@ def relation(connection:object,schema:str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         DataFrame: dataframe containing desired metadata
     """
-    schema: str = schema
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("a.table_name", include, exclude, "oracle")
     script = f"""
         SELECT
             a.table_name
@@ -306,14 +394,14 @@ def relation(connection:object,schema:str) -> DataFrame:
             AND 
             c.constraint_type IN ('P','U')
             AND
-            a.owner = '{schema}'
+            a.owner = :schema
             and
-            b.owner = '{schema}'
+            b.owner = :schema
             AND 
-            c.owner = '{schema}'
+            c.owner = :schema
             and
-            d.owner = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            d.owner = :schema{filter_script}"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
 def unique_index(connection:object,schema:str) -> DataFrame:
@@ -328,8 +416,7 @@ def unique_index(connection:object,schema:str) -> DataFrame:
     Returns:
         DataFrame: dataframe containing desired metadata
     """
-    schema: str = schema
-    script = f'''
+    script = '''
         SELECT 
             all_indexes.table_name AS "table_name"
             ,all_ind_columns.column_name AS "column_name"
@@ -353,7 +440,7 @@ def unique_index(connection:object,schema:str) -> DataFrame:
                 AND 
                 all_indexes.owner = ALL_CONSTRAINTS.owner
         WHERE 
-            all_indexes.table_owner = '{schema}'
+            all_indexes.table_owner = :schema
             AND
             all_indexes.uniqueness = 'UNIQUE'
             AND 
@@ -362,5 +449,5 @@ def unique_index(connection:object,schema:str) -> DataFrame:
             (ALL_CONSTRAINTS.CONSTRAINT_TYPE NOT IN ('P','U')
             OR 
             ALL_CONSTRAINTS.CONSTRAINT_TYPE IS NULL)'''
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
     raise NotImplementedError('Function still in development')
\ No newline at end of file
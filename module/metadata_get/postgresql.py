@@ -63,7 +63,53 @@ def all_schema(connection: object) -> list[str]:
     data: list[str] = data['schema_name'].values.tolist()
     return data
 
-def all_table(connection: object, schema: str) -> DataFrame:
+def fingerprint(connection: object, schema: str) -> str:
+    """
+    Get a cheap fingerprint of the schema catalog from the oid and xmin of pg_class, pg_attribute and pg_constraint. The value will change when a table, column or constraint in the schema is created, altered or dropped.
+
+    Args:
+        - connection(object): sqlalchemy connection object
+        - schema(string): name of the schema that the fingerprint want to get extracted
+
+    Returns:
+        data(string): the schema fingerprint
+    """
+    from sqlalchemy.sql import text
+    script = """
+        SELECT 
+            (select 
+                count(*) || ':' || coalesce(sum(c.oid::int8), 0) || ':' || coalesce(max(c.xmin::text::int8), 0)
+            from
+                pg_catalog.pg_class c
+            where
+                c.relnamespace = n.oid)
+            || '|' ||
+            (select 
+                count(*) || ':' || coalesce(max(a.xmin::text::int8), 0)
+            from
+                pg_catalog.pg_attribute a
+                join
+                pg_catalog.pg_class c
+                on
+                    a.attrelid = c.oid
+            where
+                c.relnamespace = n.oid)
+            || '|' ||
+            (select 
+                count(*) || ':' || coalesce(sum(co.oid::int8), 0) || ':' || coalesce(max(co.xmin::text::int8), 0)
+            from
+                pg_catalog.pg_constraint co
+            where
+                co.connamespace = n.oid) as fingerprint
+        FROM 
+            pg_catalog.pg_namespace n
+        WHERE 
+            n.nspname = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    data: str = str(data.iloc[0, 0])
+    return data
+
+def all_table(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all name of tables in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -72,11 +118,15 @@ def all_table(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("c.relname", include, exclude, "postgresql")
     script = f"""
         SELECT
             c.relname AS table_name
@@ -88,15 +138,46 @@ def all_table(connection: object, schema: str) -> DataFrame:
             ON 
                 c.relnamespace = n.oid
         WHERE
-            n.nspname = '{schema}'
+            n.nspname = :schema{filter_script}
             AND 
             c.relkind = 'r'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def primary_key(connection: object, schema: str) -> DataFrame:
+def row_estimate(connection: object, schema: str) -> DataFrame:
     """
-    Get all primary key in a schema. The dataframe columns description are:
+    Get the estimated total of row of every table in a schema, taken from the table statistic so no table is scanned. The value can be outdated when the statistic is not refreshed. The dataframe columns description are:
+    - table_name(string): name of all tables inside the schema 
+    - row_estimate(integer): the estimated total of row
+
+    Args:
+        - connection(object): sqlalchemy connection object
+        - schema(string): name of the schema that the metadata want to get extracted
+
+    Returns:
+        data(pandas DataFrame): dataframe containing desired metadata
+    """
+    from sqlalchemy.sql import text
+    script = """
+        SELECT
+            c.relname AS table_name
+            ,greatest(c.reltuples, 0)::bigint AS row_estimate
+        FROM
+            pg_class c
+            JOIN
+            pg_namespace n 
+            ON 
+                c.relnamespace = n.oid
+        WHERE
+            n.nspname = :schema
+            AND 
+            c.relkind = 'r'"""
+    data: DataFrame = DataFrame(connection.execute(text(script), {"schema": schema}))
+    return data
+
+def primary_key(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
+    """
+    Get all primary key in a schema, the columns of every key are ordered by their position in the key. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
     - column_name(string): name of all columns that selected as primary key
     - constraint_name(string): name of the constraint that define the primary key
@@ -104,11 +185,15 @@ def primary_key(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("cl.relname", include, exclude, "postgresql")
     script = f"""
         with
             data_1 as (
@@ -116,6 +201,7 @@ def primary_key(connection: object, schema: str) -> DataFrame:
                     s.nspname as "schema"
                     ,cl.relname as table_name
                     ,unnest (c.conkey) as column_name_id
+                    ,generate_subscripts (c.conkey, 1) as key_position
                     ,c.conname as constraint_name
                 from 
                     pg_catalog.pg_constraint c
@@ -130,7 +216,7 @@ def primary_key(connection: object, schema: str) -> DataFrame:
                 where 
                     c.contype = 'p'
                     and
-                    s.nspname = '{schema}')
+                    s.nspname = :schema{filter_script})
         select 
             data_1.table_name
             ,cp.column_name 
@@ -146,11 +232,14 @@ def primary_key(connection: object, schema: str) -> DataFrame:
                 and
                 data_1.column_name_id = cp.ordinal_position
         where
-            cp.table_schema = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            cp.table_schema = :schema
+        order by
+            data_1.table_name
+            ,data_1.key_position"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def relation(connection: object, schema: str) -> DataFrame:
+def relation(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all unique constraint in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -164,11 +253,15 @@ def relation(connection: object, schema: str) -> DataFrame:
     Args:
         - connection(object): sqlalchemy connection object
         - schema(string): name of the schema that the metadata want to get extracted
+        - include(list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude(list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("cp.relname", include, exclude, "postgresql")
     script = f"""
         with 
             data_1 as (
@@ -198,7 +291,7 @@ def relation(connection: object, schema: str) -> DataFrame:
                 WHERE
                     con.contype = 'f'
                     and
-                    s.nspname  = '{schema}')
+                    s.nspname  = :schema{filter_script})
         select 
             data_1.table_name
             ,data_1.parent_table_name
@@ -226,11 +319,11 @@ def relation(connection: object, schema: str) -> DataFrame:
                 and
                 data_1.column_parent_id = cpn.ordinal_position 
         where 
-            ccn.table_schema = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            ccn.table_schema = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
 
-def unique_constraint(connection: object, schema: str) -> DataFrame:
+def unique_constraint(connection: object, schema: str, include: list[str] = None, exclude: list[str] = None) -> DataFrame:
     """
     Get all primary key in a schema. The dataframe columns description are:
     - table_name(string): name of all tables inside the schema 
@@ -240,11 +333,15 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
     Args:
         - connection (object): sqlalchemy connection object
         - schema (string): name of the schema that the metadata want to get extracted
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query
+        - exclude (list): table name or glob pattern of the tables to skip
 
     Returns:
         data(pandas DataFrame): dataframe containing desired metadata
     """
     from sqlalchemy.sql import text
+    from ..table_filter import table_filter
+    filter_script, filter_bind = table_filter("cl.relname", include, exclude, "postgresql")
     script = f"""
         with
             data_1 as (
@@ -266,7 +363,7 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
                 where 
                     c.contype = 'u'
                     and
-                    s.nspname = '{schema}')
+                    s.nspname = :schema{filter_script})
         select 
             data_1.table_name
             ,cp.column_name 
@@ -282,6 +379,6 @@ def unique_constraint(connection: object, schema: str) -> DataFrame:
                 and
                 data_1.column_name_id = cp.ordinal_position
         where
-            cp.table_schema = '{schema}'"""
-    data: DataFrame = DataFrame(connection.execute(text(script)))
+            cp.table_schema = :schema"""
+    data: DataFrame = DataFrame(connection.execute(text(script).bindparams(*filter_bind), {"schema": schema}))
     return data
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Module to store the metadata of a schema as compact records instead of dataframes. A record is a __slots__ object with one attribute per metadata column, filled directly from the row of the catalog query.
+The records can be read like a dictionary (record['column_name']), so the data_type_mapper and ddl_mapper functions work with both a record and a dataframe row. Dataframe is only created with record_frame() when the metadata is exported.
+- column_record = one row of metadata_get.<product>.column_rule
+- key_record = one row of metadata_get.<product>.primary_key or unique_constraint
+- relation_record = one row of metadata_get.<product>.relation
+- check_record = one row of metadata_get.<product>.check_constraint
+- index_record = one row of metadata_get.<product>.all_index
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+class record:
+    '''
+    Base class of every metadata record. The subclass only need to define __slots__ with the metadata column names, in the same order as the catalog query.
+
+    Args:
+        - value: value of every column, in the same order as __slots__
+    '''
+    __slots__ = ()
+
+    def __init__(self, *value) -> None:
+        for name, item in zip(self.__slots__, value):
+            setattr(self, name, item)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name} = {getattr(self, name)!r}' for name in self.__slots__)})"
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.values() == other.values()
+
+    def __getitem__(self, name: str) -> object:
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __getstate__(self) -> tuple:
+        return self.values()
+
+    def __setstate__(self, state: tuple) -> None:
+        self.__init__(*state)
+
+    def get(self, name: str, default: object = None) -> object:
+        return getattr(self, name, default)
+
+    def keys(self) -> tuple[str, ...]:
+        return self.__slots__
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+
+class column_record(record):
+    __slots__ = ("table_name", "column_name", "ordinal_position", "is_nullable", "column_comment", "default_value", "data_type", "char_max_length", "char_max_size", "char_set", "char_collation", "integer_type_attribute", "numeric_precision", "numeric_scale", "datetime_precision", "generated_column_type", "extra")
+
+
+class key_record(record):
+    __slots__ = ("table_name", "column_name", "constraint_name")
+
+
+class relation_record(record):
+    __slots__ = ("table_name", "parent_table_name", "column_child", "column_parent", "constraint_name", "on_update", "on_delete")
+
+
+class check_record(record):
+    __slots__ = ("table_name", "constraint_name", "constraint_expression")
+
+
+class index_record(record):
+    __slots__ = ("table_name", "index_name", "index_type", "collation", "nullable", "is_unique", "index_comment", "column_expression_cardinality", "column_expression")
+
+
+# NOTE: record class of every metadata_get function that can give records
+record_class_dict: dict[str, type] = {
+    "column_rule": column_record,
+    "primary_key": key_record,
+    "unique_constraint": key_record,
+    "relation": relation_record,
+    "check_constraint": check_record,
+    "all_index": index_record}
+
+
+def record_list(result: object, record_class: type) -> list[record]:
+    """
+    Create the records from the result of a catalog query. The result column is matched by name (not case sensitive), so the query column order does not need to follow __slots__.
+
+    Args:
+        - result (object): sqlalchemy result of the catalog query (example: connection.execute(text(script)))
+        - record_class (class): the record class (example: column_record)
+
+    Returns:
+        data (list): one record for every row
+    """
+    key_list: list[str] = [str(key).lower() for key in result.keys()]
+    missing_list: list[str] = [name for name in record_class.__slots__ if name not in key_list]
+    if len(missing_list) != 0:
+        raise ValueError(f"the catalog query does not have column {', '.join(missing_list)} for {record_class.__name__}")
+    position_list: list[int] = [key_list.index(name) for name in record_class.__slots__]
+    if position_list == list(range(len(position_list))) and len(key_list) == len(position_list):
+        return [record_class(*row) for row in result]
+    return [record_class(*[row[position] for position in position_list]) for row in result]
+
+def record_group(data: Iterator[record], name: str = "table_name") -> dict[object, list[record]]:
+    """
+    Split records by the value of one attribute, keeping the order of the records.
+
+    Args:
+        - data (iterable): records, or dataframe rows as dictionary
+        - name (string): name of the attribute to split by
+
+    Returns:
+        data_dict (dictionary): records of every value, with the value as key
+    """
+    data_dict: dict[object, list[record]] = {}
+    for row in data:
+        data_dict.setdefault(row[name], []).append(row)
+    return data_dict
+
+def record_frame(data: list[record], record_class: type) -> DataFrame:
+    """
+    Create a dataframe from records, for exporting the metadata.
+
+    Args:
+        - data (list): records of one record class
+        - record_class (class): the record class, used for the dataframe columns when there is no record
+
+    Returns:
+        data (pandas DataFrame): dataframe with one column for every attribute of the record class
+    """
+    from pandas import DataFrame
+    return DataFrame([row.values() for row in data], columns = list(record_class.__slots__))
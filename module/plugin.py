@@ -0,0 +1,44 @@
+"""
+Registry of the product plugins. A plugin is a module named by the database product inside a plugin package (example: module.metadata_get.mysql), and it is only imported when the product is actually selected.
+- plugin_list = to get all available product of a plugin package
+- plugin_get = to get (and import once) the plugin module of a product
+"""
+
+from importlib import import_module
+from pkgutil import iter_modules
+from types import ModuleType
+
+plugin_cache: dict[tuple[str, str], ModuleType] = {}
+
+
+def plugin_list(kind: str) -> list[str]:
+    """
+    Get all available product of a plugin package without importing them.
+
+    Args:
+        - kind (string): name of the plugin package (example: metadata_get, ddl_mapper)
+
+    Returns:
+        product_list (list): name of every product that have a plugin module
+    """
+    package = import_module(f"{__package__}.{kind}")
+    product_list: list[str] = sorted(plugin.name for plugin in iter_modules(package.__path__))
+    return product_list
+
+def plugin_get(kind: str, product: str) -> ModuleType:
+    """
+    Get the plugin module of a product. The module is imported on the first call and taken from the cache on the next call.
+
+    Args:
+        - kind (string): name of the plugin package (example: metadata_get, ddl_mapper)
+        - product (string): the database product name (example: postgresql, mysql) in lowercase
+
+    Returns:
+        plugin (module): the plugin module of the product
+    """
+    key: tuple[str, str] = (kind, product)
+    if key not in plugin_cache:
+        if product not in plugin_list(kind):
+            raise Exception(f"{product} is not available for {kind}. available product: {', '.join(plugin_list(kind))}")
+        plugin_cache[key] = import_module(f"{__package__}.{kind}.{product}")
+    return plugin_cache[key]
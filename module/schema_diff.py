@@ -0,0 +1,198 @@
+"""
+Module to compare the metadata of a schema at the source and at the target, and create only the ddl needed to make the target the same as the source.
+Every table get a fingerprint (hash of its metadata rows), so only the tables with different fingerprint are compared further.
+The alter statements follow mysql syntax, the only product that have all metadata needed (see metadata_get.mysql).
+- row_text = to get the text of every metadata row, used for the fingerprint
+- table_fingerprint = to get the fingerprint of the metadata of one table
+- fingerprint_dict = to get the fingerprint of every table in a schema
+- table_diff = to create the ddl that change one table at the target into the table at the source
+"""
+
+from __future__ import annotations
+import json
+from hashlib import sha1
+from re import match
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas
+
+diff_metadata_list: list[str] = ["column_rule", "primary_key", "relation", "unique_constraint", "check_constraint", "all_index"]
+
+
+def row_text(data: pandas.DataFrame) -> tuple[list[str], list[str]]:
+    """
+    Get the text of every metadata row (without table_name), with the columns in name order. The whole dataframe is converted at once instead of row by row.
+
+    Args:
+        - data (DataFrame): metadata that have table_name column
+
+    Returns:
+        - table_list (list): table name of every row
+        - text_list (list): text of every row
+    """
+    if data is None or len(data) == 0 or 'table_name' not in data.columns:
+        return [], []
+    column_list: list[str] = sorted(column for column in data.columns if column != 'table_name')
+    text_list: list[str] = [json.dumps(row) for row in data[column_list].astype(str).values.tolist()]
+    return data['table_name'].values.tolist(), text_list
+
+def table_fingerprint(table_metadata: dict[str, pandas.DataFrame]) -> str:
+    """
+    Get the fingerprint of the metadata of one table. The rows of every metadata are sorted first, so the fingerprint does not depend on the catalog query order.
+
+    Args:
+        - table_metadata (dictionary): metadata of the table with the metadata_get function name as key (see diff_metadata_list)
+
+    Returns:
+        fingerprint (string): sha1 of the metadata
+    """
+    digest = sha1()
+    for metadata_name in diff_metadata_list:
+        digest.update(f"\n#{metadata_name}\n".encode("utf-8"))
+        digest.update("\n".join(sorted(row_text(table_metadata.get(metadata_name))[1])).encode("utf-8"))
+    return digest.hexdigest()
+
+def fingerprint_dict(metadata_dict: dict[str, pandas.DataFrame]) -> dict[str, str]:
+    """
+    Get the fingerprint of every table in a schema, the same as table_fingerprint() of every table. Every metadata is converted to text once for the whole schema, instead of splitting it per table first.
+
+    Args:
+        - metadata_dict (dictionary): metadata of the schema with the metadata_get function name as key, it must have all_table and every metadata at diff_metadata_list
+
+    Returns:
+        data (dictionary): fingerprint of every table, with the table name as key
+    """
+    table_list: list[str] = metadata_dict["all_table"]['table_name'].values.tolist() if len(metadata_dict["all_table"]) != 0 else []
+    text_dict: dict[tuple[str, str], list[str]] = {}
+    for metadata_name in diff_metadata_list:
+        for table, text in zip(*row_text(metadata_dict[metadata_name])):
+            text_dict.setdefault((table, metadata_name), []).append(text)
+    data: dict[str, str] = {}
+    for table in table_list:
+        digest = sha1()
+        for metadata_name in diff_metadata_list:
+            digest.update(f"\n#{metadata_name}\n".encode("utf-8"))
+            digest.update("\n".join(sorted(text_dict.get((table, metadata_name), []))).encode("utf-8"))
+        data[table] = digest.hexdigest()
+    return data
+
+def group_dict(data: pandas.DataFrame, key: str, sort_column: str = None) -> dict[str, list[dict]]:
+    """
+    Get the rows of every constraint or index of a table as records, so two tables can be compared by name.
+    """
+    if data is None or len(data) == 0:
+        return {}
+    if sort_column is not None:
+        data = data.sort_values(sort_column, kind = "stable")
+    return {name: [record_clean(record) for record in rows.drop(columns = ['table_name'], errors = 'ignore').to_dict("records")] for name, rows in data.groupby(key, sort = False)}
+
+def record_clean(record: dict) -> dict:
+    """
+    Turn every null value (None, NaN, NaT) of a metadata record into None, so two records with null can be compared.
+    """
+    return {key: (None if value is None or value != value else value) for key, value in record.items()}
+
+def index_column(row_list: list[dict]) -> str:
+    """
+    Get the column list of an index definition from its metadata_get.mysql.all_index rows.
+    """
+    column_list: list[str] = []
+    for row in row_list:
+        expression: str = str(row['column_expression'])
+        prefix = match(r"^(\w+)(\(\d+\))?$", expression)
+        # NOTE: column (with optional prefix length) is quoted, functional index expression is wrapped in parentheses
+        if prefix is not None:
+            expression = f"`{prefix.group(1)}`{prefix.group(2) or ''}"
+        else:
+            expression = f"({expression})"
+        if row['collation'] == "D":
+            expression = expression + " desc"
+        column_list.append(expression)
+    return ", ".join(column_list)
+
+def table_diff(table: str, source_metadata: dict[str, pandas.DataFrame], target_metadata: dict[str, pandas.DataFrame], ddl_mapper: object, data_type_mapper_dict: dict[str, object], product_target: str) -> tuple[list[str], list[str], list[str]]:
+    """
+    Create the ddl that change one table at the target into the table at the source.
+    The statements are split in three parts so the caller can run every part of all tables in order: the foreign keys are dropped first and created last, so they never point to a column or key that is not ready yet.
+
+    Args:
+        - table (string): name of the table
+        - source_metadata (dictionary): metadata of the table at the source with the metadata_get function name as key
+        - target_metadata (dictionary): metadata of the table at the target with the metadata_get function name as key
+        - ddl_mapper (module): ddl_mapper.<source product> module, which have column_definition() and relation_definition()
+        - data_type_mapper_dict (dictionary): result of data_type_mapper.mapper_table(source product, product_target)
+        - product_target (string): the target database product name
+
+    Returns:
+        - drop_list (list): statements to drop the changed and removed foreign keys
+        - alter_list (list): statements to change the columns, keys, checks and indexes
+        - create_list (list): statements to create the changed and new foreign keys
+    """
+    identifier: str = f"`{table}`"
+    drop_list: list[str] = []
+    alter_list: list[str] = []
+    create_list: list[str] = []
+    # NOTE: relation
+    source_relation: dict[str, list[dict]] = group_dict(source_metadata.get("relation"), 'constraint_name')
+    target_relation: dict[str, list[dict]] = group_dict(target_metadata.get("relation"), 'constraint_name')
+    for name, row_list in target_relation.items():
+        if source_relation.get(name) != row_list:
+            drop_list.append(f"alter table {identifier} drop foreign key `{name}`;")
+    for name, row_list in source_relation.items():
+        if target_relation.get(name) != row_list:
+            create_list.append(f"alter table {identifier} add {ddl_mapper.relation_definition(name, source_metadata['relation'].loc[source_metadata['relation']['constraint_name'] == name])};")
+    # NOTE: index, unique and check are dropped before the column change and created after it
+    source_unique: dict[str, list[dict]] = group_dict(source_metadata.get("unique_constraint"), 'constraint_name')
+    target_unique: dict[str, list[dict]] = group_dict(target_metadata.get("unique_constraint"), 'constraint_name')
+    source_check: dict[str, list[dict]] = group_dict(source_metadata.get("check_constraint"), 'constraint_name')
+    target_check: dict[str, list[dict]] = group_dict(target_metadata.get("check_constraint"), 'constraint_name')
+    source_index: dict[str, list[dict]] = {name: row_list for name, row_list in group_dict(source_metadata.get("all_index"), 'index_name', 'column_expression_cardinality').items() if name != "PRIMARY" and name not in source_unique and name not in source_relation}
+    target_index: dict[str, list[dict]] = {name: row_list for name, row_list in group_dict(target_metadata.get("all_index"), 'index_name', 'column_expression_cardinality').items() if name != "PRIMARY" and name not in target_unique and name not in target_relation}
+    add_list: list[str] = []
+    for name, row_list in target_unique.items():
+        if source_unique.get(name) != row_list:
+            alter_list.append(f"alter table {identifier} drop index `{name}`;")
+    for name, row_list in source_unique.items():
+        if target_unique.get(name) != row_list:
+            column_string: str = ", ".join(f"`{row['column_name']}`" for row in row_list)
+            add_list.append(f"alter table {identifier} add constraint `{name}` unique ({column_string});")
+    for name, row_list in target_check.items():
+        if source_check.get(name) != row_list:
+            alter_list.append(f"alter table {identifier} drop check `{name}`;")
+    for name, row_list in source_check.items():
+        if target_check.get(name) != row_list:
+            add_list.append(f"alter table {identifier} add constraint `{name}` check ({row_list[0]['constraint_expression']});")
+    for name, row_list in target_index.items():
+        if source_index.get(name) != row_list:
+            alter_list.append(f"alter table {identifier} drop index `{name}`;")
+    for name, row_list in source_index.items():
+        if target_index.get(name) != row_list:
+            unique_string: str = "unique " if str(row_list[0]['is_unique']) == "0" else ""
+            add_list.append(f"alter table {identifier} add {unique_string}index `{name}` ({index_column(row_list)});")
+    # NOTE: primary key
+    source_key: list[str] = source_metadata["primary_key"]['column_name'].values.tolist() if source_metadata.get("primary_key") is not None and len(source_metadata["primary_key"]) != 0 else []
+    target_key: list[str] = target_metadata["primary_key"]['column_name'].values.tolist() if target_metadata.get("primary_key") is not None and len(target_metadata["primary_key"]) != 0 else []
+    if source_key != target_key and len(target_key) != 0:
+        alter_list.append(f"alter table {identifier} drop primary key;")
+    # NOTE: column, compared without its position and moved with after when its previous column change
+    source_column: list[dict] = [record_clean(record) for record in source_metadata["column_rule"].sort_values('ordinal_position', kind = "stable").to_dict("records")] if source_metadata.get("column_rule") is not None and len(source_metadata["column_rule"]) != 0 else []
+    target_column: list[dict] = [record_clean(record) for record in target_metadata["column_rule"].sort_values('ordinal_position', kind = "stable").to_dict("records")] if target_metadata.get("column_rule") is not None and len(target_metadata["column_rule"]) != 0 else []
+    source_column_dict: dict[str, dict] = {attribute['column_name']: attribute for attribute in source_column}
+    target_previous: dict[str, str] = {attribute['column_name']: (target_column[number - 1]['column_name'] if number != 0 else None) for number, attribute in enumerate(target_column)}
+    for attribute in target_column:
+        if attribute['column_name'] not in source_column_dict:
+            alter_list.append(f"alter table {identifier} drop column `{attribute['column_name']}`;")
+    target_column_dict: dict[str, dict] = {attribute['column_name']: {key: value for key, value in attribute.items() if key != 'ordinal_position'} for attribute in target_column}
+    for number, attribute in enumerate(source_column):
+        previous: str = source_column[number - 1]['column_name'] if number != 0 else None
+        position_string: str = f"after `{previous}`" if previous is not None else "first"
+        definition: str = ddl_mapper.column_definition(attribute, data_type_mapper_dict, product_target)
+        if attribute['column_name'] not in target_column_dict:
+            alter_list.append(f"alter table {identifier} add column {definition} {position_string};")
+        elif target_column_dict[attribute['column_name']] != {key: value for key, value in attribute.items() if key != 'ordinal_position'} or target_previous[attribute['column_name']] != previous:
+            alter_list.append(f"alter table {identifier} modify column {definition} {position_string};")
+    if source_key != target_key and len(source_key) != 0:
+        alter_list.append(f"alter table {identifier} add primary key ({', '.join(f'`{column}`' for column in source_key)});")
+    alter_list.extend(add_list)
+    return drop_list, alter_list, create_list
@@ -0,0 +1,124 @@
+"""
+Module to push a table selection down into the WHERE clause of the metadata_get catalog queries, so a partial migration only read the metadata of the selected tables.
+A selection is a list of table name and glob pattern (* for any text, ? for one character). The names are sent as one array parameter (postgresql) or one expanding IN parameter, every pattern as a LIKE parameter.
+The selection is case sensitive on every product and only * and ? are wildcard (every other character, like [ or %, is itself), so the catalog query and table_match select the same tables. MySQL and MariaDB compare the binary name, because their catalog collation can be case insensitive.
+- table_filter = to get the WHERE condition and its parameters for an include and exclude selection
+- table_match = to check a table name against an include and exclude selection without any database
+"""
+
+import re
+
+# NOTE: oracle does not accept more than 1000 item in one IN list
+oracle_in_limit: int = 1000
+
+
+def pattern_check(item: str) -> bool:
+    """
+    Check whether an item of a selection is a glob pattern or a table name.
+
+    Args:
+        - item (string): table name or glob pattern
+
+    Returns:
+        result (boolean): True if the item is a glob pattern
+    """
+    return "*" in item or "?" in item
+
+def pattern_like(pattern: str) -> str:
+    """
+    Change a glob pattern into a LIKE pattern with ! as the escape character.
+
+    Args:
+        - pattern (string): glob pattern (example: sales_*)
+
+    Returns:
+        like_pattern (string): LIKE pattern (example: sales!_%)
+    """
+    like_pattern: str = pattern.replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    like_pattern = like_pattern.replace("*", "%").replace("?", "_")
+    return like_pattern
+
+def pattern_regex(pattern: str) -> re.Pattern:
+    """
+    Change a glob pattern into a regular expression that match the same names as the LIKE pattern of pattern_like().
+
+    Args:
+        - pattern (string): glob pattern (example: sales_*)
+
+    Returns:
+        regex (Pattern): compiled regular expression of the whole name
+    """
+    return re.compile("".join(".*" if character == "*" else "." if character == "?" else re.escape(character) for character in pattern), re.DOTALL)
+
+def item_match(table: str, item: str) -> bool:
+    return pattern_regex(item).fullmatch(table) is not None if pattern_check(item) else table == item
+
+def selection_condition(column: str, selection: list[str], name: str, product: str) -> tuple[str, list[object]]:
+    from sqlalchemy import bindparam
+    if product in ["mysql", "mariadb"]:
+        column = f"cast({column} as binary)"
+    table_list: list[str] = [item for item in selection if not pattern_check(item)]
+    pattern_list: list[str] = [item for item in selection if pattern_check(item)]
+    condition_list: list[str] = []
+    bind_list: list[object] = []
+    if len(table_list) != 0:
+        if product == "postgresql":
+            condition_list.append(f"{column} = any(:{name}_table)")
+            bind_list.append(bindparam(f"{name}_table", value = table_list))
+        elif product == "oracle":
+            for number, position in enumerate(range(0, len(table_list), oracle_in_limit)):
+                condition_list.append(f"{column} in :{name}_table_{number}")
+                bind_list.append(bindparam(f"{name}_table_{number}", value = table_list[position:position + oracle_in_limit], expanding = True))
+        else:
+            condition_list.append(f"{column} in :{name}_table")
+            bind_list.append(bindparam(f"{name}_table", value = table_list, expanding = True))
+    for number, pattern in enumerate(pattern_list):
+        condition_list.append(f"{column} like :{name}_pattern_{number} escape '!'")
+        bind_list.append(bindparam(f"{name}_pattern_{number}", value = pattern_like(pattern)))
+    if len(condition_list) == 0:
+        condition_list.append("1 = 0")
+    return " or ".join(condition_list), bind_list
+
+def table_filter(column: str, include: list[str] = None, exclude: list[str] = None, product: str = None) -> tuple[str, list[object]]:
+    """
+    Get the WHERE condition of a table selection. The condition start with "and", so it can be put after the other condition of the catalog query. Without any selection the condition is empty, so the query text stay the same.
+
+    Args:
+        - column (string): the table name column of the catalog query (example: c.table_name)
+        - include (list): table name or glob pattern of the tables to get, None to get all tables
+        - exclude (list): table name or glob pattern of the tables to skip, None to skip nothing
+        - product (string): the database product name (example: postgresql, mysql) in lowercase
+
+    Returns:
+        filter_script (string): the WHERE condition
+        bind_list (list): sqlalchemy bindparam of the condition, to be given to text(script).bindparams()
+    """
+    filter_script: str = ""
+    bind_list: list[object] = []
+    if include is not None:
+        condition, include_bind_list = selection_condition(column, list(include), "include", product)
+        filter_script = f"{filter_script}\n            and ({condition})"
+        bind_list.extend(include_bind_list)
+    if exclude is not None and len(exclude) != 0:
+        condition, exclude_bind_list = selection_condition(column, list(exclude), "exclude", product)
+        filter_script = f"{filter_script}\n            and not ({condition})"
+        bind_list.extend(exclude_bind_list)
+    return filter_script, bind_list
+
+def table_match(table: str, include: list[str] = None, exclude: list[str] = None) -> bool:
+    """
+    Check whether a table is selected by an include and exclude selection, the same way as table_filter.
+
+    Args:
+        - table (string): name of the table
+        - include (list): table name or glob pattern of the tables to get, None to get all tables
+        - exclude (list): table name or glob pattern of the tables to skip, None to skip nothing
+
+    Returns:
+        result (boolean): True if the table is selected
+    """
+    if include is not None and not any(item_match(table, item) for item in include):
+        return False
+    if exclude is not None and any(item_match(table, item) for item in exclude):
+        return False
+    return True
@@ -0,0 +1,175 @@
+"""
+Module to build the table relation graph of a schema and walk it in linear time.
+- relation_graph = to build the parent and child adjacency index from relation metadata
+- topological_level = to get the depth of every table with a single Kahn (BFS) pass
+- strongly_connected_component = to find relation cycles with Tarjan algorithm
+- component_graph = to collapse every relation cycle into a single node
+"""
+
+from __future__ import annotations
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas
+
+
+def relation_graph(all_table: pandas.DataFrame, relation: pandas.DataFrame) -> tuple[list[str], dict[str, set[str]], dict[str, set[str]], set[str]]:
+    """
+    Build the adjacency index of table relation once. Relation to the table itself is not stored as an edge, it is kept at self_reference instead.
+    Parent table that is not part of the schema (for example referenced from other schema) is ignored.
+
+    Args:
+        - all_table (DataFrame): result of metadata_get.<product>.all_table
+        - relation (DataFrame): result of metadata_get.<product>.relation
+
+    Returns:
+        - node_list (list): name of all tables, in order of first appearance
+        - parent_dict (dictionary): set of parent table for every table
+        - child_dict (dictionary): set of child table for every table
+        - self_reference (set): name of tables that have relation to itself
+    """
+    node_list: list[str] = []
+    if len(all_table) != 0:
+        node_list = list(dict.fromkeys(all_table['table_name'].values.tolist()))
+    if len(relation) != 0:
+        edge_list: list[tuple[str, str]] = list(zip(relation['table_name'].values.tolist(), relation['parent_table_name'].values.tolist()))
+    else:
+        edge_list = []
+    node_set: set[str] = set(node_list)
+    for child, _ in edge_list:
+        if child not in node_set:
+            node_set.add(child)
+            node_list.append(child)
+    parent_dict: dict[str, set[str]] = {node: set() for node in node_list}
+    child_dict: dict[str, set[str]] = {node: set() for node in node_list}
+    self_reference: set[str] = set()
+    for child, parent in edge_list:
+        if parent not in node_set:
+            continue
+        if child == parent:
+            self_reference.add(child)
+            continue
+        parent_dict[child].add(parent)
+        child_dict[parent].add(child)
+    return node_list, parent_dict, child_dict, self_reference
+
+def topological_level(node_list: list[str], parent_dict: dict[str, set[str]], child_dict: dict[str, set[str]]) -> tuple[dict[str, int], list[str]]:
+    """
+    Get the depth of every table with Kahn algorithm. Table without parent have depth 0, the other have depth of its deepest parent plus one.
+
+    Args:
+        - node_list (list): name of all tables
+        - parent_dict (dictionary): set of parent table for every table
+        - child_dict (dictionary): set of child table for every table
+
+    Returns:
+        - depth_dict (dictionary): depth of every table that can be ordered
+        - unresolved (list): name of tables that can not be ordered because they are part of (or depend on) a relation cycle
+    """
+    remaining: dict[str, int] = {node: len(parent_dict[node]) for node in node_list}
+    depth_dict: dict[str, int] = {}
+    queue: deque = deque()
+    for node in node_list:
+        if remaining[node] == 0:
+            depth_dict[node] = 0
+            queue.append(node)
+    while queue:
+        node = queue.popleft()
+        depth = depth_dict[node] + 1
+        for child in child_dict[node]:
+            if depth > depth_dict.get(child, 0):
+                depth_dict[child] = depth
+            remaining[child] = remaining[child] - 1
+            if remaining[child] == 0:
+                queue.append(child)
+    unresolved: list[str] = [node for node in node_list if remaining[node] != 0]
+    for node in unresolved:
+        depth_dict.pop(node, None)
+    return depth_dict, unresolved
+
+def strongly_connected_component(node_list: list[str], child_dict: dict[str, set[str]]) -> list[list[str]]:
+    """
+    Get all strongly connected component of the relation graph with Tarjan algorithm. The walk is iterative so deep relation chain will not hit the python recursion limit.
+    Component with more than one table is a relation cycle.
+
+    Args:
+        - node_list (list): name of all tables
+        - child_dict (dictionary): set of child table for every table
+
+    Returns:
+        component_list (list): list of component, each component is a list of table name
+    """
+    index_counter: int = 0
+    index_dict: dict[str, int] = {}
+    low_dict: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    component_list: list[list[str]] = []
+    for root in node_list:
+        if root in index_dict:
+            continue
+        index_dict[root] = low_dict[root] = index_counter
+        index_counter = index_counter + 1
+        stack.append(root)
+        on_stack.add(root)
+        work: list = [(root, iter(child_dict[root]))]
+        while work:
+            node, child_iter = work[-1]
+            advanced: bool = False
+            for child in child_iter:
+                if child not in index_dict:
+                    index_dict[child] = low_dict[child] = index_counter
+                    index_counter = index_counter + 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(child_dict[child])))
+                    advanced = True
+                    break
+                elif child in on_stack and index_dict[child] < low_dict[node]:
+                    low_dict[node] = index_dict[child]
+            if advanced:
+                continue
+            work.pop()
+            if work and low_dict[node] < low_dict[work[-1][0]]:
+                low_dict[work[-1][0]] = low_dict[node]
+            if low_dict[node] == index_dict[node]:
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                component_list.append(component)
+    return component_list
+
+def component_graph(component_list: list[list[str]], parent_dict: dict[str, set[str]]) -> tuple[dict[str, int], list[int], dict[int, set[int]], dict[int, set[int]]]:
+    """
+    Collapse every strongly connected component into a single node. The result graph does not have any cycle.
+
+    Args:
+        - component_list (list): result of strongly_connected_component()
+        - parent_dict (dictionary): set of parent table for every table
+
+    Returns:
+        - component_dict (dictionary): component number of every table
+        - component_node_list (list): number of all components
+        - component_parent_dict (dictionary): set of parent component for every component
+        - component_child_dict (dictionary): set of child component for every component
+    """
+    component_dict: dict[str, int] = {}
+    for number, component in enumerate(component_list):
+        for table in component:
+            component_dict[table] = number
+    component_node_list: list[int] = list(range(len(component_list)))
+    component_parent_dict: dict[int, set[int]] = {number: set() for number in component_node_list}
+    component_child_dict: dict[int, set[int]] = {number: set() for number in component_node_list}
+    for child, parent_set in parent_dict.items():
+        child_number: int = component_dict[child]
+        for parent in parent_set:
+            parent_number: int = component_dict[parent]
+            if parent_number != child_number:
+                component_parent_dict[child_number].add(parent_number)
+                component_child_dict[parent_number].add(child_number)
+    return component_dict, component_node_list, component_parent_dict, component_child_dict
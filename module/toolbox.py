@@ -1,14 +1,24 @@
 """
 Main module to store all function that can be used to do all main purpose of this project.
 - level_measure = to get all table relation hierarchy on a schema
+- table_schedule = to run a task for every table concurrently in relation order
+- ddl_diff = to create only the alter, create and drop statement needed to make the target schema the same as the source
+- data_transfer = to copy the rows of all tables from a schema into another schema
+- data_sync = to copy only the new and changed rows since the last sync
+- data_verify = to compare the rows of all tables at the source and the target with server side hash
+- data_repair = to find and copy again only the rows that do not match
+- batch_runner = to run level measure or ddl transfer for every schema of every credential without any question
 """
 
+from __future__ import annotations
 import os
 from sys import path
 from pathlib import Path
-import pandas
-import sqlalchemy
-from importlib import import_module
+from typing import TYPE_CHECKING, Iterator, Iterable
+from .plugin import plugin_get, plugin_list
+
+if TYPE_CHECKING:
+    import pandas
 
 path.insert(0,str(str(Path(__file__).parent.parent)))
 
@@ -40,19 +50,86 @@ def database_version_value(version: str) -> dict[str: str]:
         semantic_version_dict["patch"] = "0"
     return semantic_version_dict
 
-def level_measure(all_table: pandas.DataFrame, relation: pandas.DataFrame) -> pandas.DataFrame:
+def level_measure(all_table: pandas.DataFrame, relation: pandas.DataFrame, engine: str = "graph") -> pandas.DataFrame:
     """
     Get the hierarchy position of table from certain schema. The dataframe columns description are:
     - table_name (string): name of the tale
-    - level (integer): the hierarchy position of the table
+    - level (integer): the hierarchy position of the table. 1 for table without relation, 2 for table with relation only to itself, 3 for the most outer parent, and 4 or more for the child tables by its depth
+    - cycle_id (integer): number of the relation cycle the table is part of, empty if the table is not part of any cycle
 
     Args:
-        - all_table (DataFrame): name of the table
-        - relation (DataFrame): the hierarchy position of the table
+        - all_table (DataFrame): result of metadata_get.<product>.all_table
+        - relation (DataFrame): result of metadata_get.<product>.relation
+        - engine (string): 'graph' (default) to measure with a single pass over the relation graph, 'pandas' to use the previous merge based measure
 
     Returns:
         DataFrame: data of table and its hierarchy position
-    """    
+    """
+    if engine == "graph":
+        return level_measure_graph(all_table, relation)
+    elif engine == "pandas":
+        return level_measure_pandas(all_table, relation)
+    else:
+        raise Exception(f"level measure engine '{engine}' is not available. please choose 'graph' or 'pandas'.")
+
+def level_measure_graph(all_table: pandas.DataFrame, relation: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Get the hierarchy position of table by building the relation adjacency index once and assigning the level with one Kahn (BFS) pass.
+    Every relation cycle is collapsed first into a single node (Tarjan strongly connected component), so all member of the cycle get the same level and the same cycle_id.
+    The cost is linear to the total of table and relation.
+
+    Args:
+        - all_table (DataFrame): result of metadata_get.<product>.all_table
+        - relation (DataFrame): result of metadata_get.<product>.relation
+
+    Returns:
+        DataFrame: data of table, its hierarchy position and its cycle_id
+    """
+    import pandas
+    from .table_graph import relation_graph, strongly_connected_component, component_graph, topological_level
+    node_list, parent_dict, child_dict, self_reference = relation_graph(all_table, relation)
+    component_list = strongly_connected_component(node_list, child_dict)
+    component_dict, component_node_list, component_parent_dict, component_child_dict = component_graph(component_list, parent_dict)
+    depth_dict, _ = topological_level(component_node_list, component_parent_dict, component_child_dict)
+    # NOTE: numbering the cycle by its first table name so the cycle_id is stable between runs
+    cycle_list: list[list[str]] = sorted([sorted(component) for component in component_list if len(component) > 1])
+    cycle_dict: dict[str, int] = {table: cycle_id for cycle_id, cycle in enumerate(cycle_list, 1) for table in cycle}
+    related: set[str] = set()
+    if len(relation) != 0:
+        related.update(relation['table_name'].values.tolist())
+        related.update(relation['parent_table_name'].values.tolist())
+    level_list: list[int] = []
+    cycle_id_list: list[int] = []
+    for table in node_list:
+        depth: int = depth_dict[component_dict[table]]
+        if depth > 0:
+            level_list.append(depth + 3)
+        elif table not in related:
+            level_list.append(1)
+        elif table in self_reference and table not in cycle_dict:
+            level_list.append(2)
+        else:
+            level_list.append(3)
+        cycle_id_list.append(cycle_dict.get(table, pandas.NA))
+    level = pandas.DataFrame({'table_name': node_list, 'level': level_list, 'cycle_id': pandas.array(cycle_id_list, dtype = 'Int64')})
+    level['level'] = pandas.to_numeric(level['level'])
+    level = level.sort_values(by=['level', 'table_name'], ascending=[True, True])
+    level = level.reset_index(drop = True)
+    return level
+
+def level_measure_pandas(all_table: pandas.DataFrame, relation: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Get the hierarchy position of table with pandas merge on every level. This is the previous engine of level_measure() and kept for comparison.
+    This engine can not measure relation cycle, it will raise an error when a cycle is found.
+
+    Args:
+        - all_table (DataFrame): result of metadata_get.<product>.all_table
+        - relation (DataFrame): result of metadata_get.<product>.relation
+
+    Returns:
+        DataFrame: data of table and its hierarchy position
+    """
+    import pandas
     if len(relation) != 0:
         # NOTE: managing relation column name
         all_table = all_table.drop(['table_comment'], axis = 1)
@@ -115,6 +192,8 @@ def level_measure(all_table: pandas.DataFrame, relation: pandas.DataFrame) -> pa
             level_x = level_x.reset_index()
             if 'X' in level_x.columns:
                 new_data = level_x.loc[level_x['X'].isnull()].drop(['X','Y'],axis=1)
+                if new_data.shape[0] == 0:
+                    raise Exception(f"relation cycle found on table: {', '.join(sorted(level_x['table_name'].values.tolist()))}. please use the 'graph' engine.")
                 new_data['level'] = f'{level_counter}'
                 level = pandas.concat([level,new_data])
                 not_defined_data = level_x[level_x['X'].notna()].drop(['X','Y'],axis=1)
@@ -130,34 +209,1001 @@ def level_measure(all_table: pandas.DataFrame, relation: pandas.DataFrame) -> pa
         level = level.drop('table_comment', axis=1)
         level['level'] = '1'
     level['level'] = pandas.to_numeric(level['level'])
+    level['cycle_id'] = pandas.array([pandas.NA] * len(level), dtype = 'Int64')
     level = level.sort_values(by=['level', 'table_name'], ascending=[True, True])
     level = level.reset_index(drop = True)
     return level
 
-def ddl_transfer(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str):
-    source_metadata_get_path: str = f"module.metadata_get"
-    source_metadata_get = import_module(source_metadata_get_path)
-    source_metadata_get_method = getattr(source_metadata_get, source_product)
-    all_table: pandas.DataFrame = source_metadata_get_method.all_table(source_connection, source_schema)
-    column_rule: pandas.DataFrame = source_metadata_get_method.column_rule(source_connection, source_schema)
-    primary_key: pandas.DataFrame = source_metadata_get_method.primary_key(source_connection, source_schema)
-    relation: pandas.DataFrame = source_metadata_get_method.relation(source_connection, source_schema)
-    unique_constraint: pandas.DataFrame = source_metadata_get_method.unique_constraint(source_connection, source_schema)
-    check_constraint: pandas.DataFrame = source_metadata_get_method.check_constraint(source_connection, source_schema)
-    all_index: pandas.DataFrame = source_metadata_get_method.all_index(source_connection, source_schema)
-    ddl_mapper_path = f"module.ddl_mapper"
-    ddl_mapper = import_module(ddl_mapper_path)
-    module_based_on_source = getattr(ddl_mapper, source_product)
-    function_based_on_target = getattr(module_based_on_source, target_product)
-    table_list: list[str] = all_table['table_name'].values.tolist()
+def metadata_fetch(product: str, connection: object, schema: str, metadata_list: list[str], max_workers: int = 4, cache: bool = True, output: str = "dataframe", include: list[str] = None, exclude: list[str] = None) -> dict[str, pandas.DataFrame]:
+    """
+    Get several metadata of a schema concurrently. Every metadata_get.<product> function is run on a bounded thread pool, each worker thread check out its own connection from the engine pool of the connection and reuse it for the next function.
+    The time taken by every function is printed so the slowest catalog query can be seen.
+    When cache is used, the metadata is taken from the snapshot at root\\result\\metadata_cache as long as the schema fingerprint does not change. The snapshot is not used when the tables are filtered with include or exclude.
+
+    Args:
+        - product (string): the database product name (example: postgresql, mysql) in lowercase
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema that the metadata want to get extracted
+        - metadata_list (list): name of metadata_get.<product> function to run (example: all_table, relation)
+        - max_workers (integer): maximum total of thread (and connection) used at the same time
+        - cache (boolean): True to use (and refresh) the metadata snapshot, False to always query the catalog
+        - output (string): 'dataframe' to get dataframes, 'record' to get lists of metadata_record for the functions that can give records (the other functions still give a dataframe)
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables. The filter is done by the catalog query when the function can filter, and after the query when it can not
+        - exclude (list): table name or glob pattern of the tables to skip
+
+    Returns:
+        metadata_dict (dictionary): result of every function, with the function name as key
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from inspect import signature
+    from threading import local, Lock
+    from time import perf_counter
+    from .metadata_cache import snapshot_file, snapshot_load, snapshot_save
+    metadata_get_method = plugin_get("metadata_get", product)
+    start_time: float = perf_counter()
+    cached_dict: dict[str, pandas.DataFrame] = {}
+    table_filtered: bool = include is not None or exclude is not None
+    # NOTE: the snapshot always hold the metadata of the whole schema, so a filtered fetch does not read or write it
+    cache = cache and not table_filtered
+    if cache:
+        fingerprint: str = metadata_get_method.fingerprint(connection, schema)
+        file_path: str = snapshot_file(connection, schema, metadata_get_method.version(connection))
+        cached_dict = snapshot_load(file_path, fingerprint)
+    # NOTE: records and dataframes of the same function are kept under different snapshot key
+    cache_key_dict: dict[str, str] = {metadata_name: metadata_name if output == "dataframe" else f"{metadata_name}:{output}" for metadata_name in metadata_list}
+    missing_list: list[str] = [metadata_name for metadata_name in metadata_list if cache_key_dict[metadata_name] not in cached_dict]
+    engine = connection.engine
+    worker = local()
+    worker_connection_list: list[object] = []
+    worker_connection_lock = Lock()
+    def fetch(metadata_name: str) -> tuple[str, pandas.DataFrame, float]:
+        if not hasattr(worker, "connection"):
+            worker.connection = engine.connect()
+            with worker_connection_lock:
+                worker_connection_list.append(worker.connection)
+        start_time: float = perf_counter()
+        function = getattr(metadata_get_method, metadata_name)
+        parameter_list = signature(function).parameters
+        option: dict[str, object] = {}
+        if output != "dataframe" and "output" in parameter_list:
+            option["output"] = output
+        if table_filtered and "include" in parameter_list:
+            option["include"] = include
+            option["exclude"] = exclude
+        data: pandas.DataFrame = function(worker.connection, schema, **option)
+        if table_filtered and "include" not in parameter_list:
+            data = table_keep(data, include, exclude)
+        return metadata_name, data, perf_counter() - start_time
+    fetch_result: list[tuple[str, pandas.DataFrame, float]] = []
+    if len(missing_list) != 0:
+        try:
+            with ThreadPoolExecutor(max_workers = max(1, min(max_workers, len(missing_list)))) as executor:
+                fetch_result = list(executor.map(fetch, missing_list))
+        finally:
+            for worker_connection in worker_connection_list:
+                worker_connection.close()
+    for metadata_name, data, elapsed_time in fetch_result:
+        cached_dict[cache_key_dict[metadata_name]] = data
+        print(f"- {product}.{metadata_name}: {elapsed_time:.3f} s")
+    if cache and len(fetch_result) != 0:
+        snapshot_save(file_path, fingerprint, cached_dict)
+    if len(missing_list) != len(metadata_list):
+        print(f"- {len(metadata_list) - len(missing_list)} metadata taken from snapshot")
+    metadata_dict: dict[str, pandas.DataFrame] = {metadata_name: cached_dict[cache_key_dict[metadata_name]] for metadata_name in metadata_list}
+    print(f"metadata of schema {schema} fetched in {perf_counter() - start_time:.3f} s")
+    return metadata_dict
+
+def table_keep(data: pandas.DataFrame, include: list[str] = None, exclude: list[str] = None) -> pandas.DataFrame:
+    """
+    Keep only the metadata rows of the selected tables. This is used for the metadata_get function that can not filter the tables in its catalog query.
+
+    Args:
+        - data (DataFrame or list): metadata that have table_name column, or records (see metadata_record)
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables
+        - exclude (list): table name or glob pattern of the tables to skip
+
+    Returns:
+        data (DataFrame or list): metadata of the selected tables
+    """
+    from .table_filter import table_match
+    if isinstance(data, list):
+        return [row for row in data if table_match(row['table_name'], include, exclude)]
+    if len(data) == 0 or 'table_name' not in data.columns:
+        return data
+    table_set: set[str] = {table for table in data['table_name'].unique() if table_match(table, include, exclude)}
+    return data.loc[data['table_name'].isin(table_set)]
+
+def table_select(product: str, connection: object, schema: str, include: list[str] = None, exclude: list[str] = None, parent_expand: bool = True, max_workers: int = 4) -> list[str]:
+    """
+    Get the name of the tables of a schema that match an include and exclude selection. The selection is done by the catalog query.
+    With parent_expand, the parent of every selected table is added (even when it is excluded), then the parent of the parent and so on, so the ddl of every selected table can be created. Every step only read the relation of the newly added tables.
+
+    Args:
+        - product (string): the database product name (example: postgresql, mysql) in lowercase
+        - connection (object): sqlalchemy connection object
+        - schema (string): name of the schema
+        - include (list): table name or glob pattern (* and ?) of the tables to get, None to get all tables
+        - exclude (list): table name or glob pattern of the tables to skip
+        - parent_expand (boolean): True to add the parent tables of the selection
+        - max_workers (integer): maximum total of thread used to get the metadata
+
+    Returns:
+        table_list (list): name of the selected tables, the added parent tables are at the end
+    """
+    all_table: pandas.DataFrame = metadata_fetch(product, connection, schema, ["all_table"], max_workers = max_workers, include = include, exclude = exclude)["all_table"]
+    table_list: list[str] = all_table['table_name'].values.tolist() if len(all_table) != 0 else []
+    table_set: set[str] = set(table_list)
+    new_table_list: list[str] = table_list
+    while parent_expand and len(new_table_list) != 0:
+        relation: pandas.DataFrame = metadata_fetch(product, connection, schema, ["relation"], max_workers = max_workers, include = new_table_list)["relation"]
+        if len(relation) == 0:
+            break
+        new_table_list = sorted({table for table in relation['parent_table_name'].dropna().unique() if table not in table_set})
+        table_set.update(new_table_list)
+        table_list.extend(new_table_list)
+    return table_list
+
+def metadata_partition(data: pandas.DataFrame) -> dict[str, pandas.DataFrame]:
+    """
+    Split a metadata dataframe into one dataframe per table with a single groupby, instead of filtering the whole dataframe for every table. Records (see metadata_record) are split into one list per table.
+
+    Args:
+        - data (DataFrame or list): metadata that have table_name column (example: result of metadata_get.<product>.column_rule)
+
+    Returns:
+        data_dict (dictionary): metadata of every table, with the table name as key. table without any metadata row is not included
+    """
+    if isinstance(data, list):
+        from .metadata_record import record_group
+        return record_group(data)
+    if len(data) == 0 or 'table_name' not in data.columns:
+        return {}
+    data_dict: dict[str, pandas.DataFrame] = dict(tuple(data.groupby('table_name', sort = False)))
+    return data_dict
+
+def ddl_iterate(function_based_on_target: object, table_list: list[str], metadata_dict: dict[str, pandas.DataFrame]) -> Iterator[str]:
+    """
+    Create the ddl of several tables one by one. The ddl of a table is only created when the previous one has been consumed.
+
+    Args:
+        - function_based_on_target (function): ddl_mapper.<source product>.<target product> function, it get the metadata of one table and the table name (table_name)
+        - table_list (list): name of the tables to create
+        - metadata_dict (dictionary): column_rule, primary_key, relation, unique_constraint, check_constraint and all_index metadata that contain (at least) the tables at table_list
+
+    Returns:
+        ddl (generator): ddl of every table, in the same order as table_list
+    """
+    metadata_name_list: list[str] = ["column_rule", "primary_key", "relation", "unique_constraint", "check_constraint", "all_index"]
+    # NOTE: splitting every metadata per table once, so every table only need a dictionary lookup
+    partition_dict: dict[str, dict[str, pandas.DataFrame]] = {metadata_name: metadata_partition(metadata_dict[metadata_name]) for metadata_name in metadata_name_list}
+    empty_dict: dict[str, pandas.DataFrame] = {metadata_name: [] if isinstance(metadata_dict[metadata_name], list) else metadata_dict[metadata_name].iloc[0:0] for metadata_name in metadata_name_list}
     for table in table_list:
-        table_column_rule: pandas.DataFrame = column_rule.loc[column_rule['table_name'] == table]
-        table_primary_key: pandas.DataFrame = primary_key.loc[primary_key['table_name'] == table]
-        table_relation: pandas.DataFrame = relation.loc[relation['table_name'] == table]
-        table_unique_constraint: pandas.DataFrame = unique_constraint.loc[unique_constraint['table_name'] == table]
-        table_check_constraint: pandas.DataFrame = check_constraint.loc[check_constraint['table_name'] == table]
-        table_all_index: pandas.DataFrame = all_index.loc[all_index['table_name'] == table]
-        function_based_on_target(column_rule = table_column_rule, primary_key = table_primary_key, relation = table_relation, unique_constraint = table_unique_constraint, check_constraint = table_check_constraint, all_index = table_all_index)
+        table_metadata: dict[str, pandas.DataFrame] = {metadata_name: partition_dict[metadata_name].get(table, empty_dict[metadata_name]) for metadata_name in metadata_name_list}
+        yield function_based_on_target(**table_metadata, table_name = table)
+
+def ddl_generate(function_based_on_target: object, table_list: list[str], metadata_dict: dict[str, pandas.DataFrame]) -> list[str]:
+    """
+    Create the ddl of several tables. This is the unit of work of the parallel ddl_transfer, so it must stay a module level function that can be sent to a worker process.
+
+    Args:
+        - function_based_on_target (function): ddl_mapper.<source product>.<target product> function
+        - table_list (list): name of the tables to create
+        - metadata_dict (dictionary): column_rule, primary_key, relation, unique_constraint, check_constraint and all_index metadata that contain (at least) the tables at table_list
+
+    Returns:
+        ddl_list (list): ddl of every table, in the same order as table_list
+    """
+    ddl_list: list[str] = list(ddl_iterate(function_based_on_target, table_list, metadata_dict))
+    return ddl_list
+
+def ddl_transfer(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str, max_workers: int = 4, parallel: bool = False, process_count: int = None, chunk_size: int = 256, include: list[str] = None, exclude: list[str] = None, parent_expand: bool = True) -> Iterator[str]:
+    """
+    Create the ddl of every table in the source schema for the target product. The ddl is ordered by level_measure, so parent table is always created before its child.
+    The ddl is given one table at a time, so it can be written with ddl_write() without keeping the whole script in memory.
+
+    Args:
+        - source_product (string): the source database product name (example: postgresql, mysql) in lowercase
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_product (string): the target database product name in lowercase
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - max_workers (integer): maximum total of thread used to get the metadata
+        - parallel (boolean): True to create the ddl on a pool of worker process
+        - process_count (integer): total of worker process when parallel is True. The default is the total of cpu
+        - chunk_size (integer): total of table sent to a worker process at once when parallel is True
+        - include (list): table name or glob pattern (* and ?) of the tables to create, None to create all tables
+        - exclude (list): table name or glob pattern of the tables to skip
+        - parent_expand (boolean): True to also create the parent tables of the selected tables (see table_select)
+
+    Returns:
+        ddl (generator): ddl of every table
+    """
+    if include is not None or exclude is not None:
+        # NOTE: the selection (and its parents) is turned into a plain list of table name once, so every metadata below is read only for those tables
+        include = table_select(source_product, source_connection, source_schema, include, exclude, parent_expand, max_workers)
+        exclude = None
+    metadata_list: list[str] = ["all_table", "column_rule", "primary_key", "relation", "unique_constraint", "check_constraint", "all_index"]
+    # NOTE: the ddl_mapper only read the metadata row by row, so the metadata is taken as records and no dataframe is created for it (only level_measure get a small dataframe of the relation)
+    metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(source_product, source_connection, source_schema, metadata_list, max_workers = max_workers, output = "record", include = include)
+    module_based_on_source = plugin_get("ddl_mapper", source_product)
+    function_based_on_target = getattr(module_based_on_source, target_product)
+    relation: pandas.DataFrame = metadata_dict["relation"]
+    if isinstance(relation, list):
+        from .metadata_record import record_frame, relation_record
+        relation = record_frame(relation, relation_record)
+    table_list: list[str] = level_measure(metadata_dict["all_table"], relation)['table_name'].values.tolist()
+    if not parallel:
+        yield from ddl_iterate(function_based_on_target, table_list, metadata_dict)
+        return
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    # NOTE: splitting the metadata per chunk (not per table) in the main process, so every chunk is sent to the worker as a few large lists of records (or dataframes)
+    chunk_table_list: list[list[str]] = [table_list[position:position + chunk_size] for position in range(0, len(table_list), chunk_size)]
+    chunk_number_dict: dict[str, int] = {table: number for number, chunk in enumerate(chunk_table_list) for table in chunk}
+    chunk_metadata_list: list[dict[str, pandas.DataFrame]] = [{} for _ in chunk_table_list]
+    for metadata_name in ["column_rule", "primary_key", "relation", "unique_constraint", "check_constraint", "all_index"]:
+        data: pandas.DataFrame = metadata_dict[metadata_name]
+        chunk_data_dict: dict[int, pandas.DataFrame] = {}
+        if isinstance(data, list):
+            for row in data:
+                chunk_data_dict.setdefault(chunk_number_dict.get(row['table_name']), []).append(row)
+            empty_data: list = []
+        else:
+            if len(data) != 0 and 'table_name' in data.columns:
+                chunk_data_dict = dict(tuple(data.groupby(data['table_name'].map(chunk_number_dict), sort = False)))
+            empty_data: pandas.DataFrame = data.iloc[0:0]
+        for number, chunk_metadata in enumerate(chunk_metadata_list):
+            chunk_metadata[metadata_name] = chunk_data_dict.get(number, empty_data)
+    process_count = process_count or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers = process_count) as executor:
+        # NOTE: only a few chunks are submitted ahead and the result is taken in submission order, so the ddl stays in level_measure order and the memory stays flat
+        pending = deque()
+        for chunk_table, chunk_metadata in zip(chunk_table_list, chunk_metadata_list):
+            pending.append(executor.submit(ddl_generate, function_based_on_target, chunk_table, chunk_metadata))
+            if len(pending) >= process_count * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def ddl_diff(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str, max_workers: int = 4) -> Iterator[str]:
+    """
+    Create only the ddl needed to make the target schema the same as the source schema, instead of the create statement of every table.
+    The metadata of both schema is fetched, and every table get a fingerprint (see module.schema_diff) so only the tables with different fingerprint are compared column by column.
+    The ddl is yielded in this order: drop of changed foreign keys, create of new tables (in level_measure order), alter of changed tables, drop of removed tables (child first), create of changed foreign keys.
+    Both products must have all metadata of schema_diff.diff_metadata_list and the source product must have a ddl_mapper.
+
+    Args:
+        - source_product (string): the source database product name (example: postgresql, mysql) in lowercase
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_product (string): the target database product name in lowercase
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - max_workers (integer): maximum total of catalog query run at the same time for every schema
+
+    Returns:
+        ddl (generator): every ddl statement
+    """
+    from .data_type_mapper import mapper_table
+    from .schema_diff import diff_metadata_list, fingerprint_dict, table_diff
+    for product in [source_product, target_product]:
+        missing_list: list[str] = [metadata_name for metadata_name in diff_metadata_list if not hasattr(plugin_get("metadata_get", product), metadata_name)]
+        if len(missing_list) != 0:
+            raise NotImplementedError(f"ddl diff is not available for {product}, metadata_get.{product} does not have {', '.join(missing_list)}")
+    ddl_mapper = plugin_get("ddl_mapper", source_product)
+    if not hasattr(ddl_mapper, "column_definition"):
+        raise NotImplementedError(f"ddl diff is not available for {source_product}, ddl_mapper.{source_product} does not have column_definition")
+    metadata_list: list[str] = ["all_table", "relation"] + [metadata_name for metadata_name in diff_metadata_list if metadata_name != "relation"]
+    source_metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(source_product, source_connection, source_schema, metadata_list, max_workers = max_workers)
+    target_metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(target_product, target_connection, target_schema, metadata_list, max_workers = max_workers)
+    source_fingerprint: dict[str, str] = fingerprint_dict(source_metadata_dict)
+    target_fingerprint: dict[str, str] = fingerprint_dict(target_metadata_dict)
+    source_level: list[str] = level_measure(source_metadata_dict["all_table"], source_metadata_dict["relation"])['table_name'].values.tolist()
+    target_level: list[str] = level_measure(target_metadata_dict["all_table"], target_metadata_dict["relation"])['table_name'].values.tolist()
+    create_table_list: list[str] = [table for table in source_level if table in source_fingerprint and table not in target_fingerprint]
+    alter_table_list: list[str] = [table for table in source_level if table in target_fingerprint and source_fingerprint.get(table) != target_fingerprint[table]]
+    drop_table_list: list[str] = [table for table in reversed(target_level) if table in target_fingerprint and table not in source_fingerprint]
+    print(f"- {len(create_table_list)} new, {len(alter_table_list)} changed, {len(drop_table_list)} removed of {len(source_fingerprint)} tables")
+    # NOTE: only the metadata of the changed tables is split per table
+    source_table_set: set[str] = set(alter_table_list)
+    target_table_set: set[str] = set(alter_table_list) | set(drop_table_list)
+    source_partition: dict[str, dict[str, pandas.DataFrame]] = {metadata_name: metadata_partition(source_metadata_dict[metadata_name].loc[source_metadata_dict[metadata_name]['table_name'].isin(source_table_set)] if 'table_name' in source_metadata_dict[metadata_name].columns else source_metadata_dict[metadata_name]) for metadata_name in diff_metadata_list}
+    target_partition: dict[str, dict[str, pandas.DataFrame]] = {metadata_name: metadata_partition(target_metadata_dict[metadata_name].loc[target_metadata_dict[metadata_name]['table_name'].isin(target_table_set)] if 'table_name' in target_metadata_dict[metadata_name].columns else target_metadata_dict[metadata_name]) for metadata_name in diff_metadata_list}
+    data_type_mapper_dict: dict[str, object] = mapper_table(source_product, target_product)
+    drop_list: list[str] = []
+    alter_list: list[str] = []
+    create_list: list[str] = []
+    for table in alter_table_list:
+        table_drop_list, table_alter_list, table_create_list = table_diff(table, {metadata_name: source_partition[metadata_name].get(table) for metadata_name in diff_metadata_list}, {metadata_name: target_partition[metadata_name].get(table) for metadata_name in diff_metadata_list}, ddl_mapper, data_type_mapper_dict, target_product)
+        drop_list.extend(table_drop_list)
+        alter_list.extend(table_alter_list)
+        create_list.extend(table_create_list)
+    for table in drop_table_list:
+        if table in target_partition["relation"]:
+            for relation_name in target_partition["relation"][table]['constraint_name'].unique().tolist():
+                drop_list.append(f"alter table `{table}` drop foreign key `{relation_name}`;")
+    yield from drop_list
+    create_table_set: set[str] = set(create_table_list)
+    create_metadata_dict: dict[str, pandas.DataFrame] = {metadata_name: source_metadata_dict[metadata_name].loc[source_metadata_dict[metadata_name]['table_name'].isin(create_table_set)] if 'table_name' in source_metadata_dict[metadata_name].columns else source_metadata_dict[metadata_name] for metadata_name in diff_metadata_list}
+    yield from ddl_iterate(getattr(ddl_mapper, target_product), create_table_list, create_metadata_dict)
+    yield from alter_list
+    for table in drop_table_list:
+        yield f"drop table `{table}`;"
+    yield from create_list
+
+def ddl_write(ddl_iterable: Iterable[str], file_path: str, compress: bool = False) -> int:
+    """
+    Write ddl into a file as soon as it is created. If compress is True, the file is written with gzip.
+
+    Args:
+        - ddl_iterable (iterable): ddl of every table (example: result of ddl_transfer())
+        - file_path (string): path of the result file
+        - compress (boolean): True to write the file with gzip compression
+
+    Returns:
+        table_count (integer): total of ddl written into the file
+    """
+    import gzip
+    directory_path: str = os.path.dirname(file_path)
+    if directory_path != '' and not os.path.exists(directory_path):
+        os.makedirs(directory_path)
+    table_count: int = 0
+    if compress:
+        result_file = gzip.open(file_path, 'wt', encoding = 'utf-8')
+    else:
+        result_file = open(file_path, 'w', encoding = 'utf-8')
+    with result_file:
+        for ddl in ddl_iterable:
+            result_file.write(ddl)
+            result_file.write("\n\n")
+            table_count = table_count + 1
+    return table_count
+
+def table_schedule(level: pandas.DataFrame, relation: pandas.DataFrame, task: object, max_workers: int = 4, mode: str = "level") -> list[object]:
+    """
+    Run a task for every table concurrently on a bounded thread pool, following the table relation so the parent table is always finished before its child.
+    - level mode = all tables of a level run at the same time, and the next level start only when the whole level is finished
+    - dag mode = a table start as soon as all of its own parent tables are finished, without waiting for the rest of the level
+    Relation between tables of the same level (relation cycle) is not followed, so those tables can run at the same time.
+    When a task raise an error, no new task is started and the error is raised after the running task is finished.
+
+    Args:
+        - level (DataFrame): result of level_measure(), the tables to run
+        - relation (DataFrame): result of metadata_get.<product>.relation
+        - task (function): function that take the table name, called once for every table
+        - max_workers (integer): maximum total of task run at the same time
+        - mode (string): 'level' or 'dag'
+
+    Returns:
+        result_list (list): result of the task for every table, in order of the tables at level
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    from .table_graph import relation_graph
+    if mode not in ["level", "dag"]:
+        raise Exception(f"schedule mode {mode} is not available. available mode: level, dag")
+    table_list: list[str] = level['table_name'].values.tolist()
+    level_dict: dict[str, int] = dict(zip(table_list, level['level'].values.tolist()))
+    result_dict: dict[str, object] = {}
+    with ThreadPoolExecutor(max_workers = max(1, max_workers)) as executor:
+        if mode == "level":
+            for level_value in sorted(set(level_dict.values())):
+                level_table_list: list[str] = [table for table in table_list if level_dict[table] == level_value]
+                result_dict.update(zip(level_table_list, executor.map(task, level_table_list)))
+        else:
+            _, parent_dict, child_dict, _ = relation_graph(level[['table_name']], relation)
+            remaining: dict[str, int] = {table: len([parent for parent in parent_dict.get(table, set()) if level_dict.get(parent, level_dict[table]) < level_dict[table]]) for table in table_list}
+            running: dict[object, str] = {executor.submit(task, table): table for table in table_list if remaining[table] == 0}
+            error: BaseException = None
+            while running:
+                done, _ = wait(running, return_when = FIRST_COMPLETED)
+                for future in done:
+                    table: str = running.pop(future)
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                        continue
+                    result_dict[table] = future.result()
+                    if error is not None:
+                        continue
+                    for child in child_dict.get(table, set()):
+                        if child in remaining and level_dict[table] < level_dict[child]:
+                            remaining[child] = remaining[child] - 1
+                            if remaining[child] == 0:
+                                running[executor.submit(task, child)] = child
+            if error is not None:
+                raise error
+    result_list: list[object] = [result_dict[table] for table in table_list]
+    return result_list
+
+def data_transfer(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str, batch_size: int = 10000, table_list: list[str] = None, max_workers: int = 1, schedule: str = "level", chunk_row_count: int = 1000000, chunk_workers: int = 4, checkpoint: bool = False) -> pandas.DataFrame:
+    """
+    Copy the rows of every table from the source schema into the same table at the target schema. The table must already exist at the target (example: created from the ddl_transfer result).
+    The tables are copied in level_measure order, so the parent table is filled before its child. Every table is read with a server side cursor and written in batches, so the memory is bounded by batch_size.
+    The batches are written with the bulk loader of the target product when available (see module.data_loader, example: COPY for postgresql), otherwise with executemany.
+    With more than one worker, the tables are copied concurrently with table_schedule(), each worker thread check out its own source and target connection from the engine pool.
+    A table with primary key and more than chunk_row_count estimated rows is split into primary key ranges, and the ranges are copied with keyset reads. With one worker the ranges are copied concurrently, each on its own source and target connection. With more than one worker the ranges are copied one by one on the worker connections, so the total of connection checked out from every engine pool stay at max_workers.
+    The dataframe columns description are:
+    - table_name (string): name of the table
+    - row_count (integer): total of row copied
+    - elapsed_time (float): time taken to copy the table in seconds
+
+    Args:
+        - source_product (string): the source database product name (example: postgresql, mysql) in lowercase
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_product (string): the target database product name in lowercase
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - batch_size (integer): total of row read and written at once
+        - table_list (list): name of the tables to copy. The default is all tables in the source schema
+        - max_workers (integer): total of table copied at the same time. 1 copy every table one by one with the given connections
+        - schedule (string): 'level' or 'dag', see table_schedule()
+        - chunk_row_count (integer): the wanted total of row in a key range of a big table
+        - chunk_workers (integer): total of key range of a table copied at the same time, only used when max_workers is 1
+        - checkpoint (boolean): True to record the finished key ranges at the transfer journal (see module.transfer_journal). When the journal of the previous failed run exist, the finished ranges are skipped and the rest are deleted at the target and copied again. The ranges are cleared from the journal when the transfer is finished
+
+    Returns:
+        DataFrame: total of row and time taken for every table
+    """
+    import pandas
+    from threading import local, Lock
+    from time import perf_counter
+    from concurrent.futures import ThreadPoolExecutor
+    from .data_transfer import batch_read, batch_insert, table_column, chunk_count, key_range, keyset_read, range_delete
+    from .transfer_journal import journal, journal_file
+    metadata_list: list[str] = ["all_table", "relation", "primary_key"]
+    for metadata_name in ["column_rule", "row_estimate"]:
+        if hasattr(plugin_get("metadata_get", source_product), metadata_name):
+            metadata_list.append(metadata_name)
+    metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(source_product, source_connection, source_schema, metadata_list)
+    column_rule_dict: dict[str, pandas.DataFrame] = metadata_partition(metadata_dict.get("column_rule", pandas.DataFrame()))
+    primary_key_dict: dict[str, list[str]] = {table: data['column_name'].values.tolist() for table, data in metadata_partition(metadata_dict["primary_key"]).items()}
+    row_estimate_dict: dict[str, int] = {}
+    if len(metadata_dict.get("row_estimate", [])) != 0:
+        row_estimate_dict = dict(zip(metadata_dict["row_estimate"]['table_name'].values.tolist(), metadata_dict["row_estimate"]['row_estimate'].values.tolist()))
+    level: pandas.DataFrame = level_measure(metadata_dict["all_table"], metadata_dict["relation"])
+    if table_list is not None:
+        level = level.loc[level['table_name'].isin(table_list)]
+    loader = None
+    if target_product in plugin_list("data_loader"):
+        loader = plugin_get("data_loader", target_product)
+    def table_write(table: str, target_connection: object, column_list: list[str], batch_iterator: Iterator[list[tuple]]) -> int:
+        if loader is not None:
+            return loader.load(target_connection, target_schema, table, column_list, batch_iterator, column_rule = column_rule_dict.get(table))
+        return batch_insert(target_connection, target_schema, table, column_list, batch_iterator)
+    def table_copy(table: str, source_connection: object, target_connection: object) -> dict[str, object]:
+        start_time: float = perf_counter()
+        range_list: list[tuple[object, object]] = None
+        resumed: bool = False
+        if transfer_journal is not None:
+            range_list = transfer_journal.range_get(table)
+            resumed = range_list is not None
+        if range_list is None:
+            count: int = 1
+            if table in primary_key_dict and int(row_estimate_dict.get(table, 0)) > chunk_row_count:
+                count = chunk_count(int(row_estimate_dict[table]), chunk_row_count)
+            range_list = [(None, None)]
+            if count > 1:
+                range_list = key_range(source_connection, source_schema, table, primary_key_dict[table][0], count)
+            if transfer_journal is not None:
+                transfer_journal.range_set(table, range_list)
+        done_set: set[int] = transfer_journal.chunk_done(table) if transfer_journal is not None else set()
+        if len(done_set) != 0:
+            print(f"- {table}: {len(done_set)} of {len(range_list)} key ranges already copied, skipped")
+        key_list: list[str] = primary_key_dict.get(table, [None])
+        def chunk_copy(chunk_number: int, source_connection: object, target_connection: object) -> int:
+            lower, upper = range_list[chunk_number]
+            if resumed:
+                range_delete(target_connection, target_schema, table, key_list[0] if len(range_list) != 1 else None, lower, upper)
+            if len(range_list) == 1:
+                column_list, batch_iterator = batch_read(source_connection, source_schema, table, batch_size = batch_size)
+            else:
+                column_list, batch_iterator = keyset_read(source_connection, source_schema, table, key_list, lower, upper, batch_size = batch_size, column_list = table_column_list)
+            row_count: int = table_write(table, target_connection, column_list, batch_iterator)
+            if transfer_journal is not None:
+                transfer_journal.chunk_mark(table, chunk_number, row_count)
+            return row_count
+        def chunk_task(chunk_number: int) -> int:
+            with source_connection.engine.connect() as chunk_source_connection, target_connection.engine.connect() as chunk_target_connection:
+                return chunk_copy(chunk_number, chunk_source_connection, chunk_target_connection)
+        pending_list: list[int] = [chunk_number for chunk_number in range(len(range_list)) if chunk_number not in done_set]
+        row_count: int = 0
+        if len(range_list) == 1:
+            if len(pending_list) != 0:
+                row_count = chunk_copy(0, source_connection, target_connection)
+        elif len(pending_list) != 0:
+            table_column_list: list[str] = table_column(source_connection, source_schema, table)
+            # NOTE: the table workers already hold a connection pair each, chunk threads on top of them can check out more connections than the engine pool allow
+            if max_workers > 1 or chunk_workers <= 1:
+                row_count = sum(chunk_copy(chunk_number, source_connection, target_connection) for chunk_number in pending_list)
+            else:
+                with ThreadPoolExecutor(max_workers = min(chunk_workers, len(pending_list))) as executor:
+                    row_count = sum(executor.map(chunk_task, pending_list))
+            print(f"- {table}: copied in {len(pending_list)} key ranges")
+        elapsed_time: float = perf_counter() - start_time
+        print(f"- {table}: {row_count} rows in {elapsed_time:.3f} s")
+        return {"table_name": table, "row_count": row_count, "elapsed_time": elapsed_time}
+    transfer_journal: journal = None
+    if checkpoint:
+        transfer_journal = journal(journal_file(source_connection, source_schema, target_connection, target_schema))
+    try:
+        if max_workers <= 1:
+            summary_list: list[dict[str, object]] = [table_copy(table, source_connection, target_connection) for table in level['table_name'].values.tolist()]
+        else:
+            worker = local()
+            worker_connection_list: list[object] = []
+            worker_connection_lock = Lock()
+            def table_task(table: str) -> dict[str, object]:
+                if not hasattr(worker, "source_connection"):
+                    worker.source_connection = source_connection.engine.connect()
+                    worker.target_connection = target_connection.engine.connect()
+                    with worker_connection_lock:
+                        worker_connection_list.extend([worker.source_connection, worker.target_connection])
+                return table_copy(table, worker.source_connection, worker.target_connection)
+            try:
+                summary_list = table_schedule(level, metadata_dict["relation"], table_task, max_workers = max_workers, mode = schedule)
+            finally:
+                for worker_connection in worker_connection_list:
+                    worker_connection.close()
+    except BaseException:
+        if transfer_journal is not None:
+            transfer_journal.close()
+            print(f"transfer is stopped, run it again with checkpoint to resume from {transfer_journal.file_path}")
+        raise
+    if transfer_journal is not None:
+        transfer_journal.chunk_clear()
+        transfer_journal.close()
+    summary: pandas.DataFrame = pandas.DataFrame(summary_list, columns = ["table_name", "row_count", "elapsed_time"])
+    return summary
+
+def data_sync(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str, batch_size: int = 10000, table_list: list[str] = None) -> pandas.DataFrame:
+    """
+    Run one incremental sync cycle after the initial data_transfer: only the rows past the last synced watermark of every table are copied, and written with upsert so the changed rows are updated at the target.
+    The watermark column is chosen with data_transfer.watermark_column(). With a timestamp watermark the new and updated rows are copied, with a key watermark only the new rows. Deleted rows are never synced.
+    The last synced watermark is saved at the transfer journal (see module.transfer_journal). At the first cycle, the watermark is taken from the highest value at the target.
+    Table with primary key but without watermark column is copied in full with upsert at every cycle. Table without primary key is skipped.
+    The dataframe columns description are:
+    - table_name (string): name of the table
+    - watermark_column (string): name of the watermark column, null if the table is copied in full or skipped
+    - row_count (integer): total of row synced
+    - elapsed_time (float): time taken to sync the table in seconds
+
+    Args:
+        - source_product (string): the source database product name (example: postgresql, mysql) in lowercase
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_product (string): the target database product name in lowercase
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - batch_size (integer): total of row read and written at once
+        - table_list (list): name of the tables to sync. The default is all tables in the source schema
+
+    Returns:
+        DataFrame: watermark column, total of row and time taken for every table
+    """
+    import pandas
+    from time import perf_counter
+    from sqlalchemy import column, func, select, table as table_clause
+    from .data_transfer import batch_read, batch_upsert, watermark_column, watermark_read
+    from .transfer_journal import journal, journal_file
+    metadata_list: list[str] = ["all_table", "relation", "primary_key"]
+    if hasattr(plugin_get("metadata_get", source_product), "column_rule"):
+        metadata_list.append("column_rule")
+    metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(source_product, source_connection, source_schema, metadata_list)
+    column_rule_dict: dict[str, pandas.DataFrame] = metadata_partition(metadata_dict.get("column_rule", pandas.DataFrame()))
+    primary_key_dict: dict[str, list[str]] = {table: data['column_name'].values.tolist() for table, data in metadata_partition(metadata_dict["primary_key"]).items()}
+    level: pandas.DataFrame = level_measure(metadata_dict["all_table"], metadata_dict["relation"])
+    if table_list is not None:
+        level = level.loc[level['table_name'].isin(table_list)]
+    sync_journal = journal(journal_file(source_connection, source_schema, target_connection, target_schema))
+    summary_list: list[dict[str, object]] = []
+    try:
+        for table in level['table_name'].values.tolist():
+            start_time: float = perf_counter()
+            key_list: list[str] = primary_key_dict.get(table, [])
+            watermark: tuple[str, str] = watermark_column(key_list, column_rule_dict.get(table)) if len(key_list) != 0 else None
+            if len(key_list) == 0:
+                print(f"- {table}: skipped, no primary key")
+                summary_list.append({"table_name": table, "watermark_column": None, "row_count": 0, "elapsed_time": 0.0})
+                continue
+            if watermark is None:
+                column_list, batch_iterator = batch_read(source_connection, source_schema, table, batch_size = batch_size)
+                row_count: int = batch_upsert(target_connection, target_schema, table, column_list, key_list, batch_iterator)
+                elapsed_time: float = perf_counter() - start_time
+                print(f"- {table}: {row_count} rows copied in full (no watermark column) in {elapsed_time:.3f} s")
+                summary_list.append({"table_name": table, "watermark_column": None, "row_count": row_count, "elapsed_time": elapsed_time})
+                continue
+            column_name, kind = watermark
+            saved: tuple[str, object] = sync_journal.watermark_get(table)
+            if saved is not None and saved[0] == column_name:
+                last: object = saved[1]
+            else:
+                target = table_clause(table, column(column_name), schema = target_schema)
+                last = target_connection.execute(select(func.max(target.c[column_name]))).scalar()
+                target_connection.commit()
+            column_list, batch_iterator = watermark_read(source_connection, source_schema, table, column_name, last, inclusive = kind == "timestamp", batch_size = batch_size)
+            position: int = column_list.index(column_name)
+            state: dict[str, object] = {"last": last}
+            def watermark_track(batch_iterator: Iterator[list[tuple]]) -> Iterator[list[tuple]]:
+                for batch in batch_iterator:
+                    yield batch
+                    state["last"] = batch[-1][position]
+            row_count: int = batch_upsert(target_connection, target_schema, table, column_list, key_list, watermark_track(batch_iterator))
+            if state["last"] is not None:
+                sync_journal.watermark_set(table, column_name, state["last"])
+            elapsed_time: float = perf_counter() - start_time
+            print(f"- {table}: {row_count} rows past {column_name} = {last} in {elapsed_time:.3f} s")
+            summary_list.append({"table_name": table, "watermark_column": column_name, "row_count": row_count, "elapsed_time": elapsed_time})
+    finally:
+        sync_journal.close()
+    summary: pandas.DataFrame = pandas.DataFrame(summary_list, columns = ["table_name", "watermark_column", "row_count", "elapsed_time"])
+    return summary
+
+def data_verify(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str, table_list: list[str] = None, chunk_row_count: int = 1000000, max_workers: int = 4) -> pandas.DataFrame:
+    """
+    Verify that the rows at the target are the same as the source. Every table is split into primary key ranges (like data_transfer), and the total of row and an aggregate hash of every range is computed at both database servers (see module.data_verify), so no row is moved.
+    The ranges are checked concurrently on a bounded thread pool, each worker thread check out its own source and target connection from the engine pool.
+    The digest is only compared when both database are in the same hash family (example: mysql and mariadb), otherwise only the total of row is compared.
+    The dataframe columns description are:
+    - table_name (string): name of the table
+    - chunk_number (integer): number of the key range
+    - lower (object): the leading key value where the range start (excluded), null for the first range
+    - upper (object): the leading key value where the range end (included), null for the last range
+    - source_row_count (integer): total of row at the source
+    - target_row_count (integer): total of row at the target
+    - source_digest (string): aggregate hash at the source, null when the digest is not compared
+    - target_digest (string): aggregate hash at the target, null when the digest is not compared
+    - match (boolean): True when the range is the same at both side
+
+    Args:
+        - source_product (string): the source database product name (example: postgresql, mysql) in lowercase
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_product (string): the target database product name in lowercase
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - table_list (list): name of the tables to verify. The default is all tables in the source schema
+        - chunk_row_count (integer): the wanted total of row in a key range
+        - max_workers (integer): maximum total of key range checked at the same time
+
+    Returns:
+        DataFrame: result of every key range
+    """
+    import pandas
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import local, Lock
+    from .data_transfer import table_column, chunk_count, key_range
+    from .data_verify import checksum_family, lob_column, range_checksum
+    metadata_list: list[str] = ["all_table", "primary_key"]
+    if hasattr(plugin_get("metadata_get", source_product), "row_estimate"):
+        metadata_list.append("row_estimate")
+    metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(source_product, source_connection, source_schema, metadata_list)
+    primary_key_dict: dict[str, list[str]] = {table: data['column_name'].values.tolist() for table, data in metadata_partition(metadata_dict["primary_key"]).items()}
+    row_estimate_dict: dict[str, int] = {}
+    if len(metadata_dict.get("row_estimate", [])) != 0:
+        row_estimate_dict = dict(zip(metadata_dict["row_estimate"]['table_name'].values.tolist(), metadata_dict["row_estimate"]['row_estimate'].values.tolist()))
+    verify_table_list: list[str] = metadata_dict["all_table"]['table_name'].values.tolist() if len(metadata_dict["all_table"]) != 0 else []
+    if table_list is not None:
+        verify_table_list = [table for table in verify_table_list if table in table_list]
+    digest_compare: bool = checksum_family(source_connection) is not None and checksum_family(source_connection) == checksum_family(target_connection)
+    if not digest_compare:
+        print(f"- {source_connection.dialect.name} and {target_connection.dialect.name} do not have the same hash, only the total of row is compared")
+    worker = local()
+    worker_connection_list: list[object] = []
+    worker_connection_lock = Lock()
+    def worker_connection() -> tuple[object, object]:
+        if not hasattr(worker, "source_connection"):
+            worker.source_connection = source_connection.engine.connect()
+            worker.target_connection = target_connection.engine.connect()
+            with worker_connection_lock:
+                worker_connection_list.extend([worker.source_connection, worker.target_connection])
+        return worker.source_connection, worker.target_connection
+    # NOTE: LOB columns of every table at the source and the target, filled by table_split
+    lob_dict: dict[str, tuple[list[str], list[str]]] = {}
+    def table_split(table: str) -> tuple[str, list[str], list[tuple[object, object]]]:
+        chunk_source_connection, chunk_target_connection = worker_connection()
+        column_list: list[str] = table_column(chunk_source_connection, source_schema, table)
+        lob_dict[table] = (lob_column(chunk_source_connection, source_schema, table), lob_column(chunk_target_connection, target_schema, table))
+        range_list: list[tuple[object, object]] = [(None, None)]
+        if table in primary_key_dict and int(row_estimate_dict.get(table, 0)) > chunk_row_count:
+            range_list = key_range(chunk_source_connection, source_schema, table, primary_key_dict[table][0], chunk_count(int(row_estimate_dict[table]), chunk_row_count))
+            chunk_source_connection.commit()
+        return table, column_list, range_list
+    def chunk_verify(chunk: tuple[str, list[str], int, tuple[object, object]]) -> dict[str, object]:
+        table, column_list, chunk_number, (lower, upper) = chunk
+        chunk_source_connection, chunk_target_connection = worker_connection()
+        key_list: list[str] = primary_key_dict.get(table, [])
+        source_lob_list, target_lob_list = lob_dict[table]
+        source_row_count, source_digest = range_checksum(chunk_source_connection, source_schema, table, column_list, key_list, lower, upper, source_lob_list)
+        target_row_count, target_digest = range_checksum(chunk_target_connection, target_schema, table, column_list, key_list, lower, upper, target_lob_list)
+        if not digest_compare:
+            source_digest = target_digest = None
+        return {"table_name": table, "chunk_number": chunk_number, "lower": lower, "upper": upper, "source_row_count": source_row_count, "target_row_count": target_row_count, "source_digest": source_digest, "target_digest": target_digest, "match": source_row_count == target_row_count and source_digest == target_digest}
+    try:
+        with ThreadPoolExecutor(max_workers = max(1, max_workers)) as executor:
+            chunk_list: list[tuple[str, list[str], int, tuple[object, object]]] = [(table, column_list, chunk_number, chunk_range) for table, column_list, range_list in executor.map(table_split, verify_table_list) for chunk_number, chunk_range in enumerate(range_list)]
+            result_list: list[dict[str, object]] = list(executor.map(chunk_verify, chunk_list))
+    finally:
+        for connection in worker_connection_list:
+            connection.close()
+    result: pandas.DataFrame = pandas.DataFrame(result_list, columns = ["table_name", "chunk_number", "lower", "upper", "source_row_count", "target_row_count", "source_digest", "target_digest", "match"])
+    # NOTE: keep the key value as it is, integer key with null would be turned into float
+    result['lower'] = pandas.Series([row["lower"] for row in result_list], dtype = object)
+    result['upper'] = pandas.Series([row["upper"] for row in result_list], dtype = object)
+    for table, data in result.groupby('table_name', sort = False):
+        mismatch: int = int((~data['match']).sum())
+        print(f"- {table}: {'match' if mismatch == 0 else f'{mismatch} of {len(data)} key ranges do not match'}")
+    return result
+
+def data_repair(source_product: str, source_connection: object, source_schema: str, target_product: str, target_connection: object, target_schema: str, verify_result: pandas.DataFrame = None, table_list: list[str] = None, leaf_row_count: int = 1000, batch_size: int = 10000, max_workers: int = 4) -> pandas.DataFrame:
+    """
+    Repair the key ranges that do not match between the source and the target. Every mismatching range is split into two halves by its leading primary key column (see data_transfer.range_middle) and only the halves that still do not match are split again, like walking down a merkle tree, so the total of round trip grow with the logarithm of the table size.
+    When a range have at most leaf_row_count rows at both side (or can not be split anymore), its rows are deleted at the target and copied again from the source.
+    Table without primary key is repaired as a whole. When the source and the target are not in the same hash family only the total of row is compared, so a changed value can not be found.
+    The rows are deleted at the target, so the relation constraint at the target can refuse a repair of a parent table.
+    The dataframe columns description are:
+    - table_name (string): name of the table
+    - lower (object): the leading key value where the repaired range start (excluded), null for the first range
+    - upper (object): the leading key value where the repaired range end (included), null for the last range
+    - deleted_row_count (integer): total of row deleted at the target
+    - copied_row_count (integer): total of row copied from the source
+
+    Args:
+        - source_product (string): the source database product name (example: postgresql, mysql) in lowercase
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_product (string): the target database product name in lowercase
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - verify_result (DataFrame): result of data_verify(). The default is to run data_verify() first
+        - table_list (list): name of the tables to repair. The default is all tables in the source schema
+        - leaf_row_count (integer): maximum total of row of a range that is copied again instead of split
+        - batch_size (integer): total of row read and written at once
+        - max_workers (integer): maximum total of mismatching range repaired at the same time
+
+    Returns:
+        DataFrame: the repaired ranges
+    """
+    import pandas
+    from concurrent.futures import ThreadPoolExecutor
+    from threading import local, Lock
+    from .data_transfer import batch_read, batch_insert, keyset_read, range_delete, range_middle, table_column
+    from .data_verify import checksum_family, lob_column, range_checksum
+    if verify_result is None:
+        verify_result = data_verify(source_product, source_connection, source_schema, target_product, target_connection, target_schema, table_list = table_list, max_workers = max_workers)
+    mismatch: pandas.DataFrame = verify_result.loc[~verify_result['match']]
+    if table_list is not None:
+        mismatch = mismatch.loc[mismatch['table_name'].isin(table_list)]
+    metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(source_product, source_connection, source_schema, ["primary_key"])
+    primary_key_dict: dict[str, list[str]] = {table: data['column_name'].values.tolist() for table, data in metadata_partition(metadata_dict["primary_key"]).items()}
+    digest_compare: bool = checksum_family(source_connection) is not None and checksum_family(source_connection) == checksum_family(target_connection)
+    worker = local()
+    worker_connection_list: list[object] = []
+    worker_connection_lock = Lock()
+    def range_repair(chunk: tuple[str, object, object, int, int]) -> list[dict[str, object]]:
+        if not hasattr(worker, "source_connection"):
+            worker.source_connection = source_connection.engine.connect()
+            worker.target_connection = target_connection.engine.connect()
+            with worker_connection_lock:
+                worker_connection_list.extend([worker.source_connection, worker.target_connection])
+        chunk_source_connection, chunk_target_connection = worker.source_connection, worker.target_connection
+        table, lower, upper, source_row_count, target_row_count = chunk
+        key_list: list[str] = primary_key_dict.get(table, [])
+        column_list: list[str] = table_column(chunk_source_connection, source_schema, table)
+        source_lob_list: list[str] = lob_column(chunk_source_connection, source_schema, table)
+        target_lob_list: list[str] = lob_column(chunk_target_connection, target_schema, table)
+        repair_list: list[dict[str, object]] = []
+        stack: list[tuple[object, object, int, int]] = [(lower, upper, source_row_count, target_row_count)]
+        while stack:
+            lower, upper, source_row_count, target_row_count = stack.pop()
+            middle: object = None
+            if len(key_list) != 0 and max(source_row_count, target_row_count) > leaf_row_count:
+                middle = range_middle(chunk_source_connection, source_schema, table, key_list[0], lower, upper)
+                if middle is None and source_row_count == 0:
+                    middle = range_middle(chunk_target_connection, target_schema, table, key_list[0], lower, upper)
+                chunk_source_connection.commit()
+                chunk_target_connection.commit()
+            if middle is None:
+                key_column: str = key_list[0] if len(key_list) != 0 else None
+                # NOTE: the delete and the copy are committed together, so a failed read or insert leave the target range as it was before the repair
+                try:
+                    deleted_row_count: int = range_delete(chunk_target_connection, target_schema, table, key_column, lower, upper, commit = False)
+                    if len(key_list) != 0:
+                        read_column_list, batch_iterator = keyset_read(chunk_source_connection, source_schema, table, key_list, lower, upper, batch_size = batch_size, column_list = column_list)
+                    else:
+                        read_column_list, batch_iterator = batch_read(chunk_source_connection, source_schema, table, batch_size = batch_size)
+                    copied_row_count: int = batch_insert(chunk_target_connection, target_schema, table, read_column_list, batch_iterator, commit = False)
+                    chunk_target_connection.commit()
+                except Exception:
+                    chunk_target_connection.rollback()
+                    raise
+                finally:
+                    chunk_source_connection.commit()
+                repair_list.append({"table_name": table, "lower": lower, "upper": upper, "deleted_row_count": deleted_row_count, "copied_row_count": copied_row_count})
+                continue
+            for half_lower, half_upper in [(lower, middle), (middle, upper)]:
+                half_source_row_count, source_digest = range_checksum(chunk_source_connection, source_schema, table, column_list, key_list, half_lower, half_upper, source_lob_list)
+                half_target_row_count, target_digest = range_checksum(chunk_target_connection, target_schema, table, column_list, key_list, half_lower, half_upper, target_lob_list)
+                if half_source_row_count != half_target_row_count or (digest_compare and source_digest != target_digest):
+                    stack.append((half_lower, half_upper, half_source_row_count, half_target_row_count))
+        return repair_list
+    chunk_list: list[tuple[str, object, object, int, int]] = list(zip(mismatch['table_name'].values.tolist(), mismatch['lower'].values.tolist(), mismatch['upper'].values.tolist(), mismatch['source_row_count'].values.tolist(), mismatch['target_row_count'].values.tolist()))
+    try:
+        with ThreadPoolExecutor(max_workers = max(1, max_workers)) as executor:
+            repair_list: list[dict[str, object]] = [repair for chunk_repair_list in executor.map(range_repair, chunk_list) for repair in chunk_repair_list]
+    finally:
+        for connection in worker_connection_list:
+            connection.close()
+    result: pandas.DataFrame = pandas.DataFrame(repair_list, columns = ["table_name", "lower", "upper", "deleted_row_count", "copied_row_count"])
+    result['lower'] = pandas.Series([row["lower"] for row in repair_list], dtype = object)
+    result['upper'] = pandas.Series([row["upper"] for row in repair_list], dtype = object)
+    for table, data in result.groupby('table_name', sort = False):
+        print(f"- {table}: {len(data)} ranges repaired, {data['deleted_row_count'].sum()} rows deleted and {data['copied_row_count'].sum()} rows copied")
+    return result
+
+def connection_schema_choose(connection_dict: list[dict[str, str]], connection_dialogue: str, schema_dialogue: str, schema_list_title: str = "Available schema:") -> tuple[dict[str, str], object, str]:
+    """
+    Ask which connection and which schema to use.
+
+    Args:
+        - connection_dict (list): result of credential_get()
+        - connection_dialogue (string): question to choose the connection
+        - schema_dialogue (string): question to choose the schema
+        - schema_list_title (string): title of the schema list
+
+    Returns:
+        - credential (dictionary): the chosen credential
+        - conn (object): sqlalchemy connection object of the chosen credential
+        - schema (string): the chosen schema
+    """
+    from .connection import engine_get
+    connection_choose_dialogue = "\nAvailable connection:"
+    for credential in connection_dict:
+        connection_choose_dialogue = connection_choose_dialogue + f"\n{connection_dict.index(credential) + 1}. credential {credential['name']}: product = {credential['product']}, local environment path = {credential['local_environment']} -> {credential['user']}:{credential['password']}@{credential['host']}:{credential['port']}"
+    print(connection_choose_dialogue)
+    connection_choose: int = int(input(f"\n\n{connection_dialogue}"))
+    connection_choose = connection_dict[connection_choose - 1]
+    method = plugin_get("metadata_get", connection_choose["product"])
+    # NOTE: the connection is checked out from the pooled engine of the credential, the workers of every tool check out from the same pool
+    conn = engine_get(connection_choose).connect()
+    schema_list = method.all_schema(conn)
+    schema_choose_dialogue = f"\n{schema_list_title}"
+    for i, j in enumerate(schema_list, 1):
+        schema_choose_dialogue = schema_choose_dialogue + f"\n{i}. {j}"
+    schema_choose_dialogue = schema_choose_dialogue + f"\n\n{schema_dialogue}"
+    schema_choose: int = int(input(schema_choose_dialogue))
+    schema = schema_list[schema_choose - 1]
+    return connection_choose, conn, schema
+
+def batch_argument(argument_list: list[str]) -> dict[str, object]:
+    """
+    Read the argument of the non-interactive batch runner from the command line. The argument can also be written at a json job file (--job), the command line argument override the job file.
+    Example: python main.py level_measure --credential prod_1 prod_2 --workers 16 --per-database 2
+
+    Args:
+        - argument_list (list): the command line argument (example: sys.argv[1:])
+
+    Returns:
+        argument_dict (dictionary): keyword argument of batch_runner() (without connection_dict)
+    """
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(prog = "main.py", description = "Run a tool for every schema of every credential at credential.csv without any question.")
+    parser.add_argument("tool", nargs = "?", choices = ["level_measure", "ddl_transfer"], help = "the tool to run")
+    parser.add_argument("--job", help = "path of a json job file, with the long argument name as key (example: {\"tool\": \"level_measure\", \"credential\": [\"prod_1\"]})")
+    parser.add_argument("--credential", nargs = "+", help = "name of the credentials to run. The default is all credentials")
+    parser.add_argument("--schema", nargs = "+", help = "name of the schemas to run. The default is all schemas of every credential")
+    parser.add_argument("--target", help = "name of the target credential, needed by ddl_transfer")
+    parser.add_argument("--workers", type = int, default = 8, help = "maximum total of schema run at the same time")
+    parser.add_argument("--per-database", type = int, default = 2, help = "maximum total of schema of the same credential run at the same time")
+    parser.add_argument("--compress", action = "store_true", help = "write the ddl_transfer result with gzip")
+    argument = parser.parse_args(argument_list)
+    if argument.job is not None:
+        with open(argument.job, encoding = "utf-8") as job_file:
+            job: dict[str, object] = json.load(job_file)
+        parser.set_defaults(**{key.replace("-", "_"): value for key, value in job.items()})
+        argument = parser.parse_args(argument_list)
+    if argument.tool is None:
+        parser.error("the tool is needed, as argument or at the job file")
+    if argument.tool == "ddl_transfer" and argument.target is None:
+        parser.error("ddl_transfer need --target")
+    argument_dict: dict[str, object] = {"tool": argument.tool, "credential_name_list": argument.credential, "schema_name_list": argument.schema, "target_name": argument.target, "max_workers": argument.workers, "per_database": argument.per_database, "compress": argument.compress}
+    return argument_dict
+
+def batch_runner(connection_dict: list[dict[str, str]], tool: str, credential_name_list: list[str] = None, schema_name_list: list[str] = None, target_name: str = None, max_workers: int = 8, per_database: int = 2, compress: bool = False) -> pandas.DataFrame:
+    """
+    Run level measure or ddl transfer for every schema (from metadata_get.<product>.all_schema) of every credential without any question. The result file is saved at the same place as main_runner().
+    The schemas are run on a bounded thread pool, and a schema is only started when its credential have less than per_database running schema, so one database is never overloaded.
+    A failed schema does not stop the others, the error is kept at the summary. The summary is saved at root\result\batch_runner.
+    The dataframe columns description are:
+    - credential (string): name of the credential
+    - schema (string): name of the schema, null when the schema list can not be taken
+    - status (string): 'done' or the error message
+    - file_path (string): path of the result file
+    - elapsed_time (float): time taken in seconds
+
+    Args:
+        - connection_dict (list): result of credential_get()
+        - tool (string): 'level_measure' or 'ddl_transfer'
+        - credential_name_list (list): name of the credentials to run. The default is all credentials
+        - schema_name_list (list): name of the schemas to run. The default is all schemas
+        - target_name (string): name of the target credential for ddl_transfer, only its product is used
+        - max_workers (integer): maximum total of schema run at the same time
+        - per_database (integer): maximum total of schema of the same credential run at the same time
+        - compress (boolean): True to write the ddl_transfer result with gzip
+
+    Returns:
+        DataFrame: result of every schema
+    """
+    import pandas
+    from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+    from datetime import datetime
+    from time import perf_counter
+    from .connection import engine_get
+    current_timestamp: str = datetime.strftime(datetime.now(), '%Y%m%d_%H%M%S')
+    root_path: str = str(Path(__file__).parent.parent)
+    credential_list: list[dict[str, str]] = [credential for credential in connection_dict if credential_name_list is None or credential['name'] in credential_name_list]
+    target_product: str = None
+    if tool == "ddl_transfer":
+        target_list: list[dict[str, str]] = [credential for credential in connection_dict if credential['name'] == target_name]
+        if len(target_list) == 0:
+            raise Exception(f"there is no credential {target_name} at credential.csv")
+        target_product = target_list[0]['product']
+    summary_list: list[dict[str, object]] = []
+    def schema_get(credential: dict[str, str]) -> list[str]:
+        with engine_get(credential).connect() as conn:
+            schema_list: list[str] = plugin_get("metadata_get", credential['product']).all_schema(conn)
+        return [schema for schema in schema_list if schema_name_list is None or schema in schema_name_list]
+    def schema_run(credential: dict[str, str], schema: str) -> str:
+        with engine_get(credential).connect() as conn:
+            if tool == "level_measure":
+                metadata_dict: dict[str, pandas.DataFrame] = metadata_fetch(credential['product'], conn, schema, ["all_table", "relation"])
+                file_path: str = os.path.join(root_path, 'result', 'level_measure', f'{credential["host"]} {credential["database"]} {schema} {current_timestamp}.csv')
+                os.makedirs(os.path.dirname(file_path), exist_ok = True)
+                level_measure(metadata_dict["all_table"], metadata_dict["relation"]).to_csv(path_or_buf = file_path, sep = '|', index = False)
+            else:
+                file_path = os.path.join(root_path, 'result', 'ddl_transfer', f'{credential["host"]} {credential["database"]} {schema} {current_timestamp}.sql' + ('.gz' if compress else ''))
+                ddl_write(ddl_transfer(source_product = credential['product'], source_connection = conn, source_schema = schema, target_product = target_product, target_connection = None, target_schema = schema), file_path, compress = compress)
+        return file_path
+    with ThreadPoolExecutor(max_workers = max(1, max_workers)) as executor:
+        schema_future: dict[object, dict[str, str]] = {executor.submit(schema_get, credential): credential for credential in credential_list}
+        waiting_list: list[tuple[dict[str, str], str]] = []
+        for future, credential in schema_future.items():
+            try:
+                waiting_list.extend((credential, schema) for schema in future.result())
+            except Exception as error:
+                print(f"- {credential['name']}: schema list failed, {error}")
+                summary_list.append({"credential": credential['name'], "schema": None, "status": str(error), "file_path": None, "elapsed_time": 0.0})
+        # NOTE: the schemas are started one by one from the waiting list, skipping the credential that already have per_database running schema
+        running_count: dict[str, int] = {credential['name']: 0 for credential in credential_list}
+        running: dict[object, tuple[dict[str, str], str, float]] = {}
+        while waiting_list or running:
+            still_waiting_list: list[tuple[dict[str, str], str]] = []
+            for credential, schema in waiting_list:
+                if len(running) < max(1, max_workers) and running_count[credential['name']] < max(1, per_database):
+                    running_count[credential['name']] = running_count[credential['name']] + 1
+                    running[executor.submit(schema_run, credential, schema)] = (credential, schema, perf_counter())
+                else:
+                    still_waiting_list.append((credential, schema))
+            waiting_list = still_waiting_list
+            done, _ = wait(running, return_when = FIRST_COMPLETED)
+            for future in done:
+                credential, schema, start_time = running.pop(future)
+                running_count[credential['name']] = running_count[credential['name']] - 1
+                try:
+                    file_path: str = future.result()
+                    status: str = "done"
+                except Exception as error:
+                    file_path, status = None, str(error)
+                elapsed_time: float = perf_counter() - start_time
+                print(f"- {credential['name']}.{schema}: {status} in {elapsed_time:.3f} s")
+                summary_list.append({"credential": credential['name'], "schema": schema, "status": status, "file_path": file_path, "elapsed_time": elapsed_time})
+    summary: pandas.DataFrame = pandas.DataFrame(summary_list, columns = ["credential", "schema", "status", "file_path", "elapsed_time"])
+    summary_path: str = os.path.join(root_path, 'result', 'batch_runner', f'{tool} {current_timestamp}.csv')
+    os.makedirs(os.path.dirname(summary_path), exist_ok = True)
+    summary.to_csv(path_or_buf = summary_path, sep = '|', index = False)
+    print(f"\n{(summary['status'] == 'done').sum()} of {len(summary)} schemas done, summary is saved at {summary_path}")
+    return summary
 
 def main_runner(connection_dict: list[dict[str, str]]):
     from datetime import datetime
@@ -165,32 +1211,19 @@ def main_runner(connection_dict: list[dict[str, str]]):
     action_choose_dialogue = """\nAvailable tools:
 1. Level measure
 2. DDL transfer
+3. Data transfer
+4. Data sync
+5. Data verify
+6. DDL diff
 
 What tool you want to use: """
     action_choose: int = int(input(f"{action_choose_dialogue}"))
     if action_choose == 1:
-        connection_choose_dialogue = "\nAvailable connection:"
-        for credential in connection_dict:
-            connection_choose_dialogue = connection_choose_dialogue + f"\n{connection_dict.index(credential) + 1}. credential {credential['name']}: product = {credential['product']}, local environment path = {credential['local_environment']} -> {credential['user']}:{credential['password']}@{credential['host']}:{credential['port']}"
-        connection_choose_dialogue = connection_choose_dialogue + "\n\nChoose which connection you want to measure: "
-        connection_choose: int = int(input(connection_choose_dialogue))
-        connection_choose = connection_dict[connection_choose - 1]
+        connection_choose, conn, schema = connection_schema_choose(connection_dict, "Choose which connection you want to measure: ", "What schema you want to measure? ")
         module_name = connection_choose["product"]
-        module_path = f"module.metadata_get"
-        metadata_get = import_module(module_path)
-        method = getattr(metadata_get, module_name)
-        url = method.url(user = connection_choose['user'], password = connection_choose['password'], host = connection_choose['host'], port = connection_choose['port'], database = connection_choose['database'])
-        engine = sqlalchemy.create_engine(url)
-        conn = engine.connect()
-        schema_list = method.all_schema(conn)
-        schema_choose_dialogue = "\nAvailable schema:"
-        for i, j in enumerate(schema_list, 1):
-            schema_choose_dialogue = schema_choose_dialogue + f"\n{i}. {j}"
-        schema_choose_dialogue = schema_choose_dialogue + "\n\nWhat schema you want to measure? "
-        schema_choose: int = int(input(schema_choose_dialogue))
-        schema = schema_list[schema_choose - 1]
-        all_table = method.all_table(conn, schema)
-        relation = method.relation(conn, schema)
+        metadata_dict = metadata_fetch(module_name, conn, schema, ["all_table", "relation"])
+        all_table = metadata_dict["all_table"]
+        relation = metadata_dict["relation"]
         level_measure_result = level_measure(all_table, relation)
         save_result = input("\nDo you want to save the result?(y/n) ")
         while save_result not in ['y', 'n']:
@@ -205,43 +1238,64 @@ What tool you want to use: """
             level_measure_result.to_csv(path_or_buf = new_file_path, sep = '|', index = False)
         return level_measure_result
     elif action_choose == 2:
-        module_path = f"module.metadata_get"
-        metadata_get = import_module(module_path)
-        connection_choose_dialogue = "\nAvailable connection:"
-        for credential in connection_dict:
-            connection_choose_dialogue = connection_choose_dialogue + f"\n{connection_dict.index(credential) + 1}. credential {credential['name']}: product = {credential['product']}, local environment path = {credential['local_environment']} -> {credential['user']}:{credential['password']}@{credential['host']}:{credential['port']}"
-        print(connection_choose_dialogue)
-        source_connection_choose: int = int(input("\n\nChoose which one is the source connection: "))
-        source_connection_choose = connection_dict[source_connection_choose - 1]
-        source_module_name = source_connection_choose["product"]
-        source_method = getattr(metadata_get, source_module_name)
-        source_url = source_method.url(user = source_connection_choose['user'], password = source_connection_choose['password'], host = source_connection_choose['host'], port = source_connection_choose['port'], database = source_connection_choose['database'])
-        source_engine = sqlalchemy.create_engine(source_url)
-        source_conn = source_engine.connect()
-        source_schema_list = source_method.all_schema(source_conn)
-        source_schema_choose_dialogue = "\nAvailable schema on source:"
-        for i, j in enumerate(source_schema_list, 1):
-            source_schema_choose_dialogue = source_schema_choose_dialogue + f"\n{i}. {j}"
-        source_schema_choose_dialogue = source_schema_choose_dialogue + "\n\nWhat schema you want to transfer? "
-        source_schema_choose: int = int(input(source_schema_choose_dialogue))
-        source_schema = source_schema_list[source_schema_choose - 1]
-        connection_choose_dialogue = "\nAvailable connection:"
-        for credential in connection_dict:
-            connection_choose_dialogue = connection_choose_dialogue + f"\n{connection_dict.index(credential) + 1}. credential {credential['name']}: product = {credential['product']}, local environment path = {credential['local_environment']} -> {credential['user']}:{credential['password']}@{credential['host']}:{credential['port']}"
-        print(connection_choose_dialogue)
-        target_connection_choose: int = int(input("\n\nChoose which one is the target connection: "))
-        target_connection_choose = connection_dict[target_connection_choose - 1]
-        target_module_name = target_connection_choose["product"]
-        target_method = getattr(metadata_get, target_module_name)
-        target_url = target_method.url(user = target_connection_choose['user'], password = target_connection_choose['password'], host = target_connection_choose['host'], port = target_connection_choose['port'], database = target_connection_choose['database'])
-        target_engine = sqlalchemy.create_engine(target_url)
-        target_conn = target_engine.connect()
-        target_schema_list = target_method.all_schema(target_conn)
-        target_schema_choose_dialogue = "\nAvailable schema on target:"
-        for i, j in enumerate(target_schema_list, 1):
-            target_schema_choose_dialogue = target_schema_choose_dialogue + f"\n{i}. {j}"
-        target_schema_choose_dialogue = target_schema_choose_dialogue + "\n\nWhat schema is the transfer destination? "
-        target_schema_choose: int = int(input(target_schema_choose_dialogue))
-        target_schema = target_schema_list[target_schema_choose - 1]
-        ddl_transfer(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema)
-        # raise NotImplementedError
+        source_connection_choose, source_conn, source_schema = connection_schema_choose(connection_dict, "Choose which one is the source connection: ", "What schema you want to transfer? ", "Available schema on source:")
+        target_connection_choose, target_conn, target_schema = connection_schema_choose(connection_dict, "Choose which one is the target connection: ", "What schema is the transfer destination? ", "Available schema on target:")
+        compress_result = input("\nDo you want to compress the result?(y/n) ")
+        while compress_result not in ['y', 'n']:
+            compress_result = input("\nPlease enter valid answer. Do you want to compress the result?(y/n) ")
+        new_path = os.path.join(str(Path(__file__).parent.parent), 'result', 'ddl_transfer')
+        new_file_path = os.path.join(new_path, f'{source_connection_choose["host"]} {source_connection_choose["database"]} {source_schema} {current_timestamp}.sql')
+        if compress_result == 'y':
+            new_file_path = new_file_path + '.gz'
+        ddl_iterator = ddl_transfer(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema)
+        table_count = ddl_write(ddl_iterator, new_file_path, compress = compress_result == 'y')
+        print(f"\nddl of {table_count} tables is saved at {new_file_path}")
+    elif action_choose == 3:
+        source_connection_choose, source_conn, source_schema = connection_schema_choose(connection_dict, "Choose which one is the source connection: ", "What schema you want to transfer? ", "Available schema on source:")
+        target_connection_choose, target_conn, target_schema = connection_schema_choose(connection_dict, "Choose which one is the target connection: ", "What schema is the transfer destination? ", "Available schema on target:")
+        batch_size = input("\nHow many rows for every batch? (default 10000) ")
+        batch_size: int = int(batch_size) if batch_size != '' else 10000
+        max_workers = input("\nHow many tables are copied at the same time? (default 1) ")
+        max_workers: int = int(max_workers) if max_workers != '' else 1
+        schedule = "level"
+        if max_workers > 1:
+            schedule = input("\nStart a table when its whole level is finished or when its own parents are finished?(level/dag) ")
+            while schedule not in ['level', 'dag']:
+                schedule = input("\nPlease enter valid answer. Start a table when its whole level is finished or when its own parents are finished?(level/dag) ")
+        checkpoint = input("\nDo you want to keep a checkpoint so a failed transfer can be resumed?(y/n) ")
+        while checkpoint not in ['y', 'n']:
+            checkpoint = input("\nPlease enter valid answer. Do you want to keep a checkpoint so a failed transfer can be resumed?(y/n) ")
+        transfer_result = data_transfer(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema, batch_size = batch_size, max_workers = max_workers, schedule = schedule, checkpoint = checkpoint == 'y')
+        print(f"\n{transfer_result['row_count'].sum()} rows of {len(transfer_result)} tables are transferred")
+        return transfer_result
+    elif action_choose == 4:
+        source_connection_choose, source_conn, source_schema = connection_schema_choose(connection_dict, "Choose which one is the source connection: ", "What schema you want to sync? ", "Available schema on source:")
+        target_connection_choose, target_conn, target_schema = connection_schema_choose(connection_dict, "Choose which one is the target connection: ", "What schema is the sync destination? ", "Available schema on target:")
+        batch_size = input("\nHow many rows for every batch? (default 10000) ")
+        batch_size: int = int(batch_size) if batch_size != '' else 10000
+        sync_result = data_sync(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema, batch_size = batch_size)
+        print(f"\n{sync_result['row_count'].sum()} rows of {sync_result['watermark_column'].notna().sum()} tables are synced")
+        return sync_result
+    elif action_choose == 5:
+        source_connection_choose, source_conn, source_schema = connection_schema_choose(connection_dict, "Choose which one is the source connection: ", "What schema you want to verify? ", "Available schema on source:")
+        target_connection_choose, target_conn, target_schema = connection_schema_choose(connection_dict, "Choose which one is the target connection: ", "What schema is the transfer destination? ", "Available schema on target:")
+        verify_result = data_verify(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema)
+        mismatch_table = verify_result.loc[~verify_result['match'], 'table_name'].unique().tolist()
+        print(f"\n{len(mismatch_table)} tables do not match" + (f": {', '.join(mismatch_table)}" if len(mismatch_table) != 0 else ""))
+        if len(mismatch_table) != 0:
+            repair = input("\nDo you want to repair the rows that do not match?(y/n) ")
+            while repair not in ['y', 'n']:
+                repair = input("\nPlease enter valid answer. Do you want to repair the rows that do not match?(y/n) ")
+            if repair == 'y':
+                repair_result = data_repair(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema, verify_result = verify_result)
+                print(f"\n{repair_result['copied_row_count'].sum()} rows are copied again")
+                return repair_result
+        return verify_result
+    elif action_choose == 6:
+        source_connection_choose, source_conn, source_schema = connection_schema_choose(connection_dict, "Choose which one is the source connection: ", "What schema you want to compare? ", "Available schema on source:")
+        target_connection_choose, target_conn, target_schema = connection_schema_choose(connection_dict, "Choose which one is the target connection: ", "What schema you want to change? ", "Available schema on target:")
+        new_path = os.path.join(str(Path(__file__).parent.parent), 'result', 'ddl_diff')
+        new_file_path = os.path.join(new_path, f'{target_connection_choose["host"]} {target_connection_choose["database"]} {target_schema} {current_timestamp}.sql')
+        ddl_iterator = ddl_diff(source_product = source_connection_choose["product"], source_connection = source_conn, source_schema = source_schema, target_product = target_connection_choose["product"], target_connection = target_conn, target_schema = target_schema)
+        statement_count = ddl_write(ddl_iterator, new_file_path)
+        print(f"\n{statement_count} statements are saved at {new_file_path}")
@@ -0,0 +1,184 @@
+"""
+Module to record the progress of a data transfer on disk, so a failed transfer can be resumed without copying the finished part again.
+The journal is a SQLite file at root\\result\\transfer_journal, one file for every (source, target) schema pair. It store the key ranges of every table and the ranges that are already committed at the target.
+It also store the last synced watermark of every table for the incremental sync (see toolbox.data_sync).
+The finished ranges are written in batches, a range that is lost from the journal will only be copied again (after its rows are deleted from the target).
+"""
+
+import os
+import pickle
+import sqlite3
+from hashlib import sha1
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+
+
+def journal_file(source_connection: object, source_schema: str, target_connection: object, target_schema: str, journal_path: str = os.path.join(str(Path(__file__).parent.parent), "result", "transfer_journal")) -> str:
+    """
+    Get the journal file path of a transfer.
+
+    Args:
+        - source_connection (object): sqlalchemy connection object of the source database
+        - source_schema (string): name of the source schema
+        - target_connection (object): sqlalchemy connection object of the target database
+        - target_schema (string): name of the target schema
+        - journal_path (string): directory path of the journal files. The default path will be "root\\result\\transfer_journal"
+
+    Returns:
+        file_path (string): path of the journal file
+    """
+    key_list: list[str] = []
+    for connection, schema in [(source_connection, source_schema), (target_connection, target_schema)]:
+        url = connection.engine.url
+        database: str = url.database or url.query.get("service_name", "")
+        key_list.extend([str(url.host), str(url.port), str(database), schema])
+    file_path: str = os.path.join(journal_path, f"{sha1('|'.join(key_list).encode('utf-8')).hexdigest()}.sqlite")
+    return file_path
+
+
+class journal:
+    '''
+    Class object to read and write the checkpoint journal of a transfer. The object can be shared by several threads.
+
+    Args:
+        - file_path (string): path of the journal file, result of journal_file()
+        - flush_count (integer): total of finished range kept in memory before they are written
+        - flush_interval (float): maximum second a finished range is kept in memory before it is written
+    '''
+
+    def __init__(self, file_path: str, flush_count: int = 64, flush_interval: float = 5.0) -> None:
+        os.makedirs(os.path.dirname(file_path), exist_ok = True)
+        self.file_path = file_path
+        self.flush_count = flush_count
+        self.flush_interval = flush_interval
+        # finished range that is not written yet
+        self.pending: list[tuple[str, int, int]] = []
+        self.last_flush = monotonic()
+        self.lock = Lock()
+        self.database = sqlite3.connect(file_path, check_same_thread = False)
+        self.database.execute("create table if not exists chunk_range (table_name text, chunk_number integer, lower blob, upper blob, primary key (table_name, chunk_number))")
+        self.database.execute("create table if not exists chunk_done (table_name text, chunk_number integer, row_count integer, primary key (table_name, chunk_number))")
+        self.database.execute("create table if not exists watermark (table_name text primary key, column_name text, value blob)")
+        self.database.commit()
+
+    def __repr__(self) -> str:
+        return f'journal(file_path = {self.file_path})'
+
+    def range_get(self, table: str) -> list[tuple[object, object]]:
+        '''
+        Get the key ranges of a table that was saved by the previous run.
+
+        Args:
+            - table (string): name of the table
+
+        Returns:
+            range_list (list): the key ranges (see data_transfer.key_range), None if the table was never started
+        '''
+        with self.lock:
+            row_list = self.database.execute("select lower, upper from chunk_range where table_name = ? order by chunk_number", (table, )).fetchall()
+        if len(row_list) == 0:
+            return None
+        return [(pickle.loads(lower), pickle.loads(upper)) for lower, upper in row_list]
+
+    def range_set(self, table: str, range_list: list[tuple[object, object]]) -> None:
+        '''
+        Save the key ranges of a table before any of them is copied. This is written at once.
+
+        Args:
+            - table (string): name of the table
+            - range_list (list): the key ranges (see data_transfer.key_range)
+        '''
+        with self.lock:
+            self.database.executemany("insert or replace into chunk_range values (?, ?, ?, ?)", [(table, number, pickle.dumps(lower), pickle.dumps(upper)) for number, (lower, upper) in enumerate(range_list)])
+            self.database.commit()
+
+    def chunk_done(self, table: str) -> set[int]:
+        '''
+        Get the number of the ranges of a table that are already committed at the target.
+
+        Args:
+            - table (string): name of the table
+
+        Returns:
+            done_set (set): number of the finished ranges
+        '''
+        with self.lock:
+            done_set: set[int] = {row[0] for row in self.database.execute("select chunk_number from chunk_done where table_name = ?", (table, ))}
+            done_set.update(number for table_name, number, _ in self.pending if table_name == table)
+        return done_set
+
+    def chunk_mark(self, table: str, chunk_number: int, row_count: int) -> None:
+        '''
+        Mark a range as committed at the target. The mark is written together with the other marks when flush_count or flush_interval is reached.
+
+        Args:
+            - table (string): name of the table
+            - chunk_number (integer): number of the range
+            - row_count (integer): total of row copied for the range
+        '''
+        with self.lock:
+            self.pending.append((table, chunk_number, row_count))
+            if len(self.pending) >= self.flush_count or monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self) -> None:
+        '''
+        Write all marks that are kept in memory.
+        '''
+        with self.lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if len(self.pending) != 0:
+            self.database.executemany("insert or replace into chunk_done values (?, ?, ?)", self.pending)
+            self.database.commit()
+            self.pending = []
+        self.last_flush = monotonic()
+
+    def chunk_clear(self) -> None:
+        '''
+        Delete the key ranges and the finished ranges of all tables (example: when the whole transfer is finished), so the next transfer start from the beginning.
+        '''
+        with self.lock:
+            self.pending = []
+            self.database.execute("delete from chunk_range")
+            self.database.execute("delete from chunk_done")
+            self.database.commit()
+
+    def watermark_get(self, table: str) -> tuple[str, object]:
+        '''
+        Get the last synced watermark of a table.
+
+        Args:
+            - table (string): name of the table
+
+        Returns:
+            watermark (tuple): name of the watermark column and its last synced value, None if the table was never synced
+        '''
+        with self.lock:
+            row = self.database.execute("select column_name, value from watermark where table_name = ?", (table, )).fetchone()
+        if row is None:
+            return None
+        return row[0], pickle.loads(row[1])
+
+    def watermark_set(self, table: str, column: str, value: object) -> None:
+        '''
+        Save the last synced watermark of a table. This is written at once.
+
+        Args:
+            - table (string): name of the table
+            - column (string): name of the watermark column
+            - value (object): the highest watermark value that is committed at the target
+        '''
+        with self.lock:
+            self.database.execute("insert or replace into watermark values (?, ?, ?)", (table, column, pickle.dumps(value)))
+            self.database.commit()
+
+    def close(self) -> None:
+        '''
+        Write all marks that are kept in memory and close the journal.
+        '''
+        with self.lock:
+            self._flush()
+            self.database.close()
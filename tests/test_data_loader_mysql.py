@@ -0,0 +1,38 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+
+from module.data_loader.mysql import file_value, time_text
+
+
+@pytest.mark.parametrize("value, field", [
+    (None, b"\\N"),
+    ("plain", b"plain"),
+    ("tab\there", b"tab\\there"),
+    ("line\nbreak\r", b"line\\nbreak\\r"),
+    ("back\\slash", b"back\\\\slash"),
+    ("nul\0", b"nul\\0"),
+    ("\\N", b"\\\\N"),
+    ("日本😀", "日本😀".encode("utf-8")),
+    (True, b"1"),
+    (False, b"0"),
+    (12, b"12"),
+    (Decimal("1.50"), b"1.50"),
+    (b"a\tb\\\x00", b"a\\tb\\\\\\0"),
+    (datetime(2024, 1, 2, 3, 4, 5, 6), b"2024-01-02 03:04:05.000006"),
+    (date(2024, 1, 2), b"2024-01-02"),
+    (time(3, 4, 5), b"03:04:05"),
+    (timedelta(hours = 1, seconds = 2), b"01:00:02.000000"),
+    ({"a": "x\ty"}, b'{"a": "x\\\\ty"}'),
+    ({"b", "a"}, b"a,b")])
+def test_file_value(value, field):
+    assert file_value(value) == field
+
+def test_file_value_strict():
+    with pytest.raises(UnicodeEncodeError):
+        file_value("\ud800")
+
+def test_time_text():
+    assert time_text(timedelta(hours = 30)) == "30:00:00.000000"
+    assert time_text(-timedelta(seconds = 1, microseconds = 5)) == "-00:00:01.000005"
@@ -0,0 +1,59 @@
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from module.data_loader.postgresql import binary_data_text, binary_encoder_dict, interval_text, json_text, text_converter, text_value
+
+
+@pytest.mark.parametrize("value, text", [
+    (None, "\\N"),
+    ("plain", "plain"),
+    ("tab\there", "tab\\there"),
+    ("line\nbreak\r", "line\\nbreak\\r"),
+    ("back\\slash", "back\\\\slash"),
+    ("\\N", "\\\\N"),
+    (True, "t"),
+    (False, "f"),
+    (12, "12"),
+    (Decimal("1.50"), "1.50"),
+    (float("nan"), "NaN"),
+    (float("inf"), "Infinity"),
+    (float("-inf"), "-Infinity"),
+    (0.1, "0.1"),
+    (b"\x00\xff", "\\\\x00ff"),
+    (datetime(2024, 1, 2, 3, 4, 5, 6), "2024-01-02 03:04:05.000006"),
+    (date(2024, 1, 2), "2024-01-02"),
+    (time(3, 4, 5), "03:04:05")])
+def test_text_value(value, text):
+    assert text_value(value) == text
+
+def test_interval_text():
+    assert interval_text(timedelta(hours = 26, minutes = 1, seconds = 2, microseconds = 3)) == "26:01:02.000003"
+    assert interval_text(-timedelta(minutes = 1)) == "-00:01:00.000000"
+
+def test_binary_data_text():
+    assert binary_data_text(None) == "\\N"
+    assert binary_data_text(b"ab") == "\\\\x6162"
+    assert binary_data_text("ab") == "\\\\x6162"
+
+def test_json_text():
+    assert json_text({"a": "x\ty"}) == '{"a": "x\\\\ty"}'
+    assert json_text('{"a": 1}') == '{"a": 1}'
+
+def test_text_converter():
+    assert text_converter(None) is text_value
+    assert text_converter({"data_type": "LONGBLOB"}) is binary_data_text
+    assert text_converter({"data_type": "json"}) is json_text
+    assert text_converter({"data_type": "varchar"}) is text_value
+
+def test_binary_encoder():
+    assert binary_encoder_dict["int4"](7) == struct.pack("!i", 7)
+    assert binary_encoder_dict["bool"](True) == b"\x01"
+    assert binary_encoder_dict["jsonb"]({"a": 1}) == b'\x01{"a": 1}'
+    assert binary_encoder_dict["date"](date(2000, 1, 2)) == struct.pack("!i", 1)
+    assert binary_encoder_dict["timestamp"](datetime(2000, 1, 1, 0, 0, 1)) == struct.pack("!q", 1000000)
+    assert binary_encoder_dict["timestamptz"](datetime(2000, 1, 1, 1, 0, 0, tzinfo = timezone(timedelta(hours = 1)))) == struct.pack("!q", 0)
+    assert binary_encoder_dict["time"](time(0, 0, 1)) == struct.pack("!q", 1000000)
+    assert binary_encoder_dict["time"](timedelta(seconds = 1)) == struct.pack("!q", 1000000)
@@ -0,0 +1,138 @@
+from types import SimpleNamespace
+
+import pandas
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql, oracle, postgresql
+
+from module.data_transfer import batch_read, batch_upsert, chunk_count, insert_script, key_range, keyset_read, stream_read, upsert_script, watermark_column
+
+
+def dialect_connection(dialect: object) -> SimpleNamespace:
+    return SimpleNamespace(dialect = dialect)
+
+@pytest.fixture
+def connection():
+    with create_engine("sqlite://").connect() as connection:
+        connection.exec_driver_sql("create table number_key (id integer primary key, v text)")
+        connection.exec_driver_sql("insert into number_key values " + ", ".join(f"({number}, 'v{number}')" for number in range(1, 101)))
+        connection.exec_driver_sql("create table text_key (k text, n integer, v text, primary key (k, n))")
+        connection.exec_driver_sql("insert into text_key values " + ", ".join(f"('k{number % 7}', {number}, 'v')" for number in range(50)))
+        connection.commit()
+        yield connection
+
+def range_row(connection: object, table: str, key_list: list[str], range_list: list[tuple], batch_size: int) -> list[tuple]:
+    row_list: list[tuple] = []
+    for lower, upper in range_list:
+        _, batch_iterator = keyset_read(connection, "main", table, key_list, lower, upper, batch_size = batch_size)
+        for batch in batch_iterator:
+            assert 0 < len(batch) <= batch_size
+            row_list.extend(batch)
+    return row_list
+
+
+@pytest.mark.parametrize("row_estimate, chunk_row_count, count", [(0, 10, 1), (-5, 10, 1), (10, 10, 1), (11, 10, 2), (10 ** 9, 1, 1024)])
+def test_chunk_count(row_estimate, chunk_row_count, count):
+    assert chunk_count(row_estimate, chunk_row_count) == count
+
+def test_key_range_integer(connection):
+    range_list = key_range(connection, "main", "number_key", "id", 4)
+    assert range_list[0][0] is None and range_list[-1][1] is None
+    assert all(upper == next_lower for (_, upper), (next_lower, _) in zip(range_list, range_list[1:]))
+    assert len(range_list) == 4
+    assert key_range(connection, "main", "number_key", "id", 1) == [(None, None)]
+
+def test_key_range_text(connection):
+    range_list = key_range(connection, "main", "text_key", "k", 3)
+    assert range_list[0][0] is None and range_list[-1][1] is None
+    assert [lower for lower, _ in range_list[1:]] == sorted(lower for lower, _ in range_list[1:])
+
+@pytest.mark.parametrize("table, key_list, count, batch_size", [("number_key", ["id"], 4, 7), ("text_key", ["k", "n"], 3, 4), ("text_key", ["k", "n"], 1, 50)])
+def test_keyset_read_cover(connection, table, key_list, count, batch_size):
+    # NOTE: the ranges and the pages read every row once, also when many rows have the same leading key value
+    range_list = key_range(connection, "main", table, key_list[0], count)
+    row_list = range_row(connection, table, key_list, range_list, batch_size)
+    _, batch_iterator = batch_read(connection, "main", table)
+    all_row = [row for batch in batch_iterator for row in batch]
+    assert sorted(row_list) == sorted(all_row)
+    assert len(set(row_list)) == len(row_list)
+
+def test_keyset_read_column(connection):
+    column_list, batch_iterator = keyset_read(connection, "main", "number_key", ["id"], 10, 12, column_list = ["v"])
+    assert column_list == ["v"]
+    assert [row for batch in batch_iterator for row in batch] == [("v11", ), ("v12", )]
+
+@pytest.mark.parametrize("dialect, script", [
+    (mysql.dialect(), "insert into s.`order` (id, `group`) values (%s, %s)"),
+    (postgresql.dialect(), 'insert into s."order" (id, "group") values (%s, %s)'),
+    (oracle.dialect(), 'insert into s."order" (id, "group") values (:1, :2)')])
+def test_insert_script(dialect, script):
+    assert insert_script(dialect_connection(dialect), "s", "order", ["id", "group"]) == script
+
+@pytest.mark.parametrize("dialect, script", [
+    (mysql.dialect(), "insert into s.t (id, v) values (%s, %s) on duplicate key update v = values(v)"),
+    (postgresql.dialect(), "insert into s.t (id, v) values (%s, %s) on conflict (id) do update set v = excluded.v"),
+    (oracle.dialect(), "merge into s.t t using (select :1 as id, :2 as v from dual) s on (t.id = s.id) when matched then update set t.v = s.v when not matched then insert (id, v) values (s.id, s.v)")])
+def test_upsert_script(dialect, script):
+    assert upsert_script(dialect_connection(dialect), "s", "t", ["id", "v"], ["id"]) == script
+
+def test_upsert_script_key_only():
+    assert upsert_script(dialect_connection(postgresql.dialect()), "s", "t", ["id"], ["id"]).endswith("on conflict (id) do nothing")
+    assert upsert_script(dialect_connection(mysql.dialect()), "s", "t", ["id"], ["id"]).endswith("on duplicate key update id = values(id)")
+
+def test_batch_upsert(connection):
+    row_count = batch_upsert(connection, "main", "number_key", ["id", "v"], ["id"], [[(1, "new"), (101, "v101")]])
+    assert row_count == 2
+    assert connection.exec_driver_sql("select v from number_key where id in (1, 101) order by id").scalars().all() == ["new", "v101"]
+
+def column_rule(row_list: list[tuple]) -> pandas.DataFrame:
+    return pandas.DataFrame(row_list, columns = ["column_name", "data_type", "default_value", "extra"])
+
+@pytest.mark.parametrize("key_list, data, watermark", [
+    (["id"], column_rule([("id", "bigint", None, "auto_increment"), ("v", "varchar", None, "")]), ("id", "key")),
+    (["id"], column_rule([("id", "int", None, "auto_increment"), ("u", "timestamp", "CURRENT_TIMESTAMP", "on update CURRENT_TIMESTAMP")]), ("u", "timestamp")),
+    (["id"], column_rule([("id", "char", "uuid()", "")]), None),
+    (["id"], column_rule([("id", "int", None, "")]), None),
+    (["id"], column_rule([("id", "varchar", None, "auto_increment")]), None),
+    (["a", "b"], column_rule([("a", "int", None, "auto_increment"), ("b", "int", None, "")]), None),
+    (["id"], None, None),
+    (["ID"], pandas.DataFrame([("ID", "NUMBER", '"S"."ISEQ$$_7".nextval')], columns = ["COLUMN_NAME", "DATA_TYPE", "DEFAULT_DATA"]), ("ID", "key")),
+    (["id"], pandas.DataFrame([("id", "integer", "nextval('t_id_seq'::regclass)")], columns = ["column_name", "data_type", "default_value"]), ("id", "key"))])
+def test_watermark_column(key_list, data, watermark):
+    assert watermark_column(key_list, data) == watermark
+
+class recording_cursor:
+    def __init__(self, **option) -> None:
+        self.option = option
+        self.execute_list: list[tuple] = []
+        self.description = [("c%d",)]
+        self.row_list: list[tuple] = [(1,), (2,), (3,)]
+
+    def execute(self, *argument) -> None:
+        self.execute_list.append(argument)
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        batch, self.row_list = self.row_list[:size], self.row_list[size:]
+        return batch
+
+    def close(self) -> None:
+        pass
+
+@pytest.mark.parametrize("parameter, execute", [
+    ({}, ("SELECT `a%b`.`c%d` \nFROM `a%b`",)),
+    ({"v": "x%"}, ("SELECT `a%%b`.`c%%d` \nFROM `a%%b` \nWHERE `a%%b`.`c%%d` = %s", ["x%"])),
+])
+def test_stream_read_unbuffered_percent(parameter, execute):
+    from sqlalchemy import column, select, table
+    dialect = mysql.dialect(paramstyle = "format")
+    dialect.driver = "mysqlconnector"
+    dialect.supports_server_side_cursors = False
+    cursor = recording_cursor()
+    connection = SimpleNamespace(dialect = dialect, connection = SimpleNamespace(cursor = lambda **option: cursor))
+    source = table("a%b", column("c%d"))
+    statement = select(source) if len(parameter) == 0 else select(source).where(source.c["c%d"] == parameter["v"])
+    column_list, batch_iterator = stream_read(connection, statement, batch_size = 2)
+    # NOTE: without parameter the driver does not turn %% into %, so the script must have a single %
+    assert cursor.execute_list == [execute]
+    assert column_list == ["c%d"]
+    assert [row for batch in batch_iterator for row in batch] == [(1,), (2,), (3,)]
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql, oracle, postgresql
+
+from module.data_verify import checksum_family, checksum_script, lob_column, range_checksum
+
+
+def dialect_connection(dialect: object) -> SimpleNamespace:
+    return SimpleNamespace(dialect = dialect)
+
+
+@pytest.mark.parametrize("dialect, family", [(mysql.dialect(), "mysql"), (postgresql.dialect(), "postgresql"), (oracle.dialect(), "oracle")])
+def test_checksum_family(dialect, family):
+    assert checksum_family(dialect_connection(dialect)) == family
+
+def test_mysql_script():
+    script = checksum_script(dialect_connection(mysql.dialect()), "s", "t", ["id", "name"], ["id"], 1, 5)
+    assert "sum(cast(conv(substr(md5(concat(coalesce(concat(char_length(id), ':', id), 'N'), coalesce(concat(char_length(name), ':', name), 'N'))), 1, 16), 16, 10) as unsigned))" in script
+    assert "bit_xor" not in script
+    assert script.endswith("from s.t where id > :lower and id <= :upper")
+
+def test_oracle_script():
+    script = checksum_script(dialect_connection(oracle.dialect()), "s", "t", ["id", "doc"], ["id"], lob_list = ["doc"])
+    # NOTE: every column is hashed alone with its position as seed, so there is no long concatenation
+    assert "case when id is null then 4294967296 else ora_hash(id, 4294967295, 1) end" in script
+    assert "case when doc is null then 4294967296 else ora_hash(rawtohex(dbms_crypto.hash(doc, 2)), 4294967295, 2) end" in script
+    assert "||" not in script
+    assert script.endswith("from s.t")
+
+def test_postgresql_script():
+    script = checksum_script(dialect_connection(postgresql.dialect()), "s", "t", ["id", "name"], ["id"], upper = 5)
+    assert "md5(string_agg(md5(row(id, name)::text), '' order by id))" in script
+    assert script.endswith("where id <= :upper")
+
+def test_other_family():
+    with create_engine("sqlite://").connect() as connection:
+        connection.exec_driver_sql("create table t (id integer primary key, v text)")
+        connection.exec_driver_sql("insert into t values (1, 'a'), (2, 'b'), (3, 'c')")
+        assert lob_column(connection, "main", "t") == []
+        assert range_checksum(connection, "main", "t", ["id", "v"], ["id"], 1, None) == (2, None)
+        assert range_checksum(connection, "main", "t", ["id", "v"], []) == (3, None)
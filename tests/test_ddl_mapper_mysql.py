@@ -0,0 +1,14 @@
+import pandas
+import pytest
+
+from module.ddl_mapper.mysql import mysql
+
+
+def test_mysql_empty_column_rule():
+    index = pandas.DataFrame([{"table_name": "t", "index_name": "i"}])
+    empty = pandas.DataFrame()
+    with pytest.raises(Exception, match = "table t"):
+        mysql([], [], [], [], [], index)
+    # NOTE: the given table name is used when there is no metadata at all
+    with pytest.raises(Exception, match = "table u"):
+        mysql(empty, empty, empty, empty, empty, empty, table_name = "u")
@@ -0,0 +1,40 @@
+import os
+from types import SimpleNamespace
+
+import pandas
+from sqlalchemy.engine import make_url
+
+from module.metadata_cache import snapshot_file, snapshot_load, snapshot_save
+
+
+def url_connection(url: str) -> SimpleNamespace:
+    return SimpleNamespace(engine = SimpleNamespace(url = make_url(url)))
+
+
+def test_snapshot_file(tmp_path):
+    connection = url_connection("mysql+mysqlconnector://u:p@host:3306/db")
+    file_path = snapshot_file(connection, "s", "8.0.36", cache_path = str(tmp_path))
+    assert file_path == snapshot_file(url_connection("mysql+mysqlconnector://other:p@host:3306/db"), "s", "8.0.36", cache_path = str(tmp_path))
+    assert file_path != snapshot_file(connection, "s", "8.4.0", cache_path = str(tmp_path))
+    assert file_path != snapshot_file(connection, "other", "8.0.36", cache_path = str(tmp_path))
+    oracle_path = snapshot_file(url_connection("oracle+oracledb://u:p@host:1521/?service_name=a"), "s", "19", cache_path = str(tmp_path))
+    assert oracle_path != snapshot_file(url_connection("oracle+oracledb://u:p@host:1521/?service_name=b"), "s", "19", cache_path = str(tmp_path))
+
+def test_snapshot_round_trip(tmp_path):
+    file_path = str(tmp_path / "cache" / "snapshot.pickle")
+    metadata_dict = {"all_table": pandas.DataFrame({"table_name": ["a", "b"]})}
+    assert snapshot_load(file_path, "f1") == {}
+    snapshot_save(file_path, "f1", metadata_dict)
+    assert os.listdir(os.path.dirname(file_path)) == ["snapshot.pickle"]
+    loaded = snapshot_load(file_path, "f1")
+    assert list(loaded) == ["all_table"]
+    assert loaded["all_table"].equals(metadata_dict["all_table"])
+    # NOTE: a snapshot of another fingerprint is out of date
+    assert snapshot_load(file_path, "f2") == {}
+
+def test_snapshot_broken(tmp_path):
+    file_path = tmp_path / "snapshot.pickle"
+    file_path.write_bytes(b"not a pickle")
+    assert snapshot_load(str(file_path), "f1") == {}
+    file_path.write_bytes(b"")
+    assert snapshot_load(str(file_path), "f1") == {}
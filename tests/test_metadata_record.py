@@ -0,0 +1,53 @@
+import pickle
+
+import pytest
+from sqlalchemy import create_engine
+
+from module.metadata_record import column_record, key_record, record_frame, record_group, record_list, relation_record
+
+
+def test_record_access():
+    row = key_record("t", "id", "PRIMARY")
+    assert row["column_name"] == "id"
+    assert row.column_name == "id"
+    assert row.get("missing", 1) == 1
+    assert row.keys() == ("table_name", "column_name", "constraint_name")
+    assert row.values() == ("t", "id", "PRIMARY")
+    with pytest.raises(KeyError):
+        row["missing"]
+    assert repr(row) == "key_record(table_name = 't', column_name = 'id', constraint_name = 'PRIMARY')"
+
+def test_record_equal():
+    assert key_record("t", "id", "PRIMARY") == key_record("t", "id", "PRIMARY")
+    assert key_record("t", "id", "PRIMARY") != key_record("t", "id", "other")
+    # NOTE: records of other classes are never equal, even with the same values
+    assert relation_record("t", "p", "a", "b", "fk", None, None) != relation_record("t", "p", "a", "b", "fk", None, None).values()
+
+def test_record_pickle():
+    row = column_record(*range(len(column_record.__slots__)))
+    loaded = pickle.loads(pickle.dumps(row, protocol = pickle.HIGHEST_PROTOCOL))
+    assert type(loaded) is column_record
+    assert loaded == row
+    assert pickle.loads(pickle.dumps([key_record("t", None, "u")])) == [key_record("t", None, "u")]
+
+@pytest.mark.parametrize("script", [
+    "select 't' as table_name, 'id' as column_name, 'PRIMARY' as constraint_name",
+    "select 'PRIMARY' as CONSTRAINT_NAME, 'extra' as other, 'id' as column_name, 't' as Table_Name"])
+def test_record_list(script):
+    with create_engine("sqlite://").connect() as connection:
+        data = record_list(connection.exec_driver_sql(script), key_record)
+    assert data == [key_record("t", "id", "PRIMARY")]
+
+def test_record_list_missing_column():
+    with create_engine("sqlite://").connect() as connection:
+        with pytest.raises(ValueError, match = "constraint_name"):
+            record_list(connection.exec_driver_sql("select 't' as table_name, 'id' as column_name"), key_record)
+
+def test_record_group_and_frame():
+    data = [key_record("b", "x", "u1"), key_record("a", "y", "u2"), key_record("b", "z", "u1")]
+    assert record_group(data) == {"b": [data[0], data[2]], "a": [data[1]]}
+    frame = record_frame(data, key_record)
+    assert list(frame.columns) == ["table_name", "column_name", "constraint_name"]
+    assert frame.values.tolist() == [list(row.values()) for row in data]
+    assert list(record_frame([], key_record).columns) == list(key_record.__slots__)
+    assert record_group(frame.to_dict("records"))["a"] == [{"table_name": "a", "column_name": "y", "constraint_name": "u2"}]
@@ -0,0 +1,93 @@
+import pandas
+import pytest
+
+import module.ddl_mapper.mysql as ddl_mapper
+from module.data_type_mapper import mapper_table
+from module.metadata_record import column_record, index_record, key_record, relation_record
+from module.schema_diff import diff_metadata_list, fingerprint_dict, index_column, table_diff, table_fingerprint
+
+
+def column(table: str, name: str, position: int, data_type: str = "int", is_nullable: str = "NOT NULL") -> tuple:
+    return (table, name, position, is_nullable, "", "NULL", data_type, None, None, None, None, "signed", 10, 0, None, "", "")
+
+def table_metadata(column_list: list[tuple], key_list: list[str] = None, unique_list: list[tuple] = None, relation_list: list[tuple] = None, index_list: list[tuple] = None) -> dict[str, pandas.DataFrame]:
+    return {
+        "column_rule": pandas.DataFrame(column_list, columns = list(column_record.__slots__)),
+        "primary_key": pandas.DataFrame([("t", name, "PRIMARY") for name in key_list or []], columns = list(key_record.__slots__)),
+        "unique_constraint": pandas.DataFrame(unique_list or [], columns = list(key_record.__slots__)),
+        "relation": pandas.DataFrame(relation_list or [], columns = list(relation_record.__slots__)),
+        "check_constraint": pandas.DataFrame([], columns = ["table_name", "constraint_name", "constraint_expression"]),
+        "all_index": pandas.DataFrame(index_list or [], columns = list(index_record.__slots__))}
+
+def diff(source: dict, target: dict) -> tuple[list[str], list[str], list[str]]:
+    return table_diff("t", source, target, ddl_mapper, mapper_table("mysql", "mysql"), "mysql")
+
+base_column = [column("t", "id", 1), column("t", "a", 2), column("t", "b", 3)]
+
+
+def test_same_table():
+    source = table_metadata(base_column, ["id"], [("t", "a", "u_ab"), ("t", "b", "u_ab")])
+    target = table_metadata(list(reversed(base_column)), ["id"], [("t", "a", "u_ab"), ("t", "b", "u_ab")])
+    assert diff(source, target) == ([], [], [])
+    # NOTE: the fingerprint does not depend on the row order
+    assert table_fingerprint(source) == table_fingerprint(target)
+
+def test_column_change():
+    source = table_metadata(base_column + [column("t", "c", 4)], ["id"])
+    target = table_metadata([column("t", "id", 1), column("t", "a", 2, "bigint")], ["id"])
+    drop_list, alter_list, create_list = diff(source, target)
+    assert drop_list == [] and create_list == []
+    assert alter_list[0].startswith("alter table `t` modify column `a` int signed") and alter_list[0].endswith("after `id`;")
+    assert alter_list[1].startswith("alter table `t` add column `b` int") and alter_list[1].endswith("after `a`;")
+    assert alter_list[2].startswith("alter table `t` add column `c` int") and alter_list[2].endswith("after `b`;")
+    assert len(alter_list) == 3
+
+def test_column_drop_and_move():
+    source = table_metadata([column("t", "id", 1), column("t", "b", 2), column("t", "a", 3)], ["id"])
+    target = table_metadata(base_column + [column("t", "old", 4)], ["id"])
+    _, alter_list, _ = diff(source, target)
+    assert alter_list[0] == "alter table `t` drop column `old`;"
+    assert any(statement.startswith("alter table `t` modify column `b`") and statement.endswith("after `id`;") for statement in alter_list)
+
+def test_unique_column_order():
+    source = table_metadata(base_column, ["id"], [("t", "b", "u_ab"), ("t", "a", "u_ab")])
+    target = table_metadata(base_column, ["id"], [("t", "a", "u_ab"), ("t", "b", "u_ab")])
+    _, alter_list, _ = diff(source, target)
+    assert alter_list == ["alter table `t` drop index `u_ab`;", "alter table `t` add constraint `u_ab` unique (`b`, `a`);"]
+
+def test_primary_key_change():
+    source = table_metadata(base_column, ["id", "a"])
+    target = table_metadata(base_column, ["id"])
+    _, alter_list, _ = diff(source, target)
+    assert alter_list == ["alter table `t` drop primary key;", "alter table `t` add primary key (`id`, `a`);"]
+
+def test_relation_change():
+    source = table_metadata(base_column, ["id"], relation_list = [("t", "p", "a", "id", "fk_a", "CASCADE", "RESTRICT")])
+    target = table_metadata(base_column, ["id"], relation_list = [("t", "p", "a", "id", "fk_a", "RESTRICT", "RESTRICT"), ("t", "q", "b", "id", "fk_old", "RESTRICT", "RESTRICT")])
+    drop_list, alter_list, create_list = diff(source, target)
+    assert drop_list == ["alter table `t` drop foreign key `fk_a`;", "alter table `t` drop foreign key `fk_old`;"]
+    assert alter_list == []
+    assert create_list == ["alter table `t` add constraint `fk_a` foreign key (`a`) references `p` (`id`) on update CASCADE on delete RESTRICT;"]
+
+def test_index_change():
+    source = table_metadata(base_column, ["id"], index_list = [("t", "i_ab", "BTREE", "A", "", "1", "", 1, "a"), ("t", "i_ab", "BTREE", "D", "", "1", "", 1, "b(10)")])
+    target = table_metadata(base_column, ["id"])
+    _, alter_list, _ = diff(source, target)
+    assert alter_list == ["alter table `t` add index `i_ab` (`a`, `b`(10) desc);"]
+
+@pytest.mark.parametrize("row_list, text", [
+    ([{"column_expression": "a", "collation": "A"}], "`a`"),
+    ([{"column_expression": "a(8)", "collation": "D"}], "`a`(8) desc"),
+    ([{"column_expression": "lower(a)", "collation": "A"}, {"column_expression": "b", "collation": None}], "(lower(a)), `b`")])
+def test_index_column(row_list, text):
+    assert index_column(row_list) == text
+
+def test_fingerprint_dict():
+    table_list = [("t", [column("t", "id", 1)]), ("u", [column("u", "id", 1), column("u", "v", 2, "varchar")])]
+    metadata_dict = {metadata_name: pandas.concat([table_metadata(column_list)[metadata_name].assign(table_name = table) for table, column_list in table_list]) for metadata_name in diff_metadata_list}
+    metadata_dict["all_table"] = pandas.DataFrame({"table_name": ["t", "u", "empty"]})
+    data = fingerprint_dict(metadata_dict)
+    assert data["t"] == table_fingerprint(table_metadata(table_list[0][1]))
+    assert data["u"] == table_fingerprint(table_metadata(table_list[1][1]))
+    assert data["t"] != data["u"]
+    assert data["empty"] == table_fingerprint({})
@@ -0,0 +1,66 @@
+import pytest
+
+from module.table_filter import pattern_check, pattern_like, table_filter, table_match
+
+
+@pytest.mark.parametrize("pattern, like_pattern", [
+    ("sales_*", "sales!_%"),
+    ("log?", "log_"),
+    ("100%_done*", "100!%!_done%"),
+    ("a!b*", "a!!b%"),
+    ("!_%?*", "!!!_!%_%")])
+def test_pattern_like(pattern, like_pattern):
+    assert pattern_like(pattern) == like_pattern
+
+def test_pattern_check():
+    assert pattern_check("sales_*")
+    assert pattern_check("log?")
+    assert not pattern_check("sales_2024")
+    assert not pattern_check("100%")
+
+@pytest.mark.parametrize("table, include, exclude, result", [
+    ("sales_2024", None, None, True),
+    ("sales_2024", ["sales_*"], None, True),
+    ("salesx2024", ["sales_*"], None, False),
+    ("sales_2024", ["sales_2024"], None, True),
+    ("sales_2024", ["sales%"], None, False),
+    ("sales%", ["sales%"], None, True),
+    ("a!b", ["a!?"], None, True),
+    ("a!b", ["a!*"], ["*b"], False),
+    ("log1", ["log?"], None, True),
+    ("log10", ["log?"], None, False),
+    ("sales_2024", None, ["*_2024"], False),
+    ("sales_2024", [], None, False),
+    ("Sales_2024", ["sales_*"], None, False),
+    ("SALES", ["SALES"], None, True),
+    ("sales", ["SALES"], None, False),
+    ("log[1]", ["log[1]*"], None, True),
+    ("log1", ["log[1]*"], None, False),
+    ("a[b", ["a[*"], None, True)])
+def test_table_match(table, include, exclude, result):
+    assert table_match(table, include, exclude) is result
+
+def test_table_filter_empty():
+    assert table_filter("c.table_name") == ("", [])
+    assert table_filter("c.table_name", exclude = []) == ("", [])
+
+@pytest.mark.parametrize("product", ["mysql", "mariadb"])
+def test_table_filter_binary(product):
+    filter_script, bind_list = table_filter("c.table_name", ["sales_*", "log"], ["tmp"], product)
+    assert "cast(c.table_name as binary) in :include_table" in filter_script
+    assert "cast(c.table_name as binary) like :include_pattern_0 escape '!'" in filter_script
+    assert "not (cast(c.table_name as binary) in :exclude_table)" in filter_script
+    assert [bind.value for bind in bind_list] == [["log"], "sales!_%", ["tmp"]]
+
+def test_table_filter_like_match():
+    from sqlalchemy import create_engine, text
+    table_list = ["sales_2024", "salesx2024", "sales%", "a!b", "log1", "log10", "Sales_2024", "log[1]"]
+    include, exclude = ["sales_*", "sales%", "a!?", "log?", "log[*"], ["*x*"]
+    filter_script, bind_list = table_filter("table_name", include, exclude, "sqlite")
+    with create_engine("sqlite://").connect() as connection:
+        # NOTE: sqlite LIKE is not case sensitive by default
+        connection.exec_driver_sql("pragma case_sensitive_like = on")
+        connection.execute(text("create table catalog (table_name text)"))
+        connection.execute(text("insert into catalog values (:table_name)"), [{"table_name": table} for table in table_list])
+        result = connection.execute(text(f"select table_name from catalog where 1 = 1 {filter_script}").bindparams(*bind_list)).scalars().all()
+    assert sorted(result) == sorted(table for table in table_list if table_match(table, include, exclude))
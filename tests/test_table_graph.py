@@ -0,0 +1,69 @@
+import pandas
+
+from module.table_graph import component_graph, relation_graph, strongly_connected_component, topological_level
+from module.toolbox import level_measure
+
+
+def graph_build(table_list: list[str], edge_list: list[tuple[str, str]]) -> tuple:
+    all_table = pandas.DataFrame({"table_name": table_list})
+    relation = pandas.DataFrame(edge_list, columns = ["table_name", "parent_table_name"])
+    return relation_graph(all_table, relation)
+
+def component_set(component_list: list[list[str]]) -> set[frozenset[str]]:
+    return {frozenset(component) for component in component_list}
+
+
+def test_self_reference():
+    node_list, parent_dict, child_dict, self_reference = graph_build(["a", "b"], [("a", "a"), ("b", "a")])
+    assert self_reference == {"a"}
+    assert parent_dict == {"a": set(), "b": {"a"}}
+    depth_dict, unresolved = topological_level(node_list, parent_dict, child_dict)
+    assert depth_dict == {"a": 0, "b": 1}
+    assert unresolved == []
+    assert component_set(strongly_connected_component(node_list, child_dict)) == {frozenset({"a"}), frozenset({"b"})}
+
+def test_two_table_cycle():
+    node_list, parent_dict, child_dict, _ = graph_build(["a", "b"], [("a", "b"), ("b", "a")])
+    depth_dict, unresolved = topological_level(node_list, parent_dict, child_dict)
+    assert depth_dict == {}
+    assert sorted(unresolved) == ["a", "b"]
+    component_list = strongly_connected_component(node_list, child_dict)
+    assert component_set(component_list) == {frozenset({"a", "b"})}
+    component_dict, component_node_list, component_parent_dict, component_child_dict = component_graph(component_list, parent_dict)
+    assert component_dict["a"] == component_dict["b"]
+    assert component_node_list == [0]
+    assert component_parent_dict == {0: set()}
+    assert component_child_dict == {0: set()}
+
+def test_cycle_with_child_chain():
+    # NOTE: a <-> b is a cycle, c is a child of b and d is a child of c
+    node_list, parent_dict, child_dict, _ = graph_build(["a", "b", "c", "d"], [("a", "b"), ("b", "a"), ("c", "b"), ("d", "c")])
+    _, unresolved = topological_level(node_list, parent_dict, child_dict)
+    assert sorted(unresolved) == ["a", "b", "c", "d"]
+    component_list = strongly_connected_component(node_list, child_dict)
+    assert component_set(component_list) == {frozenset({"a", "b"}), frozenset({"c"}), frozenset({"d"})}
+    component_dict, component_node_list, component_parent_dict, component_child_dict = component_graph(component_list, parent_dict)
+    cycle, c, d = component_dict["a"], component_dict["c"], component_dict["d"]
+    assert component_parent_dict[cycle] == set()
+    assert component_parent_dict[c] == {cycle}
+    assert component_parent_dict[d] == {c}
+    assert component_child_dict[cycle] == {c}
+    depth_dict, unresolved = topological_level(component_node_list, component_parent_dict, component_child_dict)
+    assert unresolved == []
+    assert (depth_dict[cycle], depth_dict[c], depth_dict[d]) == (0, 1, 2)
+
+def test_parent_outside_schema():
+    node_list, parent_dict, _, self_reference = graph_build(["a"], [("a", "other")])
+    assert node_list == ["a"]
+    assert parent_dict == {"a": set()}
+    assert self_reference == set()
+
+def test_level_measure():
+    all_table = pandas.DataFrame({"table_name": ["a", "b", "c", "d", "s", "x"]})
+    relation = pandas.DataFrame({"table_name": ["b", "a", "c", "d", "s"], "parent_table_name": ["a", "b", "b", "c", "s"]})
+    level = level_measure(all_table, relation)
+    level_dict = dict(zip(level["table_name"], level["level"]))
+    assert level_dict == {"x": 1, "s": 2, "a": 3, "b": 3, "c": 4, "d": 5}
+    cycle_dict = dict(zip(level["table_name"], level["cycle_id"]))
+    assert cycle_dict["a"] == cycle_dict["b"]
+    assert pandas.isna(cycle_dict["c"]) and pandas.isna(cycle_dict["s"])
@@ -0,0 +1,66 @@
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy.engine import make_url
+
+from module.transfer_journal import journal, journal_file
+
+
+def url_connection(url: str) -> SimpleNamespace:
+    return SimpleNamespace(engine = SimpleNamespace(url = make_url(url)))
+
+
+def test_journal_file(tmp_path):
+    source = url_connection("mysql+mysqlconnector://u:p@source:3306/db")
+    target = url_connection("postgresql://u:p@target:5432/db")
+    file_path = journal_file(source, "s", target, "t", journal_path = str(tmp_path))
+    assert file_path == journal_file(source, "s", target, "t", journal_path = str(tmp_path))
+    assert file_path != journal_file(source, "s", target, "other", journal_path = str(tmp_path))
+    assert file_path != journal_file(target, "t", source, "s", journal_path = str(tmp_path))
+    assert file_path.endswith(".sqlite")
+
+def test_range_resume(tmp_path):
+    file_path = str(tmp_path / "journal.sqlite")
+    range_list = [(None, "b"), ("b", Decimal("1.5")), (Decimal("1.5"), None)]
+    transfer_journal = journal(file_path, flush_count = 2, flush_interval = 3600)
+    assert transfer_journal.range_get("t") is None
+    transfer_journal.range_set("t", range_list)
+    transfer_journal.chunk_mark("t", 0, 10)
+    # NOTE: a mark that is not flushed yet is still seen by the same journal
+    assert transfer_journal.chunk_done("t") == {0}
+    transfer_journal.chunk_mark("t", 2, 5)
+    transfer_journal.chunk_mark("other", 0, 1)
+    transfer_journal.close()
+    transfer_journal = journal(file_path)
+    assert transfer_journal.range_get("t") == range_list
+    assert transfer_journal.chunk_done("t") == {0, 2}
+    transfer_journal.chunk_clear()
+    assert transfer_journal.range_get("t") is None
+    assert transfer_journal.chunk_done("t") == set()
+    transfer_journal.close()
+
+def test_unflushed_mark_is_lost(tmp_path):
+    file_path = str(tmp_path / "journal.sqlite")
+    transfer_journal = journal(file_path, flush_count = 100, flush_interval = 3600)
+    transfer_journal.range_set("t", [(None, None)])
+    transfer_journal.chunk_mark("t", 0, 10)
+    # NOTE: the journal is not closed, like a killed process. The range is only copied again
+    transfer_journal.database.close()
+    transfer_journal = journal(file_path)
+    assert transfer_journal.range_get("t") == [(None, None)]
+    assert transfer_journal.chunk_done("t") == set()
+    transfer_journal.close()
+
+def test_watermark(tmp_path):
+    file_path = str(tmp_path / "journal.sqlite")
+    transfer_journal = journal(file_path)
+    assert transfer_journal.watermark_get("t") is None
+    transfer_journal.watermark_set("t", "updated_at", datetime(2024, 1, 2, 3, 4, 5))
+    transfer_journal.watermark_set("t", "updated_at", datetime(2024, 1, 3))
+    transfer_journal.close()
+    transfer_journal = journal(file_path)
+    assert transfer_journal.watermark_get("t") == ("updated_at", datetime(2024, 1, 3))
+    transfer_journal.chunk_clear()
+    assert transfer_journal.watermark_get("t") == ("updated_at", datetime(2024, 1, 3))
+    transfer_journal.close()